@@ -11,25 +11,31 @@
 
 # general imports
 import os
+import sqlite3
 import logging
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Tuple
+from typing import Tuple, TYPE_CHECKING
 import owlready2
 # causalgraph imports
 from causalgraph.store.add import Add
 from causalgraph.store.edit import Edit
-from causalgraph.utils.draw import Draw
 from causalgraph.store.remove import Remove
+from causalgraph.store.query import Query
 from causalgraph.utils.mapping import Mapping
 import causalgraph.utils.owlready2_utils as owlutils
+import causalgraph.utils.onto_cache as onto_cache
 from causalgraph.utils.logging_utils import init_logger
 from causalgraph.utils.misc_utils import get_project_root
 CAUSALGRAPH_ONTO_PATH: Path = Path.joinpath(get_project_root(), "data", 'causalgraph.owl')
 
-from causalgraph.store.load import Load
-from causalgraph.store.export import Export
 from typing import Union
-import networkx
+# Draw, Export and Load (matplotlib, networkx, numpy) are imported on first use
+if TYPE_CHECKING:
+    import networkx
+    from causalgraph.utils.draw import Draw
+    from causalgraph.store.load import Load
+    from causalgraph.store.export import Export
 
 class Graph():
     """ Graph with causal information embedded in knowledge graph.
@@ -41,9 +47,17 @@ class Graph():
                 log_file_handler: bool = False,
                 log_file_dir: str = None,
                 log_file_level: int = logging.DEBUG,
+                log_file_queue: bool = False,
+                log_file_max_bytes: int = 0,
+                log_dedup_interval_s: float = None,
                 external_ontos: list[str] = None,
-                external_graph: Union[networkx.MultiDiGraph, tuple] = None,
-                validate_domain_range: bool = False
+                external_graph: Union['networkx.MultiDiGraph', tuple] = None,
+                validate_domain_range: bool = False,
+                enforce_dag: bool = False,
+                exempt_time_lagged_edges: bool = False,
+                use_onto_template: bool = True,
+                use_onto_cache: bool = True,
+                offline: bool = False
     ) -> None:
         """Instantiates a Graph as the central object of causalgraph.
 
@@ -59,17 +73,38 @@ class Graph():
         :type log_file_dir: str, optional
         :param log_file_level: Verbosity level of logger for file handler (needs log_file_handler =True), defaults to logging.DEBUG
         :type log_file_level: int, optional
+        :param log_file_queue: If True, the log-file is formatted and written on a separate thread (needs log_file_handler =True), defaults to False
+        :type log_file_queue: bool, optional
+        :param log_file_max_bytes: Size in bytes at which the log-file is rotated, 0 for no rotation (needs log_file_handler =True), defaults to 0
+        :type log_file_max_bytes: int, optional
+        :param log_dedup_interval_s: If set, repeated log messages are suppressed and summarized at most once per interval in seconds, defaults to None
+        :type log_dedup_interval_s: float, optional
         :param external_ontos: List of local Paths to file or URL to ontology in web.
         :type external_ontos: list[str], optional
         :param external_graph: NetworkX.MultiDiGraph or Tigramite Graph representation.
         :type external_graph: Union[networkx.MultiDiGraph, Tuple(list, dict, ndarray, ndarray, int)], optional
         :param validate_domain_range: If True, all properties will be evaluated with domain and range before creating new individuals, defaults to False
         :type validate_domain_range: bool, optional
+        :param enforce_dag: If True, CausalEdges closing a cycle are rejected by 'add' and 'edit' (checked with an incremental topological order), defaults to False
+        :type enforce_dag: bool, optional
+        :param exempt_time_lagged_edges: If True, CausalEdges with hasTimeLag > 0 are exempt from 'enforce_dag'. Changing or deleting the hasTimeLag via 'edit' (or 'map.update_graph_from_dict') checks the edge again, changes made directly on the owlready2 entities are not checked, defaults to False
+        :type exempt_time_lagged_edges: bool, optional
+        :param use_onto_template: If True, new stores are initialized from a pre-built template of the core ontology instead of parsing it, defaults to True
+        :type use_onto_template: bool, optional
+        :param use_onto_cache: If True, imported ontologies are parsed once into a local on-disk cache and copied from there, defaults to True
+        :type use_onto_cache: bool, optional
+        :param offline: If True, ontologies at URLs are only imported from the local cache, defaults to False
+        :type offline: bool, optional
         """
         # Store attributes if necessary
         self.sql_db_filename = sql_db_filename
         self.core_onto_path = CAUSALGRAPH_ONTO_PATH.absolute()
         self.validate_domain_range = validate_domain_range
+        self.enforce_dag = enforce_dag
+        self.exempt_time_lagged_edges = exempt_time_lagged_edges
+        self.use_onto_template = use_onto_template
+        self.use_onto_cache = use_onto_cache
+        self.offline = offline
         # Check if necessary onto_file is present:
         if self.core_onto_path.is_file() is False:
             raise FileNotFoundError("The necessary base ontology 'causalgraph' was not found at " +
@@ -80,17 +115,23 @@ class Graph():
                                   console_handler_level=logger_level,
                                   file_handler_level=log_file_level,
                                   elastic_style_json=True,
-                                  log_file_dir=log_file_dir)
+                                  log_file_dir=log_file_dir,
+                                  queue_handler=log_file_queue,
+                                  max_bytes=log_file_max_bytes,
+                                  dedup_interval_s=log_dedup_interval_s)
         self.store = self._init_store_backend_sqldb(self.sql_db_filename, sql_exclusive)
         self.individuals_onto, self.classes_onto = self._init_namespaces(self.core_onto_path, self.store)
         # Include functionalities wrapped in singleton objects
-        self.add = Add(store=self.store, logger=self.logger, validate_domain_range=self.validate_domain_range)
-        self.edit = Edit(store=self.store, logger=self.logger, validate_domain_range=self.validate_domain_range)
+        self.add = Add(store=self.store, logger=self.logger, validate_domain_range=self.validate_domain_range,
+                       enforce_dag=self.enforce_dag, exempt_time_lagged_edges=self.exempt_time_lagged_edges)
+        self.edit = Edit(store=self.store, logger=self.logger, validate_domain_range=self.validate_domain_range,
+                         enforce_dag=self.enforce_dag, exempt_time_lagged_edges=self.exempt_time_lagged_edges)
         self.remove = Remove(store=self.store, logger=self.logger)
+        self.query = Query(store=self.store, logger=self.logger)
         self.map = Mapping(graph=self, logger=self.logger)
-        self.export = Export(graph=self, logger=self.logger)
-        self.load = Load(graph=self, logger=self.logger)
-        self.draw = Draw(graph=self)
+        self._export = None
+        self._load = None
+        self._draw = None
         # Check if there are third party ontos to be loaded directly at start
         if external_ontos is not None:
             for onto_path in external_ontos:
@@ -100,8 +141,36 @@ class Graph():
             self._init_external_graph(external_graph)
         self.logger.debug("Initialized the Causal Knowledge Graph.")
 
+
+    @property
+    def export(self) -> 'Export':
+        """Export functionalities (networkx, graphml, gml, tigramite), imported on first use."""
+        if self._export is None:
+            from causalgraph.store.export import Export
+            self._export = Export(graph=self, logger=self.logger)
+        return self._export
+
+
+    @property
+    def load(self) -> 'Load':
+        """Load functionalities (networkx, tigramite), imported on first use."""
+        if self._load is None:
+            from causalgraph.store.load import Load
+            self._load = Load(graph=self, logger=self.logger)
+        return self._load
+
+
+    @property
+    def draw(self) -> 'Draw':
+        """Draw functionalities (matplotlib, pyvis), imported on first use."""
+        if self._draw is None:
+            from causalgraph.utils.draw import Draw
+            self._draw = Draw(graph=self)
+        return self._draw
+
         
-    def _init_external_graph(self, external_graph: Union[networkx.MultiDiGraph, tuple]):
+    def _init_external_graph(self, external_graph: Union['networkx.MultiDiGraph', tuple]):
+        import networkx
         if type(external_graph) is networkx.MultiDiGraph:
             graph_dict = self.map.graph_dict_from_nx(external_graph)
             _ = self.map.fill_empty_graph_from_dict(graph_dict)
@@ -146,15 +215,16 @@ class Graph():
         :rtype: owlready2.World
         """
         store = owlready2.World()
+        store.open_transactions = 0
         if sql_db_path is None:
-            self.logger.info(f"Using in memory ontology store. Graph will not be saved after stopping the program.")
+            self.logger.info("Using in memory ontology store. Graph will not be saved after stopping the program.")
             return store
         elif Path(sql_db_path).is_file():
             store.set_backend(filename=sql_db_path, exclusive=sql_exclusive)
             self.logger.warning(f"Using existing ontology store at {Path(sql_db_path).absolute()}")
         else:
             store.set_backend(filename=sql_db_path, exclusive=sql_exclusive)
-            self.logger.info(f"Created empty ontology storage at {Path(sql_db_path).absolute()}")
+            self.logger.info("Created empty ontology storage at %s", Path(sql_db_path).absolute())
         return store
 
 
@@ -174,8 +244,15 @@ class Graph():
         :return: (individuals_onto: owlready2.Ontology, classes_onto: owlready2.Ontology)
         :rtype: Tuple[owlready2.Ontology, owlready2.Ontology]
         """
-        # Load classes_onto from the core_onto_path
-        store.classes_onto = self.import_ontology(core_onto_path)
+        # Load classes_onto from the pre-built template (new stores only) or the core_onto_path
+        store.classes_onto = None
+        if self.use_onto_template is True:
+            try:
+                store.classes_onto = owlutils.load_onto_template(core_onto_path, store, logger=self.logger)
+            except (OSError, sqlite3.Error, owlready2.OwlReadyOntologyParsingError) as error:
+                self.logger.warning(f"Could not use template of ontology '{core_onto_path}', parsing it instead: {error}")
+        if store.classes_onto is None:
+            store.classes_onto = self.import_ontology(core_onto_path)
         if store.classes_onto is None:
             raise LookupError("Could not load necessary ontology at '{core_onto_path}'.")
         # Attaches classes and individuals_onto to store and return
@@ -194,8 +271,13 @@ class Graph():
         :rtype: owlready2.Ontology
         """
         num_ontos_before_load = len(self.store.ontologies)
-        # Check if 'onto_file_path' exists as file  and load ontology
-        if Path(onto_file_path).is_file():
+        # Try to copy the ontology from the local cache, else check if 'onto_file_path' exists as file and load ontology.
+        # The core ontology is not cached, it is either loaded from its template or parsed.
+        use_onto_cache = self.use_onto_cache and Path(onto_file_path) != Path(self.core_onto_path)
+        onto = self._import_ontology_from_cache(onto_file_path) if use_onto_cache else None
+        if onto is not None:
+            success_log_text = f"Loaded Ontology '{onto.base_iri}' from local cache. Source: '{onto_file_path}'"
+        elif Path(onto_file_path).is_file():
             try:
                 onto = self.store.get_ontology(f"file://{onto_file_path}").load()
                 success_log_text = f"Loaded Ontology '{onto.base_iri}' from file system. Path: '{onto_file_path}'"
@@ -204,6 +286,10 @@ class Graph():
                                        "Ontology could not be parsed. File needs to be in " +
                                        "owl/xml format. NO .ttl files allowed.")
                 return None
+        elif self.offline is True:
+            self.logger.error(f"Couldn't add Ontology by URL {onto_file_path}. Ontology is not in the " +
+                              "local cache and URLs are not fetched in offline mode. Returning none")
+            return None
         # Try to load from URL -> should raise default error?
         else:
             try:
@@ -220,6 +306,8 @@ class Graph():
                                 f"{onto_file_path}. Ontology already existed.")
         else:
             self.logger.info(success_log_text)
+        # New classes, properties and individuals were loaded: rebuild name index and class closure
+        owlutils.init_store_caches(self.store)
         try:
             self.map.update_third_party_properties()
         except AttributeError:
@@ -227,6 +315,58 @@ class Graph():
         return onto
 
 
+    def _import_ontology_from_cache(self, onto_file_path: str) -> owlready2.Ontology:
+        """Imports the ontology from the local on-disk cache, parsing it into the cache first if necessary.
+        Returns None if the ontology already exists in the store or the cache can't be used (e.g. within
+        a transaction, the copy would commit the pending changes), so that the ontology is loaded directly.
+
+        :param onto_file_path: Local Path to file or URL to ontology in web.
+        :type onto_file_path: str
+        :return: Pointer to Ontology or None
+        :rtype: owlready2.Ontology
+        """
+        if getattr(self.store, "open_transactions", 0) > 0:
+            self.logger.debug("Not using local cache for ontology '%s' within a transaction.", onto_file_path)
+            return None
+        try:
+            return onto_cache.import_cached_ontology(onto_file_path, self.store, offline=self.offline, logger=self.logger)
+        except owlready2.OwlReadyOntologyParsingError as _:
+            # Logged when loading the ontology directly
+            return None
+        except (OSError, sqlite3.Error) as error:
+            self.logger.debug("Could not use local cache for ontology '%s': %s", onto_file_path, error)
+            return None
+
+
+    @contextmanager
+    def transaction(self):
+        """Context manager to bundle multiple changes of the graph into one commit.
+        All saves of the store within the block are suppressed and the changes are
+        committed once at exit. If an exception is raised within the block, all changes
+        made since the start of the transaction are rolled back and the exception is re-raised.
+        Nested transactions join the outermost transaction.
+
+        Example:
+        with graph.transaction():
+            for cause, effect in edges:
+                graph.add.causal_edge(cause, effect, force_create=True)
+
+        :return: The graph itself
+        :rtype: Graph
+        """
+        with owlutils.transaction(self.store, logger=self.logger):
+            yield self
+
+
+    def batch(self):
+        """Alias for 'Graph.transaction()' for bulk writes.
+
+        :return: Transaction context manager
+        :rtype: contextmanager
+        """
+        return self.transaction()
+
+
     def get_entity(self, name_of_entity: str, suppress_warn: bool = False) -> owlready2.Thing:
         """Returns an entity (class/property/individual) found under the given name.
         Returns none if no entity is found.
@@ -7,20 +7,68 @@ Store is equivalent to owlready2 World """
 
 # general imports
 import itertools
+import numbers
 from logging import Logger
 import owlready2
-from typing import Union
+from typing import Union, Iterable
 # causalgraph imports
 import causalgraph.utils.owlready2_utils as owlutils
 from causalgraph.utils.misc_utils import strict_types
 from causalgraph.utils.logging_utils import init_logger
 
 
+class BulkResult():
+    """ Result of a bulk operation like 'Add.causal_edges'. Contains the created individuals
+    in the order of the passed rows (None for failed rows) and the reason of failure for each failed row.
+    """
+    def __init__(self) -> None:
+        self.created = []
+        self.failures = {}
+
+
+    def add_created(self, individual: owlready2.Thing) -> None:
+        """Records a successfully processed row.
+
+        :param individual: The created individual
+        :type individual: owlready2.Thing
+        """
+        self.created.append(individual)
+
+
+    def add_failure(self, reason: str) -> None:
+        """Records a failed row together with the reason of failure.
+
+        :param reason: Reason of failure
+        :type reason: str
+        """
+        self.failures[len(self.created)] = reason
+        self.created.append(None)
+
+
+    @property
+    def num_created(self) -> int:
+        """Number of rows which were processed successfully"""
+        return len(self.created) - len(self.failures)
+
+
+    @property
+    def num_failed(self) -> int:
+        """Number of rows which failed"""
+        return len(self.failures)
+
+
+    def __repr__(self) -> str:
+        return f"BulkResult(created={self.num_created}, failed={self.num_failed})"
+
+
 class Add():
     """ Contains all methods to add resources to the store """
-    def __init__(self, store: owlready2.World, logger: Logger = None, validate_domain_range: bool = True) -> None:
+    def __init__(self, store: owlready2.World, logger: Logger = None, validate_domain_range: bool = True,
+                 enforce_dag: bool = False, exempt_time_lagged_edges: bool = False) -> None:
         self.store = store
         self.validate_domain_range = validate_domain_range
+        self.enforce_dag = enforce_dag
+        self.exempt_time_lagged_edges = exempt_time_lagged_edges
         if logger is not None:
             self.logger = logger
         else:
@@ -104,10 +152,74 @@ class Add():
                                                               logger= self.logger,
                                                               validate_domain_range=validate_domain_range,
                                                               **kwargs)
-        self.store.save()
+        owlutils.save_store(self.store)
         return causal_node_object
 
 
+    @strict_types
+    def causal_nodes(self, nodes: Iterable, validate_domain_range: bool = None) -> BulkResult:
+        """Creates many individuals of class "CausalNode" at once. Each element of 'nodes' is either the
+        name of the node or a tuple (name, props), where 'props' is a dict of properties (like the **kwargs of
+        'causal_node'). The class and the set of forbidden names are determined once for all nodes, names are
+        checked against the name index and all nodes are created in a single transaction. Existing CausalNodes
+        (also of subclasses of CausalNode) are returned and updated with the passed properties.
+
+        Example:
+        result = graph.add.causal_nodes(["node_1", ("node_2", {"comment": ["an optional comment"]})])
+
+        :param nodes: Iterable of names or tuples (name, props)
+        :type nodes: Iterable
+        :param validate_domain_range: Switch to only allow creation of new individuals with valid domain and range for all properties, defaults to 'Graph.validate_domain_range'
+        :type validate_domain_range: bool, optional
+        :return: BulkResult with the created CausalNodes (None for failed nodes) and the failures per node index
+        :rtype: BulkResult
+        """
+        if validate_domain_range is None:
+            validate_domain_range = self.validate_domain_range
+        result = BulkResult()
+        causal_node_class = owlutils.get_entity_from_cache_by_name("CausalNode", self.store)
+        class_names = owlutils.get_class_names(self.store)
+        valid_props = set()
+        with owlutils.transaction(self.store, logger=self.logger):
+            for node in nodes:
+                if type(node) is str:
+                    node_name, props = node, {}
+                elif type(node) in [tuple, list] and len(node) == 2:
+                    node_name, props = node
+                else:
+                    node_name, props = None, None
+                if type(node_name) is not str or type(props) is not dict:
+                    result.add_failure(f"Node '{node}' is malformed. Pass the name or a tuple (name, props).")
+                    continue
+                if node_name in class_names:
+                    result.add_failure(f"Prohibited to choose individual name identical to class name '{node_name}'.")
+                    continue
+                # Validate the properties (only their existence once per property if domain and range are not validated)
+                props_to_validate = props if validate_domain_range else \
+                    {prop: target for prop, target in props.items() if prop not in valid_props}
+                if not owlutils.validate_property_target_pairs_for_classes(causal_node_class, props_to_validate, self.store,
+                                                                           logger=self.logger, validate_domain_range=validate_domain_range):
+                    result.add_failure(f"Properties {list(props)} are not valid for 'CausalNode'.")
+                    continue
+                valid_props.update(props)
+                # Return existing CausalNodes (with updated properties), create the others
+                existing_node = owlutils.get_entity_by_name(node_name, self.store, suppress_warn=True)
+                if existing_node is None:
+                    new_node = causal_node_class(node_name, namespace=self.store.individuals_onto, **props)
+                    owlutils.add_to_name_index(new_node, self.store)
+                    result.add_created(new_node)
+                elif not any(owlutils.is_subclass_of(node_type, causal_node_class, self.store, suppress_warn=True)
+                             for node_type in existing_node.is_a):
+                    result.add_failure(f"Individual with same name, but different type already exists: {node_name}:{existing_node.is_a}.")
+                elif len(props) > 0 and not owlutils.update_properties_of_individual(existing_node, self.store, props, logger=self.logger,
+                                                                                     validate_domain_range=validate_domain_range):
+                    result.add_failure(f"Properties of existing CausalNode '{node_name}' could not be updated.")
+                else:
+                    result.add_created(existing_node)
+        self.logger.info("Created or updated %d CausalNodes, %d nodes failed.", result.num_created, result.num_failed)
+        return result
+
+
     @strict_types
     def causal_edge(self, cause_node: Union[str, owlready2.Thing], effect_node: Union[str, owlready2.Thing], name_for_edge: str = None,
                     confidence: float = None, time_lag_s: float = None, force_create: bool = False, validate_domain_range: bool = None,
@@ -166,23 +278,21 @@ class Add():
         if edge_existing is not None:
             self.logger.warning(f"Can't create CausalEdge {name_for_edge}. Name already taken.")
             return None
-        # Check if both nodes exist, else: return None or force create node if specified
-        for node_name in (cause_node_name, effect_node_name):
+        # Check if both nodes exist, else: return None or force create node below if specified
+        missing_node_names = []
+        for node_name in dict.fromkeys((cause_node_name, effect_node_name)):
             if not owlutils.entity_exists(node_name, self.store):
                 if force_create is False:
                     self.logger.error(f"Cannot create CausalEdge between {cause_node_name} --> " +
                                       f"{effect_node_name}. Node '{node_name}' can't be found.")
                     return None
-                # Force create missing node with name 'node_name' of type 'CausalNode'
-                # Only if option 'create_causal_node= True'
-                self.logger.warning(f"Node '{node_name}' did not exist. Creating Node " +
-                                    f"of type 'CausalNode' with name '{node_name}' now.")
-                self.causal_node(node_name)
-        # Check if Nodes have Type CausalNode, if not: Store to add CausalNode type
+                missing_node_names.append(node_name)
+        # Check if existing Nodes have Type CausalNode, if not: Store to add CausalNode type
         # (only if NOT of a type which is excluded from drawing CausalEdges in between)
         nodes_that_need_causal_node_type_added = []
         for node_name in (cause_node_name, effect_node_name):
-            if owlutils.is_instance_of_type(node_name, 'CausalNode', self.store, include_subtypes=True):
+            if node_name in missing_node_names or \
+                    owlutils.is_instance_of_type(node_name, 'CausalNode', self.store, include_subtypes=True):
                 pass
             else:
                 # Check if class_type is part of types prohibited for new nodes:
@@ -195,24 +305,30 @@ class Add():
                                         f"'CausalEdge' since its class '{class_type} is " +
                                          "prohibited for CausalEdges.")
                     return None
+        # Reject edges closing a cycle if the graph is a DAG (missing nodes have no edges yet)
+        if self.enforce_dag:
+            time_lag = time_lag_s if time_lag_s is not None else kwargs.get('hasTimeLag')
+            cause = (cause_node_name, owlutils.get_entity_by_name(cause_node_name, self.store, suppress_warn=True))
+            effect = (effect_node_name, owlutils.get_entity_by_name(effect_node_name, self.store, suppress_warn=True))
+            if self._closes_cycle(cause, effect, time_lag):
+                self.logger.error(f"Cannot create CausalEdge between {cause_node_name} --> {effect_node_name}. " +
+                                   "The edge would close a cycle (enforce_dag=True).")
+                return None
         # Add the CausalNode Type if necessary:
-        causal_node_object = owlutils.get_entity_by_name("CausalNode", self.store)
+        causal_node_object = owlutils.get_entity_from_cache_by_name("CausalNode", self.store)
         for node in nodes_that_need_causal_node_type_added:
             # Check if CausalNode is already within node types
             node_types = node.is_a
             if causal_node_object not in node_types:
                 # if yes: append
-                self.logger.debug(f"Node '{node_name}' does not inherit from 'CausalNode' yet." +
-                                   "Adding 'CausalNode' as further class.")
-                node.is_a.append(owlutils.get_entity_by_name("CausalNode", self.store))
+                self.logger.debug("Node '%s' does not inherit from 'CausalNode' yet. " +
+                                  "Adding 'CausalNode' as further class.", node_name)
+                node.is_a.append(owlutils.get_entity_from_cache_by_name("CausalNode", self.store))
             else:
                 # if not: don't append
                 pass
-        # Get Object representation of nodes
-        cause_node = owlutils.get_entity_by_name(cause_node_name, self.store, logger=self.logger)
-        effect_node = owlutils.get_entity_by_name(effect_node_name, self.store, logger=self.logger)
         # Add additional properties to edge, depending on inputs
-        edge_properties_dict = dict(hasCause=cause_node, hasEffect=effect_node)
+        edge_properties_dict = {}
         if confidence is not None:
             if 0.0 <= confidence <= 1.0:
                 edge_properties_dict['hasConfidence'] = confidence
@@ -229,6 +345,14 @@ class Add():
                                   f"{effect_node_name}. Specified time_lag_s {time_lag_s} " +
                                    "is negative.")
                 return None
+        # Force create missing nodes with type 'CausalNode' (only if option 'force_create=True')
+        for node_name in missing_node_names:
+            self.logger.warning(f"Node '{node_name}' did not exist. Creating Node " +
+                                f"of type 'CausalNode' with name '{node_name}' now.")
+            self.causal_node(node_name)
+        # Get Object representation of nodes
+        edge_properties_dict['hasCause'] = owlutils.get_entity_by_name(cause_node_name, self.store, logger=self.logger)
+        edge_properties_dict['hasEffect'] = owlutils.get_entity_by_name(effect_node_name, self.store, logger=self.logger)
         # Create edge with objects
         if name_for_edge is not None:                    
             new_edge_object = owlutils.create_individual_of_type(
@@ -249,10 +373,234 @@ class Add():
                 **edge_properties_dict, **kwargs
             )
         if new_edge_object is not None:
-            self.logger.info(f"Created CausalEdge between cause '{cause_node_name}' and effect " +
-                            f"'{effect_node_name}'")
-            self.store.save()
+            self.logger.info("Created CausalEdge between cause '%s' and effect '%s'", cause_node_name, effect_node_name)
+            owlutils.save_store(self.store)
         else:
             self.logger.warning("Creation failed. No Edge added between cause" +
                                 f"{cause_node_name} and effect {effect_node_name}")
         return new_edge_object
+
+
+    @strict_types
+    def causal_edges(self, rows: Iterable, force_create: bool = False, validate_domain_range: bool = None) -> BulkResult:
+        """Adds many 'CausalEdges' at once. Each row is a tuple (cause, effect, confidence, time_lag_s, props)
+        where the trailing elements are optional and 'props' is a dict of additional properties (like the
+        **kwargs of 'causal_edge'). Node names are resolved once for all rows, the node types are checked once per
+        node and all edges are created in a single transaction. The names of the edges are generated automatically.
+
+        Example:
+        result = graph.add.causal_edges([("node_1", "node_2"),
+                                         ("node_2", "node_3", 0.8, 5.0, {"comment": ["an optional comment"]})])
+
+        :param rows: Iterable of tuples (cause, effect[, confidence[, time_lag_s[, props]]])
+        :type rows: Iterable
+        :param force_create: Enable force creation of missing cause/effect nodes with type 'CausalNode', defaults to False
+        :type force_create: bool, optional
+        :param validate_domain_range: Switch to only allow creation of new individuals with valid domain and range for all properties, defaults to 'Graph.validate_domain_range'
+        :type validate_domain_range: bool, optional
+        :return: BulkResult with the created CausalEdges (None for failed rows) and the failures per row index
+        :rtype: BulkResult
+        """
+        if validate_domain_range is None:
+            validate_domain_range = self.validate_domain_range
+        result = BulkResult()
+        causal_node_class = owlutils.get_entity_from_cache_by_name("CausalNode", self.store)
+        causal_edge_class = owlutils.get_entity_from_cache_by_name("CausalEdge", self.store)
+        # Cause and effect nodes are resolved and checked once per node
+        nodes = {}
+        node_checks = {}
+        valid_props = set()
+        with owlutils.transaction(self.store, logger=self.logger):
+            for row in rows:
+                # 1) - 3) Validate the whole row before changing the store
+                try:
+                    failure = self._validate_edge_row(row, nodes, node_checks, causal_node_class, causal_edge_class,
+                                                      force_create, validate_domain_range, valid_props)
+                except (TypeError, ValueError) as error:
+                    failure = f"Row {row} is invalid: {error}"
+                if failure is not None:
+                    result.add_failure(failure)
+                    continue
+                cause, effect, confidence, time_lag_s, props = self._unpack_edge_row(row)
+                # 4) Create missing nodes or add the CausalNode type to the nodes, then create the edge
+                failure = self._prepare_node_for_causal_edges(cause, nodes, node_checks, causal_node_class) or \
+                          self._prepare_node_for_causal_edges(effect, nodes, node_checks, causal_node_class)
+                if failure is not None:
+                    result.add_failure(failure)
+                    continue
+                edge_properties_dict = dict(hasCause=nodes[cause][1], hasEffect=nodes[effect][1], **props)
+                if confidence is not None:
+                    edge_properties_dict['hasConfidence'] = float(confidence)
+                if time_lag_s is not None:
+                    edge_properties_dict['hasTimeLag'] = float(time_lag_s)
+                try:
+                    new_edge = causal_edge_class(namespace=self.store.individuals_onto, **edge_properties_dict)
+                except (ValueError, TypeError) as error:
+                    result.add_failure(f"Creation of CausalEdge failed: {error}")
+                    continue
+                owlutils.add_to_name_index(new_edge, self.store)
+                owlutils.update_adjacency_index(new_edge, self.store)
+                result.add_created(new_edge)
+        self.logger.info("Created %d CausalEdges, %d rows failed.", result.num_created, result.num_failed)
+        return result
+
+
+    def _validate_edge_row(self, row: tuple, nodes: dict, node_checks: dict, causal_node_class: owlready2.ThingClass,
+                           causal_edge_class: owlready2.ThingClass, force_create: bool, validate_domain_range: bool,
+                           valid_props: set) -> str:
+        """Validates a row of 'causal_edges' without changing the store: its values, the cause and effect nodes,
+        cycles (if 'enforce_dag') and the additional properties.
+
+        :param row: Tuple (cause, effect[, confidence[, time_lag_s[, props]]])
+        :type row: tuple
+        :param nodes: Dict with the resolved (name, object) pairs of the nodes, updated with the nodes of the row
+        :type nodes: dict
+        :param node_checks: Dict with the results of '_check_node_for_causal_edges' per node, updated with the nodes of the row
+        :type node_checks: dict
+        :param causal_node_class: The CausalNode class
+        :type causal_node_class: owlready2.ThingClass
+        :param causal_edge_class: The CausalEdge class
+        :type causal_edge_class: owlready2.ThingClass
+        :param force_create: Enable force creation of missing nodes
+        :type force_create: bool
+        :param validate_domain_range: Switch to validate domain and range of all properties
+        :type validate_domain_range: bool
+        :param valid_props: Properties which were validated already, updated with the properties of the row
+        :type valid_props: set
+        :return: Reason why the row is invalid, None if it is valid
+        :rtype: str
+        """
+        cause, effect, confidence, time_lag_s, props = self._unpack_edge_row(row)
+        # 1) Validate the values of the row
+        if cause is None or effect is None or type(props) is not dict or 'hasCause' in props or 'hasEffect' in props:
+            return f"Row is malformed: ({cause}, {effect}, {confidence}, {time_lag_s}, {props})."
+        for value_name, value in (("confidence", confidence), ("time_lag_s", time_lag_s)):
+            if value is not None and (isinstance(value, bool) or not isinstance(value, numbers.Real)):
+                return f"Specified {value_name} {value} is not a number."
+        if confidence is not None and not 0.0 <= confidence <= 1.0:
+            return f"Specified confidence {confidence} exceeds range [0,1]."
+        if time_lag_s is not None and time_lag_s < 0.0:
+            return f"Specified time_lag_s {time_lag_s} is negative."
+        # 2) Check the cause and effect nodes, once per node
+        for node in (cause, effect):
+            if not isinstance(node, (str, owlready2.Thing)):
+                return f"Node '{node}' is neither a name nor an individual."
+            if node not in nodes:
+                nodes[node] = owlutils.get_name_and_object(node, self.store, suppress_warn=True)
+            if node not in node_checks:
+                node_checks[node] = self._check_node_for_causal_edges(node, nodes, causal_node_class, force_create)
+            if node_checks[node] is not None:
+                return node_checks[node]
+        time_lag = time_lag_s if time_lag_s is not None else props.get('hasTimeLag')
+        if self.enforce_dag and self._closes_cycle(nodes[cause], nodes[effect], time_lag):
+            return f"CausalEdge {nodes[cause][0]} --> {nodes[effect][0]} would close a cycle (enforce_dag=True)."
+        # 3) Validate the additional properties (only their existence once per property if domain and range are not validated).
+        # Cause and effect are validated by the node checks, as they may get the type CausalNode only when the edge is created.
+        edge_properties_dict = dict(props)
+        if confidence is not None:
+            edge_properties_dict['hasConfidence'] = float(confidence)
+        if time_lag_s is not None:
+            edge_properties_dict['hasTimeLag'] = float(time_lag_s)
+        props_to_validate = edge_properties_dict if validate_domain_range else \
+            {prop: target for prop, target in edge_properties_dict.items() if prop not in valid_props}
+        if not owlutils.validate_property_target_pairs_for_classes(causal_edge_class, props_to_validate, self.store,
+                                                                   logger=self.logger, validate_domain_range=validate_domain_range):
+            return f"Properties {list(edge_properties_dict)} are not valid for 'CausalEdge'."
+        valid_props.update(edge_properties_dict)
+        return None
+
+
+    def _closes_cycle(self, cause: tuple, effect: tuple, time_lag_s: float) -> bool:
+        """Checks if a CausalEdge between the resolved (name, object) pairs of 'cause' and 'effect' would close a cycle.
+        Nodes which are not created yet have no edges, so only a self loop on them closes a cycle.
+
+        :param cause: Resolved (name, object) pair of the cause node
+        :type cause: tuple
+        :param effect: Resolved (name, object) pair of the effect node
+        :type effect: tuple
+        :param time_lag_s: Time lag of the edge
+        :type time_lag_s: float
+        :return: True if the edge would close a cycle
+        :rtype: bool
+        """
+        if cause[1] is not None and effect[1] is not None:
+            return owlutils.would_create_cycle(cause[1], effect[1], self.store, time_lag_s=time_lag_s,
+                                               exempt_time_lagged=self.exempt_time_lagged_edges, logger=self.logger)
+        time_lag_exempt = self.exempt_time_lagged_edges and time_lag_s is not None and time_lag_s > 0
+        return cause[0] == effect[0] and not time_lag_exempt
+
+
+    @staticmethod
+    def _unpack_edge_row(row: tuple) -> tuple:
+        """Pads a row of 'causal_edges' to the full form (cause, effect, confidence, time_lag_s, props).
+
+        :param row: Tuple (cause, effect[, confidence[, time_lag_s[, props]]])
+        :type row: tuple
+        :return: Tuple (cause, effect, confidence, time_lag_s, props), (None, .., None) if the row is malformed
+        :rtype: tuple
+        """
+        if type(row) not in [tuple, list] or not 2 <= len(row) <= 5:
+            return None, None, None, None, None
+        cause, effect, confidence, time_lag_s, props = (*row, *([None] * (5 - len(row))))
+        return cause, effect, confidence, time_lag_s, props if props is not None else {}
+
+
+    def _check_node_for_causal_edges(self, node: Union[str, owlready2.Thing], nodes: dict,
+                                     causal_node_class: owlready2.ThingClass, force_create: bool) -> str:
+        """Checks if a node can be used as cause or effect of CausalEdges, similar to 'causal_edge'.
+        Missing nodes can be used if 'force_create' is True and nodes which are not of type 'CausalNode' yet
+        if their class is not prohibited. The store is not changed, see '_prepare_node_for_causal_edges'.
+
+        :param node: Node object or its name
+        :type node: Union[str, owlready2.Thing]
+        :param nodes: Dict with the resolved (name, object) pairs of all nodes
+        :type nodes: dict
+        :param causal_node_class: The CausalNode class
+        :type causal_node_class: owlready2.ThingClass
+        :param force_create: Enable force creation of missing nodes
+        :type force_create: bool
+        :return: Reason why the node can't be used, None if it can be used
+        :rtype: str
+        """
+        node_name, node_obj = nodes[node]
+        if node_name is None and node_obj is None:
+            return f"The passed node object '{node}' does not exist."
+        if node_obj is None:
+            if force_create is False:
+                return f"Node '{node_name}' can't be found."
+            if node_name in owlutils.get_class_names(self.store):
+                return f"Node '{node_name}' can't be created. Prohibited to choose individual name identical to class name."
+            return None
+        if any(owlutils.is_subclass_of(node_type, causal_node_class, self.store, suppress_warn=True) for node_type in node_obj.is_a):
+            return None
+        if node_obj.is_a in self.classes_prohibited_from_causal_connections:
+            return f"Node '{node_name}' can not be used as part of a 'CausalEdge' since its class '{node_obj.is_a}' is prohibited for CausalEdges."
+        return None
+
+
+    def _prepare_node_for_causal_edges(self, node: Union[str, owlready2.Thing], nodes: dict, node_checks: dict,
+                                       causal_node_class: owlready2.ThingClass) -> str:
+        """Creates a missing (checked) node as CausalNode or adds the type 'CausalNode' to it, once per node.
+        Updates the resolved (name, object) pair of the node in 'nodes'.
+
+        :param node: Node object or its name
+        :type node: Union[str, owlready2.Thing]
+        :param nodes: Dict with the resolved (name, object) pairs of all nodes
+        :type nodes: dict
+        :param node_checks: Dict with the results of '_check_node_for_causal_edges' per node
+        :type node_checks: dict
+        :param causal_node_class: The CausalNode class
+        :type causal_node_class: owlready2.ThingClass
+        :return: Reason why the node could not be prepared, None if it can be used
+        :rtype: str
+        """
+        node_name, node_obj = nodes[node]
+        if node_obj is None:
+            node_obj = self.causal_node(node_name)
+            if node_obj is None:
+                node_checks[node] = f"Node '{node_name}' did not exist and could not be created."
+                return node_checks[node]
+            nodes[node] = (node_name, node_obj)
+        elif not any(owlutils.is_subclass_of(node_type, causal_node_class, self.store, suppress_warn=True) for node_type in node_obj.is_a):
+            node_obj.is_a.append(causal_node_class)
+        return None
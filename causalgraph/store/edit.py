@@ -6,7 +6,7 @@
 Store is equivalent to owlready2 World """
 
 # general imports
-from logging import Logger
+from logging import Logger, INFO
 import owlready2
 from typing import Union
 # causalgraph imports
@@ -17,9 +17,12 @@ from causalgraph.utils.logging_utils import init_logger
 
 class Edit():
     """ Contains all methods to edit resources in the store"""
-    def __init__(self, store: owlready2.World, logger: Logger = None, validate_domain_range: bool = True) -> None:
+    def __init__(self, store: owlready2.World, logger: Logger = None, validate_domain_range: bool = True,
+                 enforce_dag: bool = False, exempt_time_lagged_edges: bool = False) -> None:
         self.store = store
         self.validate_domain_range = validate_domain_range
+        self.enforce_dag = enforce_dag
+        self.exempt_time_lagged_edges = exempt_time_lagged_edges
         if logger is not None:
             self.logger = logger
         else:
@@ -53,14 +56,16 @@ class Edit():
             self.logger.warning(f"Name change not successful because the new name '{new_name}'" +
                                  " is already taken.")
             return False
-        # Renaming individuals and check success
+        # Renaming individuals (and keeping the name index up to date) and check success
+        owlutils.remove_from_name_index(ind_old_name_obj, self.store)
         ind_old_name_obj.name = new_name
+        owlutils.add_to_name_index(ind_old_name_obj, self.store)
         # Success check not absolutely necessary, but in there for safety's sake.
         ind_old_name_obj = owlutils.get_entity_by_name(indi_old_name_name, self.store, suppress_warn=True)
         indi_new_name_obj = owlutils.get_entity_by_name(new_name, self.store, suppress_warn=True)
-        self.store.save()
+        owlutils.save_store(self.store)
         if ind_old_name_obj is None and indi_new_name_obj is not None:
-            self.logger.info(f"Renaming individual '{indi_old_name_name}' to '{new_name}' has been successful.")
+            self.logger.info("Renaming individual '%s' to '%s' has been successful.", indi_old_name_name, new_name)
             return True
         self.logger.warning(f"Something went wrong while renaming '{indi_old_name_name}' to '{new_name}'" +
                              " although the required name is not taken.")
@@ -115,9 +120,10 @@ class Edit():
         new_types.append(new_subtype_obj)
         # Swap current types of individual with new ones
         individual_obj.is_a = new_types
-        self.store.save()
-        types_to_update_names = [i.name for i in types_to_update]
-        self.logger.info(f'Changing type(s) { {*types_to_update_names} } to {new_subtype_name} successful.')
+        owlutils.save_store(self.store)
+        if self.logger.isEnabledFor(INFO):
+            types_to_update_names = {i.name for i in types_to_update}
+            self.logger.info('Changing type(s) %s to %s successful.', types_to_update_names, new_subtype_name)
         return True
 
 
@@ -133,7 +139,11 @@ class Edit():
         :return: True if update successful, else False
         :rtype: bool
         """
-        individual_name, _ = owlutils.get_name_and_object(entity, self.store)
+        individual_name, individual_obj = owlutils.get_name_and_object(entity, self.store)
+        if self.enforce_dag and individual_obj is not None and self._closes_cycle(individual_obj, prop_dict):
+            self.logger.error(f"Can not update individual '{individual_name}' with properties_dict: {prop_dict}. " +
+                               "The changed CausalEdge would close a cycle (enforce_dag=True).")
+            return False
         update_prop_result = owlutils.update_properties_of_individual(individual=individual_name,
                                                                       logger=self.logger,
                                                                       store=self.store,
@@ -191,4 +201,30 @@ class Edit():
         """
         individual_name, _ = owlutils.get_name_and_object(entity, self.store)
         return self.property(individual_name, 'comment', new_comment)
-        
\ No newline at end of file
+
+
+    def _closes_cycle(self, individual: owlready2.Thing, prop_dict: dict) -> bool:
+        """Checks if the updated cause, effect or time lag of an (existing or new) CausalEdge would close a cycle.
+
+        :param individual: The individual to be changed
+        :type individual: owlready2.Thing
+        :param prop_dict: Dictionary containing properties and their new values
+        :type prop_dict: dict
+        :return: True if the changed edge would close a cycle
+        :rtype: bool
+        """
+        if not any(prop in prop_dict for prop in ("hasCause", "hasEffect", "hasTimeLag")):
+            return False
+        ends = {}
+        for prop in ("hasCause", "hasEffect"):
+            node = prop_dict[prop] if prop in prop_dict else getattr(individual, prop, None)
+            if isinstance(node, list):
+                node = node[0] if len(node) == 1 else None
+            ends[prop] = owlutils.get_name_and_object(node, self.store, suppress_warn=True)[1] if node is not None else None
+        if ends["hasCause"] is None or ends["hasEffect"] is None:
+            return False
+        time_lag = prop_dict["hasTimeLag"] if "hasTimeLag" in prop_dict else getattr(individual, "hasTimeLag", None)
+        return owlutils.would_create_cycle(ends["hasCause"], ends["hasEffect"], self.store, time_lag_s=time_lag,
+                                           exempt_time_lagged=self.exempt_time_lagged_edges, ignored_edge=individual,
+                                           logger=self.logger)
+
@@ -6,14 +6,14 @@
 formats like nx, tigramite, graphml, gml."""
 
 # general imports
-from typing import Tuple
+from typing import Tuple, NamedTuple
 from logging import Logger
 import numpy as np
 from networkx import MultiDiGraph, write_graphml, write_gml
 # causalgraph and owlready imports
 import owlready2
 from causalgraph.utils.logging_utils import init_logger
-from causalgraph.utils.owlready2_utils import is_subclass_of
+from causalgraph.utils.owlready2_utils import is_subclass_of, get_all_causalnodes, get_all_causaledges
 
 
 class Export():
@@ -40,18 +40,13 @@ class Export():
         :rtype: nx.MultiDiGraph
         """
         G_nx = MultiDiGraph()
-        graph_dict = self.graph.map.all_individuals_to_dict()
-        for individual in graph_dict:
-            individual_types = graph_dict[individual]["type"]
-            individual_name = individual
-            properties_dict = graph_dict[individual]
-            #if "CausalNode" in individual_types:
+        for individual_name, properties_dict in self.graph.map.iter_individuals():
+            individual_types = properties_dict["type"]
             if any(is_subclass_of(type_, "CausalNode", self.graph.store) for type_ in individual_types):
                 G_nx.add_node(individual_name, **properties_dict)
-            #elif "CausalEdge" in individual_types:
             elif any(is_subclass_of(type_, "CausalEdge", self.graph.store) for type_ in individual_types):
-                cause = graph_dict[individual]["hasCause"]
-                effect = graph_dict[individual]["hasEffect"]
+                cause = properties_dict["hasCause"]
+                effect = properties_dict["hasEffect"]
                 G_nx.add_edge(cause, effect, **properties_dict)
             else:
                 self.logger.error(f"Individual type '{individual_types}' unknown.")
@@ -111,80 +106,129 @@ class Export():
         write_gml(g_nx, f'{directory}/{filename}.gml')
 
 
-    def tigra(self) -> Tuple[list, dict, np.ndarray, np.ndarray, int]:
+    def tigra(self, sparse: bool = False) -> Tuple[list, dict, np.ndarray, np.ndarray, int]:
         """Creates a Tigramite graph from a cg graph. Right now, this method only can handle
         edges, nodes, timelags and confidence. Nodes with multiple class types besides CausalNode
         will be broken down to type CausalNode only.
+        With 'sparse=True', link_matrix and q_matrix are returned as SparseTigraMatrix (COO format)
+        instead of dense N x N x L arrays, which is useful for large graphs with long timelags.
 
-        :param graph_dict: Properties dict of a cg graph.
-        :type graph_dict: dict
+        :param sparse: Switch to return link_matrix and q_matrix in COO format, defaults to False
+        :type sparse: bool, optional
         :return: Tuple with the links as a boolean matrix, the variable names as a list of
         strings, the edges as dict with its cause and effect and integer containing the
         tigra timestep length. [node_names, edge_names, link_matrix, q_matrix, timestep_len_s].
-        :rtype: Tuple[np.ndarray, list, dict, int]
+        :rtype: Tuple[list, dict, np.ndarray, np.ndarray, int]
         """
-        graph_dict = self.graph.map.all_individuals_to_dict()
-        if len(graph_dict) <= 1:
+        # Individuals with multiple CausalNode/CausalEdge types are returned once per type
+        causal_nodes = list(dict.fromkeys(node[0] for node in get_all_causalnodes(self.graph.store)))
+        causal_edges = list(dict.fromkeys(edge[0] for edge in get_all_causaledges(self.graph.store)))
+        if len(causal_nodes) + len(causal_edges) <= 1:
             raise ValueError("You can't draw an empty graph or a graph with only one node using Tigramite!")
-
-        list_of_edges = []
-        list_cg_timelags = []
-        list_tigra_timelags = []
-        list_edge_confidence = []
-        node_names = []
-        edge_names = {}
-        # Get list of cg timelags:
-        for individual in graph_dict:
-            individual_types = graph_dict[individual]["type"]
-            if any(is_subclass_of(type_, "CausalEdge", self.graph.store) for type_ in individual_types):
-                # Get timelag or None
-                time_lag_s = graph_dict[individual].get("time_lag_s", None)
-                if time_lag_s is not None:
-                    list_cg_timelags.append(time_lag_s)
-        # Get timestep length (smallest timelag in list_cg_timelags)
-        try:
-            timestep_len_s = min(list_cg_timelags)
-        except ValueError:
-            timestep_len_s = 1
-
-        for individual in graph_dict:
-            individual_types = graph_dict[individual]["type"]
-            individual_name = individual
-            # Fill list of node names
-            if any(is_subclass_of(type_, "CausalNode", self.graph.store) for type_ in individual_types):
-                node_names.append(individual_name)
-            # Fill list of edges, incl. their tigramite timelag
-            if any(is_subclass_of(type_, "CausalEdge", self.graph.store) for type_ in individual_types):
-                cause = graph_dict[individual].get("hasCause", None)
-                effect = graph_dict[individual].get("hasEffect", None)
-                # If timelag exists for current edge, convert it to tigramite timeframe.
-                # If it doesnt exist, set it to 0. After that add it to list_tigra_timelags
-                time_lag_s = round(graph_dict[individual].get("hasTimeLag", 0)/timestep_len_s)
-                list_tigra_timelags.append(time_lag_s)
-                # Get confidence for current edge. set it to 0 (edge present) if it does not exist
-                confidence = graph_dict[individual].get('hasConfidence', 0)
-                list_edge_confidence.append(confidence)
-                # Add edge with its timelag to list_of_edges
-                list_of_edges.append((cause, effect, time_lag_s))
-                edge_names[individual_name] = {}
-                edge_names[individual_name] = {"hasCause": cause, "hasEffect": effect}
-
+        # Timestep length of the tigramite graph, cg timelags are given in seconds
+        timestep_len_s = 1
+        node_names = [node.name for node in causal_nodes]
+        node_index = {node_name: index for index, node_name in enumerate(node_names)}
         num_of_nodes = len(node_names)
         # graph consists of nodes only
-        if len(edge_names) == 0:
+        if len(causal_edges) == 0:
+            if sparse is True:
+                return (node_names, [], SparseTigraMatrix.empty((num_of_nodes, num_of_nodes, 5), 0.0),
+                        SparseTigraMatrix.empty((num_of_nodes, num_of_nodes, 5), 1.0), timestep_len_s)
             link_matrix = np.zeros((num_of_nodes, num_of_nodes, 5))
             q_matrix = np.ones((num_of_nodes, num_of_nodes, 5))
             return (node_names, [], link_matrix, q_matrix, timestep_len_s)
-        # if there are edges, create list of edge indices with their timelags
-        edge_indices = [(node_names.index(cause), node_names.index(effect), timelag)
-                            for (cause, effect, timelag) in list_of_edges]
-        # Init link_matrix with the proper dimension and fill it with zeros for now.
-        link_matrix = np.zeros((num_of_nodes, num_of_nodes, max(list_tigra_timelags)+1))
-        # Set 1 at the right indices to give information about the timelag value
-        cause_ind, effect_ind, time_ind = zip(*edge_indices)
+        # Collect the indices of cause, effect and tigramite timelag as well as the confidence of all edges
+        edge_names = {}
+        cause_ind = np.empty(len(causal_edges), dtype=np.intp)
+        effect_ind = np.empty(len(causal_edges), dtype=np.intp)
+        time_ind = np.empty(len(causal_edges), dtype=np.intp)
+        list_edge_confidence = np.empty(len(causal_edges))
+        for edge_ind, causal_edge in enumerate(causal_edges):
+            cause = causal_edge.hasCause.name
+            effect = causal_edge.hasEffect.name
+            cause_ind[edge_ind] = node_index[cause]
+            effect_ind[edge_ind] = node_index[effect]
+            # If timelag exists for current edge, convert it to tigramite timeframe, else set it to 0
+            time_ind[edge_ind] = round((causal_edge.hasTimeLag or 0)/timestep_len_s)
+            # Get confidence for current edge. set it to 0 (edge present) if it does not exist
+            list_edge_confidence[edge_ind] = causal_edge.hasConfidence or 0
+            edge_names[causal_edge.name] = {"hasCause": cause, "hasEffect": effect}
+        shape = (num_of_nodes, num_of_nodes, int(time_ind.max())+1)
+        if sparse is True:
+            coords = np.vstack((cause_ind, effect_ind, time_ind))
+            link_matrix = SparseTigraMatrix(coords, np.ones(len(causal_edges)), shape, 0.0)
+            q_matrix = SparseTigraMatrix(coords, list_edge_confidence, shape, 1.0)
+            return (node_names, edge_names, link_matrix, q_matrix, timestep_len_s)
+        # Init link_matrix with the proper dimension and set 1 at the right indices
+        link_matrix = np.zeros(shape)
         link_matrix[cause_ind, effect_ind, time_ind] = 1
         # Init q_matrix with the proper dimension and fill it with ones (edges not present) for now
-        q_matrix = np.ones((num_of_nodes, num_of_nodes, max(list_tigra_timelags)+1))
+        q_matrix = np.ones(shape)
         q_matrix[cause_ind, effect_ind, time_ind] = list_edge_confidence
         return (node_names, edge_names, link_matrix, q_matrix, timestep_len_s)
 
+
+class SparseTigraMatrix(NamedTuple):
+    """Sparse COO representation of a Tigramite link_matrix or q_matrix with the dimensions
+    (cause, effect, timelag). All entries not listed in 'coords' have the value 'fill_value'.
+    """
+    coords: np.ndarray
+    data: np.ndarray
+    shape: tuple
+    fill_value: float = 0.0
+
+    @classmethod
+    def empty(cls, shape: tuple, fill_value: float = 0.0) -> 'SparseTigraMatrix':
+        """Creates a SparseTigraMatrix without any entries.
+
+        :param shape: Shape of the dense matrix
+        :type shape: tuple
+        :param fill_value: Value of all entries, defaults to 0.0
+        :type fill_value: float, optional
+        :return: The empty SparseTigraMatrix
+        :rtype: SparseTigraMatrix
+        """
+        return cls(np.empty((3, 0), dtype=np.intp), np.empty(0), tuple(shape), fill_value)
+
+    def todense(self) -> np.ndarray:
+        """Returns the matrix as dense numpy array.
+
+        :return: Dense matrix
+        :rtype: np.ndarray
+        """
+        dense_matrix = np.full(self.shape, self.fill_value, dtype=float)
+        dense_matrix[tuple(self.coords)] = self.data
+        return dense_matrix
+
+    def nonzero(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Returns the indices of all entries which are not zero, in the same order as
+        'np.nonzero' of the dense matrix.
+
+        :return: Tuple of the cause, effect and timelag indices
+        :rtype: Tuple[np.ndarray, np.ndarray, np.ndarray]
+        """
+        if self.fill_value != 0:
+            return np.nonzero(self.todense())
+        coords = self.coords[:, self.data != 0]
+        order = np.lexsort(coords[::-1])
+        return tuple(coords[:, order])
+
+    def values_at(self, cause_inds: np.ndarray, effect_inds: np.ndarray, lag_inds: np.ndarray) -> np.ndarray:
+        """Returns the values of the matrix at the passed indices.
+
+        :param cause_inds: Cause indices
+        :type cause_inds: np.ndarray
+        :param effect_inds: Effect indices
+        :type effect_inds: np.ndarray
+        :param lag_inds: Timelag indices
+        :type lag_inds: np.ndarray
+        :return: Values at the indices
+        :rtype: np.ndarray
+        """
+        values = dict(zip(zip(*self.coords.tolist()), self.data.tolist()))
+        return np.array([values.get(index, self.fill_value) for index in zip(np.asarray(cause_inds).tolist(),
+                                                                              np.asarray(effect_inds).tolist(),
+                                                                              np.asarray(lag_inds).tolist())],
+                        dtype=float)
+
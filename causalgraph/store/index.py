@@ -0,0 +1,418 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: MIT
+
+""" Contains the per-store index of the causal structure: the adjacency index of the CausalEdges,
+its reachability index and the incremental topological order used to keep a graph acyclic.
+The index is attached to the store and kept up to date by the hooks in 'owlready2_utils'.
+"""
+
+# general imports
+import logging
+from logging import Logger
+import owlready2
+# causalgraph imports
+import causalgraph.utils.owlready2_utils as owlutils
+from causalgraph.utils.logging_utils import init_logger
+
+###################################################
+#               GLOBALS                           #
+###################################################
+INDEX_LOGGER = init_logger("index", console_handler_level=logging.WARNING)
+##################################################
+
+
+class ReachabilityIndex():
+    """Transitive closure of an AdjacencyIndex as bitsets (python ints). Each node gets a bit position,
+    'descendants[node]'/'ancestors[node]' have the bits of all nodes reachable from/reaching the node set
+    (incl. the node itself if it is part of a cycle). Adding an edge ORs the new paths into the affected
+    closures, removing an edge recomputes only the closures of the ancestors of its cause and the
+    descendants of its effect (per strongly connected component, in reverse topological order)."""
+    def __init__(self, adjacency_index: 'AdjacencyIndex') -> None:
+        self.adjacency_index = adjacency_index
+        self.bit_positions = {}
+        self.nodes_by_bit = []
+        self.descendants = {}
+        self.ancestors = {}
+        nodes = set(adjacency_index.out_edges) | set(adjacency_index.in_edges)
+        self._recompute_closures(nodes, self._successors, self.descendants)
+        self._recompute_closures(nodes, self._predecessors, self.ancestors)
+
+
+    def bit(self, node: int) -> int:
+        """Returns the bit of the node, assigns a new bit position on first request."""
+        position = self.bit_positions.get(node)
+        if position is None:
+            position = self.bit_positions[node] = len(self.nodes_by_bit)
+            self.nodes_by_bit.append(node)
+        return 1 << position
+
+
+    def nodes_of(self, bits: int) -> list:
+        """Returns the nodes (storids) of all set bits, ordered by bit position."""
+        bit_string = bin(bits)[:1:-1]
+        nodes = []
+        position = bit_string.find("1")
+        while position != -1:
+            nodes.append(self.nodes_by_bit[position])
+            position = bit_string.find("1", position + 1)
+        return nodes
+
+
+    def is_reachable(self, source: int, target: int) -> bool:
+        """True if there is a path of at least one edge from source to target."""
+        position = self.bit_positions.get(target)
+        return position is not None and (self.descendants.get(source, 0) >> position) & 1 == 1
+
+
+    def add_edge(self, cause: int, effect: int) -> None:
+        """Adds the paths of a new edge: every node reaching 'cause' (and 'cause') now reaches 'effect'
+        and everything 'effect' reaches. Needs to be called after the edge was added to the adjacency."""
+        if self.is_reachable(cause, effect):
+            return
+        new_descendants = self.bit(effect) | self.descendants.get(effect, 0)
+        new_ancestors = self.bit(cause) | self.ancestors.get(cause, 0)
+        for node in self.nodes_of(new_ancestors):
+            self.descendants[node] = self.descendants.get(node, 0) | new_descendants
+        for node in self.nodes_of(new_descendants):
+            self.ancestors[node] = self.ancestors.get(node, 0) | new_ancestors
+
+
+    def remove_edge(self, cause: int, effect: int) -> None:
+        """Recomputes the closures affected by removing an edge. Needs to be called after the edge was
+        removed from the adjacency."""
+        if effect in self.adjacency_index.out_edges.get(cause, {}).values():
+            return # Parallel edge left, nothing changed
+        affected_sources = self.nodes_of(self.bit(cause) | self.ancestors.get(cause, 0))
+        affected_targets = self.nodes_of(self.bit(effect) | self.descendants.get(effect, 0))
+        self._recompute_closures(set(affected_sources), self._successors, self.descendants)
+        self._recompute_closures(set(affected_targets), self._predecessors, self.ancestors)
+
+
+    def _successors(self, node: int):
+        return self.adjacency_index.out_edges.get(node, {}).values()
+
+
+    def _predecessors(self, node: int):
+        return self.adjacency_index.in_edges.get(node, {}).values()
+
+
+    def _recompute_closures(self, nodes: set, neighbors, closures: dict) -> None:
+        """Recomputes the closures of 'nodes' following 'neighbors'. The closures of all other nodes have to be
+        up to date. Uses Tarjan's algorithm, which completes the strongly connected components in reverse
+        topological order, so the closures of all neighbors of a component are final when it is completed."""
+        index = {}
+        lowlink = {}
+        stack = []
+        on_stack = set()
+        for root in nodes:
+            if root in index:
+                continue
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(neighbors(root)))]
+            while work:
+                node, neighbors_iter = work[-1]
+                for neighbor in neighbors_iter:
+                    if neighbor not in nodes:
+                        continue
+                    if neighbor not in index:
+                        index[neighbor] = lowlink[neighbor] = len(index)
+                        stack.append(neighbor)
+                        on_stack.add(neighbor)
+                        work.append((neighbor, iter(neighbors(neighbor))))
+                        break
+                    if neighbor in on_stack:
+                        lowlink[node] = min(lowlink[node], index[neighbor])
+                else:
+                    work.pop()
+                    if work:
+                        lowlink[work[-1][0]] = min(lowlink[work[-1][0]], lowlink[node])
+                    if lowlink[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        self._set_component_closure(component, neighbors, closures)
+
+
+    def _set_component_closure(self, component: list, neighbors, closures: dict) -> None:
+        """Sets the closure of all members of a strongly connected component."""
+        members = set(component)
+        closure = 0
+        cyclic = len(component) > 1
+        for member in component:
+            for neighbor in neighbors(member):
+                if neighbor in members:
+                    cyclic = True
+                else:
+                    closure |= self.bit(neighbor) | closures.get(neighbor, 0)
+        if cyclic:
+            for member in component:
+                closure |= self.bit(member)
+        for member in component:
+            if closure:
+                closures[member] = closure
+            else:
+                closures.pop(member, None)
+
+
+class TopologicalOrder():
+    """Incremental topological order of the nodes of an AdjacencyIndex (Pearce-Kelly). 'positions[node]'
+    is the position of the node in the order, for every edge the cause is positioned before the effect.
+    Inserting an edge that violates the order only reorders the affected region between effect and cause.
+    Edges in 'ignored_edges' are not part of the order: time-lagged edges (hasTimeLag > 0) if they are
+    exempt and edges which closed a cycle without being checked with 'would_create_cycle' before."""
+    def __init__(self, adjacency_index: 'AdjacencyIndex', store: owlready2.World, exempt_time_lagged: bool = False,
+                 logger: Logger = INDEX_LOGGER) -> None:
+        self.adjacency_index = adjacency_index
+        self.store = store
+        self.exempt_time_lagged = exempt_time_lagged
+        self.logger = logger
+        has_time_lag = owlutils.get_entity_by_name("hasTimeLag", store, suppress_warn=True)
+        self.has_time_lag_storid = None if has_time_lag is None else has_time_lag.storid
+        self.positions = {}
+        self.next_position = 0
+        self.ignored_edges = set()
+        if exempt_time_lagged and self.has_time_lag_storid is not None:
+            self.ignored_edges.update(edge for edge, in store.graph.execute(
+                "SELECT s FROM datas WHERE p = ? AND o > 0", (self.has_time_lag_storid,))
+                if edge in adjacency_index.edge_ends)
+        self._init_positions()
+
+
+    def _init_positions(self) -> None:
+        """Orders all nodes with Kahn's algorithm. If the edges contain a cycle, the nodes are
+        positioned in any order and the edges are inserted one by one instead."""
+        in_degrees = {}
+        for edge, (cause, effect) in self.adjacency_index.edge_ends.items():
+            in_degrees.setdefault(cause, 0)
+            if edge not in self.ignored_edges:
+                in_degrees[effect] = in_degrees.get(effect, 0) + 1
+        ready = [node for node, in_degree in in_degrees.items() if in_degree == 0]
+        while ready:
+            node = ready.pop()
+            self.positions[node] = self.next_position
+            self.next_position += 1
+            for edge, effect in self.adjacency_index.out_edges.get(node, {}).items():
+                if edge not in self.ignored_edges:
+                    in_degrees[effect] -= 1
+                    if in_degrees[effect] == 0:
+                        ready.append(effect)
+        if len(self.positions) < len(in_degrees):
+            self.positions = {node: position for position, node in enumerate(in_degrees)}
+            self.next_position = len(self.positions)
+            self.ignored_edges = set(self.adjacency_index.edge_ends)
+            for edge, (cause, effect) in self.adjacency_index.edge_ends.items():
+                self.add_edge(edge, cause, effect)
+
+
+    def _position(self, node: int) -> int:
+        """Returns the position of the node, new nodes are appended to the order."""
+        position = self.positions.get(node)
+        if position is None:
+            position = self.positions[node] = self.next_position
+            self.next_position += 1
+        return position
+
+
+    def is_exempt(self, time_lag_s: float) -> bool:
+        """True if edges with the time lag are exempt from the order."""
+        return self.exempt_time_lagged and time_lag_s is not None and time_lag_s > 0
+
+
+    def would_create_cycle(self, cause: int, effect: int, ignored_edge: int = None) -> bool:
+        """Checks if an edge from 'cause' to 'effect' would close a cycle, i.e. if 'cause' is reachable from
+        'effect'. Only the nodes positioned between effect and cause are visited.
+
+        :param cause: storid of the cause
+        :type cause: int
+        :param effect: storid of the effect
+        :type effect: int
+        :param ignored_edge: storid of an edge to ignore (e.g. the edge to be changed), defaults to None
+        :type ignored_edge: int, optional
+        :return: True if the edge would close a cycle
+        :rtype: bool
+        """
+        if cause == effect:
+            return True
+        cause_position = self.positions.get(cause)
+        effect_position = self.positions.get(effect)
+        if cause_position is None or effect_position is None or cause_position < effect_position:
+            return False
+        return self._search(effect, cause_position, forward=True, target=cause, ignored_edge=ignored_edge) is None
+
+
+    def add_edge(self, edge: int, cause: int, effect: int) -> None:
+        """Updates the order after the edge was added to the adjacency."""
+        self.ignored_edges.discard(edge)
+        if self.exempt_time_lagged and self.has_time_lag_storid is not None:
+            time_lags = self.store.graph.execute("SELECT o FROM datas WHERE s = ? AND p = ?",
+                                                 (edge, self.has_time_lag_storid)).fetchall()
+            if any(self.is_exempt(time_lag) for time_lag, in time_lags):
+                self.ignored_edges.add(edge)
+                return
+        cause_position = self._position(cause)
+        effect_position = self._position(effect)
+        if cause_position < effect_position:
+            return
+        # Nodes reachable from the effect (up to the cause) and nodes reaching the cause (down to the effect)
+        forward = self._search(effect, cause_position, forward=True, target=cause) if cause != effect else None
+        if forward is None:
+            self.ignored_edges.add(edge)
+            self.logger.warning(f"CausalEdge '{self.store._unabbreviate(edge)}' closes a cycle. It is ignored by the topological order.")
+            return
+        backward = self._search(cause, effect_position, forward=False)
+        # Reassign the positions of the affected nodes: first the backward set, then the forward set
+        affected = sorted(backward, key=self.positions.get) + sorted(forward, key=self.positions.get)
+        for node, position in zip(affected, sorted(self.positions[node] for node in affected)):
+            self.positions[node] = position
+
+
+    def remove_edge(self, edge: int) -> None:
+        """Updates the order after the edge was removed from the adjacency (the order stays valid)."""
+        self.ignored_edges.discard(edge)
+
+
+    def _search(self, start: int, bound: int, forward: bool, target: int = None, ignored_edge: int = None) -> list:
+        """Depth first search from 'start' along the (forward or backward) edges of the order, visiting only nodes
+        positioned before (forward) or after (backward) 'bound'. Returns the visited nodes, None if 'target' was reached."""
+        adjacency = self.adjacency_index.out_edges if forward else self.adjacency_index.in_edges
+        visited = {start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for edge, neighbor in adjacency.get(node, {}).items():
+                if edge in self.ignored_edges or edge == ignored_edge or neighbor in visited:
+                    continue
+                if neighbor == target:
+                    return None
+                neighbor_position = self.positions[neighbor]
+                if (forward and neighbor_position < bound) or (not forward and neighbor_position > bound):
+                    visited.add(neighbor)
+                    stack.append(neighbor)
+        return list(visited)
+
+
+class AdjacencyIndex():
+    """Forward and reverse adjacency of the nodes connected by CausalEdges, built from the
+    'hasCause'/'hasEffect' triples. All entries are storids:
+    'out_edges[cause] = {edge: effect}', 'in_edges[effect] = {edge: cause}' and 'edge_ends[edge] = (cause, effect)'.
+    The inner dicts keep the insertion order of the edges. Edges with only one of 'hasCause'/'hasEffect' set are
+    indexed at that end only: 'dangling_edges[node] = {edge: None}' and 'dangling_ends[edge] = node'. The ReachabilityIndex and the TopologicalOrder
+    are built on first request (see 'get_reachability'/'get_topological_order') and kept up to date from then on."""
+    def __init__(self, has_cause_storid: int, has_effect_storid: int) -> None:
+        self.has_cause_storid = has_cause_storid
+        self.has_effect_storid = has_effect_storid
+        self.out_edges = {}
+        self.in_edges = {}
+        self.edge_ends = {}
+        self.dangling_edges = {}
+        self.dangling_ends = {}
+        self.reachability = None
+        self.topological_order = None
+
+
+    def add_edge(self, edge: int, cause: int, effect: int) -> None:
+        """Adds (or moves) the edge from 'cause' to 'effect'."""
+        if edge in self.edge_ends or edge in self.dangling_ends:
+            self.remove_edge(edge)
+        self.edge_ends[edge] = (cause, effect)
+        self.out_edges.setdefault(cause, {})[edge] = effect
+        self.in_edges.setdefault(effect, {})[edge] = cause
+        if self.reachability is not None:
+            self.reachability.add_edge(cause, effect)
+        if self.topological_order is not None:
+            self.topological_order.add_edge(edge, cause, effect)
+
+
+    def add_dangling_edge(self, edge: int, node: int) -> None:
+        """Adds (or moves) the edge with only one end set, connected to 'node'."""
+        if edge in self.edge_ends or edge in self.dangling_ends:
+            self.remove_edge(edge)
+        self.dangling_ends[edge] = node
+        self.dangling_edges.setdefault(node, {})[edge] = None
+
+
+    def remove_edge(self, edge: int) -> tuple:
+        """Removes the edge, returns its (cause, effect) or None if it was not indexed (or dangling)."""
+        ends = self.edge_ends.pop(edge, None)
+        if ends is None:
+            node = self.dangling_ends.pop(edge, None)
+            if node is not None:
+                del self.dangling_edges[node][edge]
+                if len(self.dangling_edges[node]) == 0:
+                    del self.dangling_edges[node]
+            return None
+        cause, effect = ends
+        for adjacency, node in ((self.out_edges, cause), (self.in_edges, effect)):
+            node_edges = adjacency[node]
+            del node_edges[edge]
+            if len(node_edges) == 0:
+                del adjacency[node]
+        if self.reachability is not None:
+            self.reachability.remove_edge(cause, effect)
+        if self.topological_order is not None:
+            self.topological_order.remove_edge(edge)
+        return ends
+
+
+    def remove_node(self, node: int) -> None:
+        """Removes the node: its edges keep only their other end (dangling), its dangling edges are removed."""
+        for edge in self.edges_of_node(node):
+            ends = self.remove_edge(edge)
+            if ends is not None and ends[0] != ends[1]:
+                self.add_dangling_edge(edge, ends[1] if ends[0] == node else ends[0])
+
+
+    def edges_of_node(self, node: int) -> list:
+        """Returns all edges from and to the node, including the dangling ones, each once."""
+        return list(dict.fromkeys([*self.out_edges.get(node, ()), *self.in_edges.get(node, ()),
+                                   *self.dangling_edges.get(node, ())]))
+
+
+    def get_reachability(self) -> ReachabilityIndex:
+        """Returns the reachability index, builds it on first request."""
+        if self.reachability is None:
+            self.reachability = ReachabilityIndex(self)
+        return self.reachability
+
+
+    def get_topological_order(self, store: owlready2.World, exempt_time_lagged: bool = False,
+                              logger: Logger = INDEX_LOGGER) -> TopologicalOrder:
+        """Returns the topological order, builds it on first request (or if 'exempt_time_lagged' changed)."""
+        if self.topological_order is None or self.topological_order.exempt_time_lagged != exempt_time_lagged:
+            self.topological_order = TopologicalOrder(self, store, exempt_time_lagged, logger=logger)
+        return self.topological_order
+
+
+def would_create_cycle(cause: owlready2.Thing, effect: owlready2.Thing, store: owlready2.World, time_lag_s: float = None,
+                       exempt_time_lagged: bool = False, ignored_edge: owlready2.Thing = None, logger: Logger = INDEX_LOGGER) -> bool:
+    """Checks if a CausalEdge from 'cause' to 'effect' would close a cycle, using the incremental
+    topological order of the store (built on first use).
+
+    :param cause: The cause node
+    :type cause: owlready2.Thing
+    :param effect: The effect node
+    :type effect: owlready2.Thing
+    :param store: Store containing the nodes
+    :type store: owlready2.World
+    :param time_lag_s: Time lag of the edge, defaults to None
+    :type time_lag_s: float, optional
+    :param exempt_time_lagged: If True, edges with a time lag > 0 never close a cycle and are ignored in the order, defaults to False
+    :type exempt_time_lagged: bool, optional
+    :param ignored_edge: Existing edge to ignore, e.g. if it is the edge to be changed, defaults to None
+    :type ignored_edge: owlready2.Thing, optional
+    :param logger: Logger Object, defaults to INDEX_LOGGER
+    :type logger: Logger, optional
+    :return: True if the edge would close a cycle
+    :rtype: bool
+    """
+    order = owlutils.get_adjacency_index(store).get_topological_order(store, exempt_time_lagged, logger=logger)
+    if order.is_exempt(time_lag_s):
+        return False
+    return order.would_create_cycle(cause.storid, effect.storid, None if ignored_edge is None else ignored_edge.storid)
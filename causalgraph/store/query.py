@@ -0,0 +1,264 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: MIT
+
+""" Contains Query Class to query the causal structure of the store.
+Store is equivalent to owlready2 World """
+
+# general imports
+from logging import Logger
+import owlready2
+from typing import Union, Iterator
+# causalgraph imports
+import causalgraph.utils.owlready2_utils as owlutils
+from causalgraph.utils.misc_utils import strict_types
+from causalgraph.utils.logging_utils import init_logger
+
+
+class Query():
+    """ Contains all methods to query the causal structure (neighbors, ancestors, descendants and paths
+    between CausalNodes) of the store. Neighbors are answered from the per-store adjacency index in O(degree)
+    of the node, ancestors and descendants from its reachability index (built on first use). """
+    def __init__(self, store: owlready2.World, logger: Logger = None) -> None:
+        self.store = store
+        if logger is not None:
+            self.logger = logger
+        else:
+            self.logger = init_logger("Query")
+        self.logger.debug("Initialized the 'query' functionalities.")
+
+
+    @strict_types
+    def parents(self, node: Union[str, owlready2.Thing]) -> list:
+        """Returns the causes of all CausalEdges with 'node' as effect.
+
+        :param node: The node object or its name
+        :type node: Union[str, owlready2.Thing]
+        :return: List of the parent nodes (each once, in the order of the edges) or None if the node does not exist
+        :rtype: list
+        """
+        node_storid = self._get_node_storid(node)
+        if node_storid is None:
+            return None
+        in_edges = owlutils.get_adjacency_index(self.store).in_edges.get(node_storid, {})
+        return self._to_objects(dict.fromkeys(in_edges.values()))
+
+
+    @strict_types
+    def children(self, node: Union[str, owlready2.Thing]) -> list:
+        """Returns the effects of all CausalEdges with 'node' as cause.
+
+        :param node: The node object or its name
+        :type node: Union[str, owlready2.Thing]
+        :return: List of the child nodes (each once, in the order of the edges) or None if the node does not exist
+        :rtype: list
+        """
+        node_storid = self._get_node_storid(node)
+        if node_storid is None:
+            return None
+        out_edges = owlutils.get_adjacency_index(self.store).out_edges.get(node_storid, {})
+        return self._to_objects(dict.fromkeys(out_edges.values()))
+
+
+    @strict_types
+    def in_edges(self, node: Union[str, owlready2.Thing]) -> list:
+        """Returns all CausalEdges with 'node' as effect.
+
+        :param node: The node object or its name
+        :type node: Union[str, owlready2.Thing]
+        :return: List of the incoming edges or None if the node does not exist
+        :rtype: list
+        """
+        node_storid = self._get_node_storid(node)
+        if node_storid is None:
+            return None
+        return self._to_objects(owlutils.get_adjacency_index(self.store).in_edges.get(node_storid, {}))
+
+
+    @strict_types
+    def out_edges(self, node: Union[str, owlready2.Thing]) -> list:
+        """Returns all CausalEdges with 'node' as cause.
+
+        :param node: The node object or its name
+        :type node: Union[str, owlready2.Thing]
+        :return: List of the outgoing edges or None if the node does not exist
+        :rtype: list
+        """
+        node_storid = self._get_node_storid(node)
+        if node_storid is None:
+            return None
+        return self._to_objects(owlutils.get_adjacency_index(self.store).out_edges.get(node_storid, {}))
+
+
+    @strict_types
+    def ancestors(self, node: Union[str, owlready2.Thing]) -> list:
+        """Returns all nodes from which 'node' can be reached via CausalEdges (its direct and
+        indirect causes). The node itself is not included, even if it is part of a cycle.
+
+        :param node: The node object or its name
+        :type node: Union[str, owlready2.Thing]
+        :return: List of the ancestor nodes or None if the node does not exist
+        :rtype: list
+        """
+        node_storid = self._get_node_storid(node)
+        if node_storid is None:
+            return None
+        reachability = owlutils.get_adjacency_index(self.store).get_reachability()
+        ancestors = reachability.nodes_of(reachability.ancestors.get(node_storid, 0))
+        return self._to_objects(ancestor for ancestor in ancestors if ancestor != node_storid)
+
+
+    @strict_types
+    def descendants(self, node: Union[str, owlready2.Thing]) -> list:
+        """Returns all nodes which can be reached from 'node' via CausalEdges (its direct and
+        indirect effects). The node itself is not included, even if it is part of a cycle.
+
+        :param node: The node object or its name
+        :type node: Union[str, owlready2.Thing]
+        :return: List of the descendant nodes or None if the node does not exist
+        :rtype: list
+        """
+        node_storid = self._get_node_storid(node)
+        if node_storid is None:
+            return None
+        reachability = owlutils.get_adjacency_index(self.store).get_reachability()
+        descendants = reachability.nodes_of(reachability.descendants.get(node_storid, 0))
+        return self._to_objects(descendant for descendant in descendants if descendant != node_storid)
+
+
+    @strict_types
+    def is_reachable(self, source: Union[str, owlready2.Thing], target: Union[str, owlready2.Thing]) -> bool:
+        """Checks if 'source' is upstream of 'target', i.e. if there is a path of CausalEdges from
+        'source' to 'target'. A node reaches itself (trivial path).
+
+        :param source: The source node object or its name
+        :type source: Union[str, owlready2.Thing]
+        :param target: The target node object or its name
+        :type target: Union[str, owlready2.Thing]
+        :return: True if 'target' is reachable from 'source', None if one of the nodes does not exist
+        :rtype: bool
+        """
+        source_storid = self._get_node_storid(source)
+        target_storid = self._get_node_storid(target)
+        if source_storid is None or target_storid is None:
+            return None
+        if source_storid == target_storid:
+            return True
+        return owlutils.get_adjacency_index(self.store).get_reachability().is_reachable(source_storid, target_storid)
+
+
+    @strict_types
+    def paths(self, source: Union[str, owlready2.Thing], target: Union[str, owlready2.Thing], max_len: int = None,
+              max_total_lag_s: float = None, min_confidence: float = None) -> Iterator:
+        """Enumerates all simple paths (no node twice) of CausalEdges from 'source' to 'target' lazily.
+        Each path is a list of CausalEdges, parallel edges result in separate paths. The search is pruned
+        early: only nodes from which 'target' is reachable are visited (checked with the reachability index, which
+        is not built for searches bounded by 'max_len') and a path is abandoned as soon as it exceeds one of the
+        limits. A missing hasTimeLag counts as 0 s, a missing hasConfidence as 1.0.
+
+        Example:
+        for path in graph.query.paths("root_cause", "alarm", max_total_lag_s=60.0, min_confidence=0.5):
+            ...
+
+        :param source: The source node object or its name
+        :type source: Union[str, owlready2.Thing]
+        :param target: The target node object or its name
+        :type target: Union[str, owlready2.Thing]
+        :param max_len: Maximum number of edges of a path, defaults to None (unlimited)
+        :type max_len: int, optional
+        :param max_total_lag_s: Maximum sum of the hasTimeLag of all edges of a path, defaults to None (unlimited)
+        :type max_total_lag_s: float, optional
+        :param min_confidence: Minimum product of the hasConfidence of all edges of a path, defaults to None (unlimited)
+        :type min_confidence: float, optional
+        :return: Iterator over the paths (lists of CausalEdges) or None if one of the nodes does not exist
+        :rtype: Iterator
+        """
+        source_storid = self._get_node_storid(source)
+        target_storid = self._get_node_storid(target)
+        if source_storid is None or target_storid is None:
+            return None
+        return self._iter_paths(source_storid, target_storid, max_len, max_total_lag_s, min_confidence)
+
+
+    def _iter_paths(self, source: int, target: int, max_len: int, max_total_lag_s: float, min_confidence: float) -> Iterator:
+        """Depth first search for 'paths' on the adjacency index, yields the paths as lists of CausalEdges.
+        Nodes from which 'target' is not reachable are pruned with the reachability index. If 'max_len' bounds
+        the search, the index is only used if it is built already, as building it costs more than a short search."""
+        adjacency_index = owlutils.get_adjacency_index(self.store)
+        if source == target or (max_len is not None and max_len < 1):
+            return
+        reachability = adjacency_index.reachability if max_len is not None else adjacency_index.get_reachability()
+        if reachability is not None:
+            if not reachability.is_reachable(source, target):
+                return
+            target_bit = reachability.bit(target)
+            leads_to_target = lambda node: node == target or reachability.descendants.get(node, 0) & target_bit
+        else:
+            leads_to_target = lambda node: True
+        # Properties missing in the store count as 0 s time lag and 1.0 confidence
+        value_props = {}
+        for prop_name in ("hasTimeLag", "hasConfidence"):
+            prop = owlutils.get_entity_from_cache_by_name(prop_name, self.store, suppress_warn=True)
+            if prop is not None:
+                value_props[prop.storid] = prop_name
+        edge_values = {}
+        def get_edge_values(edge: int) -> tuple:
+            # (time lag, confidence) of the edge, read once per edge
+            values = edge_values.get(edge)
+            if values is None:
+                props = {}
+                if value_props:
+                    props = dict(self.store.graph.execute(f"SELECT p, o FROM datas WHERE s = ? AND p IN ({','.join('?' * len(value_props))})",
+                                                          (edge, *value_props)))
+                props = {value_props[storid]: value for storid, value in props.items()}
+                values = edge_values[edge] = (props.get("hasTimeLag", 0.0), props.get("hasConfidence", 1.0))
+            return values
+        # Stack of the nodes of the current path with their out edges still to visit and the lag and confidence up to the node
+        path = []
+        on_path = {source}
+        stack = [(source, iter(list(adjacency_index.out_edges.get(source, {}).items())), 0.0, 1.0)]
+        while stack:
+            _, out_edges, total_lag, total_confidence = stack[-1]
+            for edge, effect in out_edges:
+                if effect in on_path or not leads_to_target(effect):
+                    continue
+                time_lag, confidence = get_edge_values(edge)
+                if max_total_lag_s is not None and total_lag + time_lag > max_total_lag_s:
+                    continue
+                if min_confidence is not None and total_confidence * confidence < min_confidence:
+                    continue
+                if effect == target:
+                    yield [self.store._get_by_storid(path_edge) for path_edge in path + [edge]]
+                    continue
+                if max_len is not None and len(path) + 1 >= max_len:
+                    continue
+                path.append(edge)
+                on_path.add(effect)
+                stack.append((effect, iter(list(adjacency_index.out_edges.get(effect, {}).items())),
+                              total_lag + time_lag, total_confidence * confidence))
+                break
+            else:
+                node = stack.pop()[0]
+                on_path.discard(node)
+                if path:
+                    path.pop()
+
+
+    def _get_node_storid(self, node: Union[str, owlready2.Thing]) -> int:
+        """Returns the storid of the node, logs an error and returns None if it does not exist.
+
+        :param node: The node object or its name
+        :type node: Union[str, owlready2.Thing]
+        :return: storid of the node
+        :rtype: int
+        """
+        node_name, node_obj = owlutils.get_name_and_object(node, self.store, suppress_warn=True)
+        if node_obj is None:
+            self.logger.error(f"Node '{node_name if node_name is not None else node}' does not exist.")
+            return None
+        return node_obj.storid
+
+
+    def _to_objects(self, storids) -> list:
+        """Returns the entities of the storids (iterable) as list."""
+        return [self.store._get_by_storid(storid) for storid in storids]
@@ -172,9 +172,11 @@ class Remove():
             self.logger.error(error_msg)
             return False
         # Delete entity if both prerequisites are met based on type
+        owlutils.remove_from_name_index(individual_obj, self.store)
+        owlutils.remove_from_adjacency_index(individual_obj, self.store)
         owlready2.destroy_entity(individual_obj)
-        self.logger.info(f"Deleted entity '{individual_name}' of class '{individual_obj.is_a}'")
-        self.store.save()
+        self.logger.info("Deleted entity '%s' of class '%s'", individual_name, individual_obj.is_a)
+        owlutils.save_store(self.store)
         return True
 
 
@@ -202,9 +204,11 @@ class Remove():
         elif owlutils.is_instance_of_type(entity_str, 'CausalEdge', self.store, include_subtypes=True, logger=self.logger):
             return self.causal_edge(entity_str)
         else:
+            owlutils.remove_from_name_index(entity, self.store)
+            owlutils.remove_from_adjacency_index(entity, self.store)
             owlready2.destroy_entity(entity)
-            self.logger.info(f"Deleted entity '{entity_str}' of class '{entity.is_a}'")
-            self.store.save()
+            self.logger.info("Deleted entity '%s' of class '%s'", entity_str, entity.is_a)
+            owlutils.save_store(self.store)
             return True
 
 
@@ -218,52 +222,27 @@ class Remove():
         :return: a list of all edges between 'hasCause' and 'hasEffect'
         :rtype: list of all causal_edges
         """
-        causal_node1_iri = owlutils.get_entity_by_name(causal_node1, self.store, self.logger).iri
-        causal_node2_iri = owlutils.get_entity_by_name(causal_node2, self.store, self.logger).iri
-        list_causal_edges = list(self.store.sparql("""
-            SELECT ?CausalEdge
-            WHERE {
-            """ + f"""
-            <{causal_node1_iri}> ^{self.classes_onto_prefix}:hasCause ?CausalEdge .
-            <{causal_node2_iri}> ^{self.classes_onto_prefix}:hasEffect ?CausalEdge 
-            """ + "}"
-            ))
-        list_causal_edges_the_other_way = list(self.store.sparql("""
-            SELECT ?CausalEdge
-            WHERE {
-            """ + f"""
-            <{causal_node1_iri}> ^{self.classes_onto_prefix}:hasEffect ?CausalEdge .
-            <{causal_node2_iri}> ^{self.classes_onto_prefix}:hasCause ?CausalEdge 
-            """ + "}"
-            ))
-        list_edges = list_causal_edges_the_other_way + list_causal_edges
-        return list_edges
+        causal_node1_storid = owlutils.get_entity_by_name(causal_node1, self.store, self.logger).storid
+        causal_node2_storid = owlutils.get_entity_by_name(causal_node2, self.store, self.logger).storid
+        adjacency_index = owlutils.get_adjacency_index(self.store)
+        edges_the_other_way = [edge for edge, cause in adjacency_index.in_edges.get(causal_node1_storid, {}).items()
+                               if cause == causal_node2_storid]
+        edges = [edge for edge, effect in adjacency_index.out_edges.get(causal_node1_storid, {}).items()
+                 if effect == causal_node2_storid and edge not in edges_the_other_way]
+        # Same format as a SPARQL result: [[edge1], [edge2], ..]
+        return [[self.store._get_by_storid(edge)] for edge in edges_the_other_way + edges]
 
 
     def _list_of_all_causal_edges_from_one_node(self, causal_node: str) -> list:
-        """Returns a list of all CausalNodes which are connected with 'causal_node'
+        """Returns a list of all CausalEdges which are connected with 'causal_node'
 
         :param causal_node: class name/type of individual
         :type causal_node: str
         :return: a list of all edges on 'causalNode'
         :rtype: list
         """
-        # get nodes that are connected to the specified node via incoming or outgoing edges
-        causal_node_iri = owlutils.get_entity_by_name(causal_node, self.store, self.logger).iri
-        list_nodes_has_cause = list(self.store.sparql ("""
-            SELECT ?CausalEdge
-            WHERE {
-            """ + f"""
-            <{causal_node_iri}> ^{self.classes_onto_prefix}:hasCause ?CausalEdge . 
-            """ + "}"
-            ))
-        list_nodes_has_effect = list(self.store.sparql ("""
-            SELECT ?CausalEdge
-            WHERE {
-            """ + f"""
-            <{causal_node_iri}> ^{self.classes_onto_prefix}:hasEffect ?CausalEdge . 
-            """ + "}"
-            ))
-        result = list_nodes_has_cause + list_nodes_has_effect
-        return result
-        
\ No newline at end of file
+        # get edges that are connected to the specified node as outgoing or incoming edges (also with only one end set)
+        causal_node_storid = owlutils.get_entity_by_name(causal_node, self.store, self.logger).storid
+        edges = owlutils.get_adjacency_index(self.store).edges_of_node(causal_node_storid)
+        # Same format as a SPARQL result: [[edge1], [edge2], ..]
+        return [[self.store._get_by_storid(edge)] for edge in edges]
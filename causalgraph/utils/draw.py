@@ -35,24 +35,23 @@ class Draw():
         :param graph_dict: A properties dict that describes a graph with its nodes, edges and creators, defaults to None
         :type graph_dict: dict, optional
         """
-        graph_dict = self.graph.map.all_individuals_to_dict()
         G_nx = self.graph.export.nx()
         edge_labels = {}
         # Get edge labels and fill dict edge_labels with them
-        for individual in graph_dict:
-            individual_type = graph_dict[individual]["type"]
-            if individual_type == "CausalEdge":
-                cause = graph_dict[individual].get("hasCause", None)
-                effect = graph_dict[individual].get("hasEffect", None)
-                timelag = graph_dict[individual].get("hasTimeLag", None)
-                confidence = graph_dict[individual].get("hasConfidence", None)
-                # Append to edge_labels dict
-                if confidence is None and timelag is not None:
-                    edge_labels[(cause, effect)] = f"Timelag: {timelag}"
-                if confidence is not None and timelag is None:
-                    edge_labels[(cause, effect)] = f"Confidence: {confidence}"
-                if confidence is not None and timelag is not None:
-                    edge_labels[(cause, effect)] = f"Timelag: {timelag}\nConfidence: {confidence}"
+        edge_records = self.graph.map.iter_individuals(kinds="CausalEdge",
+                                                       props=["hasCause", "hasEffect", "hasTimeLag", "hasConfidence"])
+        for _, edge_props in edge_records:
+            cause = edge_props.get("hasCause", None)
+            effect = edge_props.get("hasEffect", None)
+            timelag = edge_props.get("hasTimeLag", None)
+            confidence = edge_props.get("hasConfidence", None)
+            # Append to edge_labels dict
+            if confidence is None and timelag is not None:
+                edge_labels[(cause, effect)] = f"Timelag: {timelag}"
+            if confidence is not None and timelag is None:
+                edge_labels[(cause, effect)] = f"Confidence: {confidence}"
+            if confidence is not None and timelag is not None:
+                edge_labels[(cause, effect)] = f"Timelag: {timelag}\nConfidence: {confidence}"
         # Create plot
         pos = nx.spring_layout(G_nx, k=2, seed=5)
         plt.figure()
@@ -86,22 +85,23 @@ class Draw():
         :type graph_dict: dict, optional
         """
 
-        # If graph_dict hasn't been parsed, just create it for the whole graph.
+        # If graph_dict hasn't been parsed, just stream the needed properties of the whole graph.
         if graph_dict is None:
-            #graph_dict = all_individuals_to_dict(self.graph.store)
-            graph_dict = self.graph.map.all_individuals_to_dict()
+            individual_records = self.graph.map.iter_individuals(props=["type", "hasCause", "hasEffect", "hasTimeLag",
+                                                                        "hasConfidence", "message", "errorCode"])
+        else:
+            individual_records = graph_dict.items()
 
         nodes_html = []
         edges_html = []
-        for individual in graph_dict:
-            individual_name = individual
-            individual_type = graph_dict[individual]["type"]
+        for individual_name, individual_props in individual_records:
+            individual_type = individual_props["type"]
             if "CausalNode" in individual_type:
                 # Generate node dict for visjs
                 node = {'id': individual_name, 'label': individual_name, 'type': 'node', 'color': '#6fd0a7'}
                 try:
-                    message = graph_dict[individual]['message']
-                    errorCode = graph_dict[individual]['errorCode']
+                    message = individual_props['message']
+                    errorCode = individual_props['errorCode']
                     node['title']=f"{message}|{errorCode}"
                 except KeyError:
                     pass
@@ -109,10 +109,10 @@ class Draw():
                 nodes_html.append(node)
             if "CausalEdge" in individual_type:
                 edge = None
-                cause = graph_dict[individual].get("hasCause", None)
-                effect = graph_dict[individual].get("hasEffect", None)
-                timelag = graph_dict[individual].get("hasTimeLag", None)
-                confidence = graph_dict[individual].get("hasConfidence", None)
+                cause = individual_props.get("hasCause", None)
+                effect = individual_props.get("hasEffect", None)
+                timelag = individual_props.get("hasTimeLag", None)
+                confidence = individual_props.get("hasConfidence", None)
                 if ((cause and effect) is not None) and ((confidence and timelag) is None):
                     edge  = {'from': cause,'to': effect}
                 if ((cause and effect and confidence) is not None) and (timelag is None):
@@ -125,7 +125,7 @@ class Draw():
             #if individual_type == "Creator":
             #    creator = {'id': individual_name, 'label': individual_name, 'type': 'creator', 'color': '#f9cbb6'}
             #    created_by_node = []
-            #    for node in graph_dict[individual].get("created", [None]):
+            #    for node in individual_props.get("created", [None]):
             #        if node is not None:
             #            edge = {'from': individual_name,'to': node,'label':f"created"}
             #            edges_html.append(edge)
@@ -7,18 +7,104 @@
 
 # general imports
 import os
+import copy
+import time
+import queue
+import atexit
+from collections import OrderedDict
 import logging
+import logging.handlers
 import ecs_logging
 # causalgraph imports
 from causalgraph.utils.misc_utils import get_project_root
 
 
+class DeferredFormatQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that only merges the message with its arguments on the caller's thread.
+    Formatting (e.g. the ecs json serialization incl. exception info) is done by the handlers
+    of the QueueListener on its own thread. The listener is kept as 'handler.listener'.
+    """
+    listener: logging.handlers.QueueListener = None
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def stop_queue_listener(logger: logging.Logger) -> None:
+    """Stops the QueueListeners of the logger's queue handlers. All queued records are written
+    before this function returns. Is called automatically at exit.
+
+    :param logger: Logger initialized with 'init_logger(..., queue_handler=True)'
+    :type logger: logging.Logger
+    """
+    for handler in logger.handlers:
+        if isinstance(handler, DeferredFormatQueueHandler) and handler.listener is not None:
+            handler.listener.stop()
+            handler.listener = None
+
+
+class DuplicateLogFilter(logging.Filter):
+    """Logger filter that drops repeated records with the same level and message, e.g. the same
+    warning emitted for thousands of individuals during a bulk import. The first occurrence passes,
+    repeats are only counted. The next occurrence after 'interval_s' passes with a summary of the
+    suppressed repeats appended. At most 'max_messages' distinct messages are tracked (least
+    recently seen are dropped), so memory stays bounded.
+    """
+    def __init__(self, interval_s: float = 10.0, max_messages: int = 1024) -> None:
+        super().__init__()
+        self.interval_s = interval_s
+        self.max_messages = max_messages
+        # {(level, message): [time of last passed record, suppressed repeats since then]}
+        self.seen_messages = OrderedDict()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if getattr(record, "dedup_summary", False):
+            return True
+        key = (record.levelno, record.getMessage())
+        now = time.monotonic()
+        seen = self.seen_messages.get(key)
+        if seen is None:
+            self.seen_messages[key] = [now, 0]
+            if len(self.seen_messages) > self.max_messages:
+                self.seen_messages.popitem(last=False)
+            return True
+        self.seen_messages.move_to_end(key)
+        if now - seen[0] < self.interval_s:
+            seen[1] += 1
+            return False
+        if seen[1] > 0:
+            record.msg = f"{key[1]} [suppressed {seen[1]} repeats in the last {now - seen[0]:.0f} s]"
+            record.args = None
+        self.seen_messages[key] = [now, 0]
+        return True
+
+    def flush(self, logger: logging.Logger) -> None:
+        """Emits a summary for every message with suppressed repeats, e.g. at the end of a bulk import.
+
+        :param logger: Logger to emit the summaries with
+        :type logger: logging.Logger
+        """
+        now = time.monotonic()
+        for (level, message), seen in self.seen_messages.items():
+            if seen[1] > 0:
+                logger.log(level, "%s [suppressed %d repeats in the last %.0f s]", message, seen[1],
+                           now - seen[0], extra={"dedup_summary": True})
+                seen[0], seen[1] = now, 0
+
+
 def init_logger(logger_name: str,
                 console_handler_level= logging.WARNING,
                 file_handler= False,
                 file_handler_level= logging.DEBUG,
                 elastic_style_json= True,
-                log_file_dir= None) -> logging.Logger:
+                log_file_dir= None,
+                queue_handler= False,
+                max_bytes= 0,
+                backup_count= 5,
+                dedup_interval_s= None) -> logging.Logger:
     """Initializes a  logger named 'loggerName' with a file handler
     creating 'loggerName.log' and a console handler.
 
@@ -37,6 +123,16 @@ def init_logger(logger_name: str,
     :param log_file_dir: Path to directory, where log-file should be kept if fileHandler=True,
     defaults to '{project_root}/data/logs/{logger_name}.{log/json}'
     :type log_file_dir: str, optional
+    :param queue_handler: Switch to write the logfile on a separate thread via QueueHandler and
+    QueueListener, so that logging does not block the caller, defaults to False
+    :type queue_handler: bool, optional
+    :param max_bytes: Size in bytes at which the logfile is rotated, 0 for no rotation, defaults to 0
+    :type max_bytes: int, optional
+    :param backup_count: Number of rotated logfiles to keep (needs max_bytes > 0), defaults to 5
+    :type backup_count: int, optional
+    :param dedup_interval_s: If set, repeated records with the same message are suppressed and
+    summarized at most once per interval (see DuplicateLogFilter), defaults to None
+    :type dedup_interval_s: float, optional
     :return: Logger instance
     :rtype: logging.Logger
     """
@@ -44,6 +140,10 @@ def init_logger(logger_name: str,
     logger = logging.getLogger(logger_name)
     logger.setLevel(console_handler_level)
 
+    # Add filter for repeated messages if specified
+    if dedup_interval_s is not None and not any(isinstance(x, DuplicateLogFilter) for x in logger.filters):
+        logger.addFilter(DuplicateLogFilter(interval_s=dedup_interval_s))
+
     # Create human readable format
     format_str = '%(asctime)s %(levelname)-7s %(message)s [%(filename)s:%(lineno)d]'
     human_readable_formatter = logging.Formatter(format_str)
@@ -71,12 +171,24 @@ def init_logger(logger_name: str,
         else:
             log_file_path = os.path.join(log_file_dir, 'data', 'logs', f"{logger_name}.{log_suffix}")
             
-        # Create FileHandler (file logger)
-        # Check if FileHandler exists, adding one if False
-        if not any(isinstance(x, logging.FileHandler) for x in logger.handlers):
-            filehandler = logging.FileHandler(log_file_path)
+        # Create FileHandler (file logger, rotating if max_bytes > 0)
+        # Check if FileHandler or QueueHandler exists, adding one if False
+        if not any(isinstance(x, (logging.FileHandler, DeferredFormatQueueHandler)) for x in logger.handlers):
+            filehandler = logging.handlers.RotatingFileHandler(log_file_path, maxBytes=max_bytes,
+                                                               backupCount=backup_count)
             filehandler.setLevel(file_handler_level)
             filehandler.setFormatter(file_formatter)
-            logger.addHandler(filehandler)
+            if queue_handler is True:
+                # Only enqueue records on the caller's thread, format and write on the listener's thread
+                log_queue = queue.SimpleQueue()
+                deferred_handler = DeferredFormatQueueHandler(log_queue)
+                deferred_handler.setLevel(file_handler_level)
+                deferred_handler.listener = logging.handlers.QueueListener(log_queue, filehandler,
+                                                                           respect_handler_level=True)
+                deferred_handler.listener.start()
+                atexit.register(stop_queue_listener, logger)
+                logger.addHandler(deferred_handler)
+            else:
+                logger.addHandler(filehandler)
 
     return logger
@@ -5,15 +5,18 @@
 """ Contains functionalities to map a cg graph to and from a dictionary.
 """
 # general imports
+import time
 import owlready2
+from collections import defaultdict, deque
 from logging import Logger
-import networkx as nx
-import numpy as np
-
-from typing import Union
+from typing import Union, TYPE_CHECKING
 # causalgraph imports
 from causalgraph.utils.logging_utils import init_logger
 import causalgraph.utils.owlready2_utils as owlutils
+# networkx and numpy are only imported when mapping from/to them
+if TYPE_CHECKING:
+    import networkx as nx
+    import numpy as np
 
 
 class Mapping():
@@ -52,38 +55,78 @@ class Mapping():
         :return: Dict containing all individuals with their properties.
         :rtype: dict
         """
-        dict_graph = {}
-        # Get all CausalNodes and their subclasses
-        causalnodes_list = owlutils.get_all_causalnodes(self.graph.store)
-        # Get all CausalEdges
-        causaledges_list = owlutils.get_all_causaledges(self.graph.store)
-        # Handling all CausalNodes
-        for causalnode in causalnodes_list:
-            # Append the dict for single individuals to the dict of the whole graph
-            causalnode_prop_dict = self.__create_prop_dict_from_individual(individual=causalnode[0])
-            if len(causalnode_prop_dict) > 0:
-                dict_graph[causalnode[0].name] = causalnode_prop_dict
-        # Handling all CausalEdge
-        for causaledge in causaledges_list:
-            # Append the dict for single individuals to the dict of the whole graph
-            causaledge_prop_dict = self.__create_prop_dict_from_individual(individual=causaledge[0])
-            if len(causaledge_prop_dict) > 0:
-                dict_graph[causaledge[0].name] = causaledge_prop_dict
-        return dict_graph
-
-
-    def __create_prop_dict_from_individual(self, individual: owlready2.Thing) -> dict:
+        return dict(self.iter_individuals())
+
+
+    def iter_individuals(self, kinds: Union[str, list] = None, props: list = None, batch_size: int = None):
+        """Lazily yields the individuals of the graph and their properties as (name, props_dict) records,
+        CausalNodes first and CausalEdges afterwards. Individuals are only loaded from the store
+        when their record is requested, so large graphs can be processed with bounded memory.
+        'dict(map.iter_individuals())' equals 'map.all_individuals_to_dict()'.
+
+        Example:
+            for name, props_dict in graph.map.iter_individuals(kinds="CausalEdge", props=["hasCause", "hasEffect"]):
+                ...
+
+        :param kinds: Class name(s) of the individuals (incl. subclasses), defaults to ["CausalNode", "CausalEdge"]
+        :type kinds: Union[str, list], optional
+        :param props: Names of the properties to fetch (incl. 'type' and 'iri'), defaults to None (all properties)
+        :type props: list, optional
+        :param batch_size: If passed, lists of up to batch_size records are yielded instead of single records, defaults to None
+        :type batch_size: int, optional
+        :yield: (name, props_dict) records or lists of them
+        :rtype: Iterator[Union[tuple, list]]
+        """
+        if kinds is None:
+            kinds = ["CausalNode", "CausalEdge"]
+        elif isinstance(kinds, str):
+            kinds = [kinds]
+        batch = []
+        for kind in kinds:
+            kind_obj = owlutils.get_entity_by_name(kind, self.graph.store, logger=self.logger)
+            if kind_obj is None:
+                continue
+            for storid in owlutils.get_instance_storids(kind_obj, self.graph.store):
+                individual = self.graph.store._get_by_storid(storid)
+                if individual is None:
+                    continue
+                record = (individual.name, self.__create_prop_dict_from_individual(individual, props))
+                if batch_size is None:
+                    yield record
+                    continue
+                batch.append(record)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+
+
+    def __create_prop_dict_from_individual(self, individual: owlready2.Thing, props: list = None) -> dict:
         """Creates a properties dict of a single individual and returns it. 
         Multiple types of an individual are supported and will be added to the dict (e.G. [CausalNode, Error])
 
         :param individual: Individual object
         :type individual: owlready2.Thing
-        :param type: Object type (e. g. CausalNode, CausalEdge)
-        :type type: str
+        :param props: Names of the properties to add (incl. 'type' and 'iri'), defaults to None (all properties)
+        :type props: list, optional
         :raises ValueError: Unvalid property Error
         :return: Properties dict of single individual
         :rtype: dict
         """
+        if props is not None:
+            prop_dict = {}
+            for prop in props:
+                if prop == 'type':
+                    prop_dict['type'] = [type_.name for type_ in individual.is_a]
+                elif prop == 'iri':
+                    prop_dict['iri'] = individual.iri
+                else:
+                    # Properties without values are skipped, like in get_properties()
+                    prop_value = getattr(individual, prop, None)
+                    if prop_value is not None and prop_value != []:
+                        prop_dict[prop] = self.__extract_prop_value(prop_value)
+            return prop_dict
         prop_dict = {'type': [type_.name for type_ in individual.is_a], 'iri': individual.iri}
         # Iteratively fill the property dictionary
         possible_props = self.causalgraph_object_properties + self.causalgraph_data_properties + self.third_party_data_properties + self.third_party_object_properties
@@ -92,22 +135,29 @@ class Mapping():
             if prop.name not in possible_props:
                 raise ValueError(f'{prop.name} is not a valid property since it is not contained in the mapping_dict!')
             # Get value of the property
-            prop_value = getattr(individual, prop.name)
-            if type(prop_value) in [int, float, str]:
-                extracted_values = prop_value
-            else:
-                try:
-                    extracted_values = [i.name for i in prop_value]
-                except (TypeError, AttributeError):
-                    try:
-                        extracted_values = prop_value.name
-                    except (TypeError, AttributeError):
-                        extracted_values = prop_value
-            prop_dict[prop.name] = extracted_values
+            prop_dict[prop.name] = self.__extract_prop_value(getattr(individual, prop.name))
         return prop_dict
 
 
-    def graph_dict_from_nx(self, nx_graph: nx.MultiDiGraph) -> dict:
+    @staticmethod
+    def __extract_prop_value(prop_value):
+        """Converts a property value into its dict representation, individuals are replaced by their names.
+
+        :param prop_value: Value of a property
+        :return: Value, name or list of names
+        """
+        if type(prop_value) in [int, float, str]:
+            return prop_value
+        try:
+            return [i.name for i in prop_value]
+        except (TypeError, AttributeError):
+            try:
+                return prop_value.name
+            except (TypeError, AttributeError):
+                return prop_value
+
+
+    def graph_dict_from_nx(self, nx_graph: 'nx.MultiDiGraph') -> dict:
         """Generates a properties dict from a NetworkX MultiDiGraph. The edges must contain edge properties that
         matches the causalgraph or imported third party properties like "hasCause", "hasConfidence", "type" etc.
 
@@ -138,7 +188,7 @@ class Mapping():
         return graph_dict
 
 
-    def graph_dict_from_tigra(self, node_names: list, edge_names: dict, link_matrix: np.ndarray, q_matrix: np.ndarray, timestep_len_s: int) -> dict:
+    def graph_dict_from_tigra(self, node_names: list, edge_names: dict, link_matrix: 'np.ndarray', q_matrix: 'np.ndarray', timestep_len_s: int) -> dict:
         """Generates a properties dict from a Tigramite Graph representation. This method will only handle classic causalgraph
         properties like "hasCause", "hasEffect", "hasTimeLag" etc. Creators and third party properties will not be created.
         This method will not add a third party key/value pairs to the dict, as well as comments, creators or iris.
@@ -147,66 +197,82 @@ class Mapping():
         :type node_names: list
         :param edge_names: Dict of all edges with their cause/ effect pairs.
         :type edge_names: dict
-        :param link_matrix: The tigramite link matrix. Contains edges and their timelag.
-        :type link_matrix: np.ndarray
-        :param q_matrix: A tigramite PCMCI q_matrix
-        :type q_matrix: np.ndarray
+        :param link_matrix: The tigramite link matrix. Contains edges and their timelag. Dense or as SparseTigraMatrix.
+        :type link_matrix: Union[np.ndarray, SparseTigraMatrix]
+        :param q_matrix: A tigramite PCMCI q_matrix. Dense or as SparseTigraMatrix.
+        :type q_matrix: Union[np.ndarray, SparseTigraMatrix]
         :param timestep_len_s: Tigramite timestep length.
         :type timestep_len_s: int
         :return: Properties dict of whole Tigramite Graph representation.
         :rtype: dict
         """
+        import numpy as np
+        from causalgraph.store.export import SparseTigraMatrix
         graph_dict = {}
 
         # Compare number of nodes in link_matrix with the number of node_names
-        if len(link_matrix) != len(node_names):
+        sparse = isinstance(link_matrix, SparseTigraMatrix)
+        num_of_nodes_link_matrix = link_matrix.shape[0] if sparse else len(link_matrix)
+        if num_of_nodes_link_matrix != len(node_names):
             self.logger.error("Too few nodes in the link matrix or the list of node names.")
             return False
         # Add nodes without their properties to graph_dict
         for nodes in node_names:
             graph_dict[nodes] = {"type": ['CausalNode']}
+        # Get indices of all cause/effect pairs and timelags at once, ordered by cause, effect and timelag
+        cause_inds, effect_inds, lag_inds = link_matrix.nonzero() if sparse else np.nonzero(link_matrix)
+        if len(cause_inds) == 0:
+            return graph_dict
+        if isinstance(q_matrix, SparseTigraMatrix):
+            confidences = q_matrix.values_at(cause_inds, effect_inds, lag_inds)
+        else:
+            confidences = np.asarray(q_matrix)[cause_inds, effect_inds, lag_inds]
+        # Map each cause/effect pair to its edge names. Double edges between the same nodes
+        # are handed out in the order of edge_names.
+        edge_names_by_pair = defaultdict(deque)
+        for edge_name, cause_effect in edge_names.items():
+            edge_names_by_pair[(cause_effect.get("hasCause"), cause_effect.get("hasEffect"))].append(edge_name)
         # Handle all edges, also add missing node properties
-        for node_ind, matrix in enumerate(link_matrix):
-            # Get indices of cause/effect pair and timelag
-            possibly_edge = np.argwhere(matrix)
-            # Only handle matrices with edges and timelags
-            for edge in possibly_edge:
-                cause = node_names[node_ind]
-                effect = node_names[edge[0]]
-                # Get time_lag and convert it with timestep_len_s to cg timeframe
-                discrete_time_lag = edge[1]
-                time_lag = discrete_time_lag * timestep_len_s
-                # Get confidence
-                confidence = q_matrix[node_ind, edge[0], edge[1]]
-                # Get edge_name (dict key) with pair of cause and effect (values)
-                try:
-                    edge_name = list(edge_names.keys())[list(edge_names.values()).index({"hasCause": cause, "hasEffect": effect})]
-                    # Make sure doubles edges can be handled correctly.
-                    # To do so, pop the current one so the other edge is accessible in the next iteration.
-                    edge_names.pop(edge_name)
-                except ValueError:
-                    self.logger.error(f"There is no edge with cause {cause} and effect {effect}")
-                    return False
-                # Add edge with its cause, effect, confidence and timelag to graph_dict
-                graph_dict[edge_name] = {}
-                graph_dict[edge_name].update({"hasCause": cause})
-                if confidence != 0.0:
-                    graph_dict[edge_name].update({"hasConfidence": float(confidence)})
-                graph_dict[edge_name].update({"hasEffect": effect})
-                if time_lag != 0.0:
-                    graph_dict[edge_name].update({"hasTimeLag": float(time_lag)})
-                graph_dict[edge_name].update({"type": ['CausalEdge']})
-                # Add node properties "affected_by" and "causing"
-                graph_dict[cause].setdefault("isCausing", []).append(edge_name)
-                graph_dict[effect].setdefault("isAffectedBy", []).append(edge_name)
+        for cause_ind, effect_ind, discrete_time_lag, confidence in zip(cause_inds.tolist(), effect_inds.tolist(),
+                                                                        lag_inds.tolist(), confidences.tolist()):
+            cause = node_names[cause_ind]
+            effect = node_names[effect_ind]
+            # Get time_lag and convert it with timestep_len_s to cg timeframe
+            time_lag = discrete_time_lag * timestep_len_s
+            # Get edge_name (dict key) with pair of cause and effect (values)
+            try:
+                edge_name = edge_names_by_pair[(cause, effect)].popleft()
+            except IndexError:
+                self.logger.error(f"There is no edge with cause {cause} and effect {effect}")
+                return False
+            # Add edge with its cause, effect, confidence and timelag to graph_dict
+            graph_dict[edge_name] = {}
+            graph_dict[edge_name].update({"hasCause": cause})
+            if confidence != 0.0:
+                graph_dict[edge_name].update({"hasConfidence": float(confidence)})
+            graph_dict[edge_name].update({"hasEffect": effect})
+            if time_lag != 0.0:
+                graph_dict[edge_name].update({"hasTimeLag": float(time_lag)})
+            graph_dict[edge_name].update({"type": ['CausalEdge']})
+            # Add node properties "affected_by" and "causing"
+            graph_dict[cause].setdefault("isCausing", []).append(edge_name)
+            graph_dict[effect].setdefault("isAffectedBy", []).append(edge_name)
         return graph_dict
 
 
-    def fill_empty_graph_from_dict(self, graph_dict: dict):
+    def fill_empty_graph_from_dict(self, graph_dict: dict, trusted: bool = False):
         """Fills a empty graph from a passed graph_dict and returns the Graph() object.
+        All individuals are created in a single transaction.
+
+        With 'trusted=True', the graph_dict is expected to be produced by causalgraph itself
+        (e.g. by 'all_individuals_to_dict' or 'graph_dict_from_nx'). The properties are then not
+        validated again and all individuals are created directly with their final types, which
+        is considerably faster for large graphs.
 
         :param graph_dict: A causalgraph properties dict of a whole graph
         :type graph_dict: dict
+        :param trusted: Switch to skip the validation of properties for trusted graph_dicts, defaults to False
+        :type trusted: bool, optional
         :return: The filled causalgraph object
         :rtype: causalgraph.Graph()
         """
@@ -222,6 +288,32 @@ class Mapping():
 
         ### Iterate over all individuals in graph_dict
         # 1) Check which types can be retrieved and sort into Causal Nodes and Causal Edges
+        causal_node_dict, causal_edge_dict = self.__sort_graph_dict(graph_dict)
+        start_time = time.perf_counter()
+        with owlutils.transaction(self.graph.store, logger=self.logger):
+            if trusted is True:
+                self.__hydrate_from_trusted_dicts(causal_node_dict, causal_edge_dict)
+            else:
+                self.__fill_from_dicts(causal_node_dict, causal_edge_dict, graph_dict)
+        # Report throughput
+        num_individuals = len(causal_node_dict) + len(causal_edge_dict)
+        duration_s = time.perf_counter() - start_time
+        self.logger.info("Filled graph with %d individuals in %.3f s (%.0f individuals/s).",
+                         num_individuals, duration_s, num_individuals / max(duration_s, 1e-9))
+        # Return filled Graph() object
+        return self.graph
+
+
+    def __sort_graph_dict(self, graph_dict: dict) -> tuple:
+        """Sorts the individuals of a graph_dict into CausalNodes and CausalEdges. Types that
+        can not be found in the store are removed from the graph_dict.
+
+        :param graph_dict: A causalgraph properties dict of a whole graph
+        :type graph_dict: dict
+        :raises ValueError: If an individual is neither 'CausalNode' nor 'CausalEdge'
+        :return: Tuple of the properties dicts of all CausalNodes and all CausalEdges
+        :rtype: tuple
+        """
         causal_node_dict = {}
         causal_edge_dict = {}
         for individual, props in graph_dict.items():
@@ -238,6 +330,20 @@ class Mapping():
                 causal_edge_dict[individual] = props
             else:
                 raise ValueError(f"Individual '{individual}' in dict is neither 'CausalNode' nor 'CausalEdge'. Only Causal entities supported")
+        return causal_node_dict, causal_edge_dict
+
+
+    def __fill_from_dicts(self, causal_node_dict: dict, causal_edge_dict: dict, graph_dict: dict) -> None:
+        """Creates the individuals of the sorted graph_dict via 'add.causal_node' and 'add.causal_edge',
+        validating all properties.
+
+        :param causal_node_dict: Properties dicts of all CausalNodes
+        :type causal_node_dict: dict
+        :param causal_edge_dict: Properties dicts of all CausalEdges
+        :type causal_edge_dict: dict
+        :param graph_dict: The complete graph_dict (for error messages)
+        :type graph_dict: dict
+        """
         # 2) Create causalNodes first
         for individual_name, props_dict in causal_node_dict.items():
             individual_prop_dict = self.__create_individual_kwargs_props(props_dict)
@@ -271,8 +377,33 @@ class Mapping():
             individual_types_str = props_dict['type']
             types_list = [self.graph.get_entity(type_str, suppress_warn=True) for type_str in individual_types_str]
             causal_edge.is_a = types_list
-        # Return filled Graph() object
-        return self.graph
+
+
+    def __hydrate_from_trusted_dicts(self, causal_node_dict: dict, causal_edge_dict: dict) -> None:
+        """Creates the individuals of the sorted graph_dict directly with their final types,
+        without validating the properties again.
+
+        :param causal_node_dict: Properties dicts of all CausalNodes
+        :type causal_node_dict: dict
+        :param causal_edge_dict: Properties dicts of all CausalEdges
+        :type causal_edge_dict: dict
+        """
+        store = self.graph.store
+        type_objs = {}
+        for individual_dict in (causal_node_dict, causal_edge_dict):
+            for individual_name, props_dict in individual_dict.items():
+                # Get the final types of the individual, resolving each type only once
+                for type_str in props_dict['type']:
+                    if type_str not in type_objs:
+                        type_objs[type_str] = self.graph.get_entity(type_str, suppress_warn=True)
+                types_list = [type_objs[type_str] for type_str in props_dict['type']]
+                individual_prop_dict = self.__create_individual_kwargs_props(props_dict)
+                if individual_dict is causal_edge_dict:
+                    individual_prop_dict['hasCause'] = owlutils.get_entity_by_name(props_dict['hasCause'], store, logger=self.logger)
+                    individual_prop_dict['hasEffect'] = owlutils.get_entity_by_name(props_dict['hasEffect'], store, logger=self.logger)
+                individual = types_list[0](individual_name, namespace=store.individuals_onto, is_a=types_list, **individual_prop_dict)
+                owlutils.add_to_name_index(individual, store)
+                owlutils.update_adjacency_index(individual, store)
 
 
     def __create_individual_kwargs_props(self, props_dict: dict) -> dict:
@@ -358,5 +489,115 @@ class Mapping():
         return individual_prop_dict
 
 
-    def update_graph_from_dict(self, graph_dict: dict=None):
-        raise NotImplementedError
+    def update_graph_from_dict(self, graph_dict: dict):
+        """Updates the graph incrementally, so that it matches the passed graph_dict afterwards.
+        The graph_dict is compared with the current graph and only added, removed and changed
+        individuals and properties are applied to the store, all in a single transaction.
+        The inverse properties 'isCausing' and 'isAffectedBy' follow from the CausalEdges and are
+        not compared. An empty graph is filled via 'fill_empty_graph_from_dict'.
+
+        :param graph_dict: A causalgraph properties dict of a whole graph
+        :type graph_dict: dict
+        :return: The updated causalgraph object
+        :rtype: causalgraph.Graph()
+        """
+        if type(graph_dict) not in [dict]:
+            self.logger.error(f"Updating graph from graph_dict wasn't successful. Passed graph_dict not valid. Got graph dict: {graph_dict}")
+            return self.graph
+        current_graph_dict = self.all_individuals_to_dict()
+        if current_graph_dict == {}:
+            if graph_dict == {}:
+                return self.graph
+            return self.fill_empty_graph_from_dict(graph_dict)
+        causal_node_dict, causal_edge_dict = self.__sort_graph_dict(graph_dict)
+
+        # Diff graph_dict against the current graph
+        removed_nodes = [name for name, props in current_graph_dict.items()
+                         if name not in causal_node_dict and 'hasCause' not in props and 'hasEffect' not in props]
+        removed_edges = [name for name, props in current_graph_dict.items()
+                         if name not in causal_edge_dict and ('hasCause' in props or 'hasEffect' in props)]
+        # Edges of removed nodes are deleted with them and have to be recreated if still part of graph_dict
+        edges_of_removed_nodes = {edge for node in removed_nodes
+                                  for prop in ['isCausing', 'isAffectedBy']
+                                  for edge in current_graph_dict[node].get(prop, [])}
+        added_nodes = {name: props for name, props in causal_node_dict.items() if name not in current_graph_dict}
+        added_edges = {name: props for name, props in causal_edge_dict.items()
+                       if name not in current_graph_dict or name in edges_of_removed_nodes}
+        changed_individuals = {}
+        for name, props in {**causal_node_dict, **causal_edge_dict}.items():
+            if name in current_graph_dict and name not in added_edges:
+                changed_props, deleted_props = self.__diff_prop_dicts(current_graph_dict[name], props)
+                if changed_props or deleted_props:
+                    changed_individuals[name] = (props, changed_props, deleted_props)
+
+        # Apply the changes
+        with owlutils.transaction(self.graph.store, logger=self.logger):
+            for edge_name in removed_edges:
+                if edge_name not in edges_of_removed_nodes:
+                    self.graph.remove.causal_edge(edge_name)
+            for node_name in removed_nodes:
+                self.graph.remove.causal_node(node_name)
+            self.__fill_from_dicts(added_nodes, {}, graph_dict)
+            for name, (props, changed_props, deleted_props) in changed_individuals.items():
+                self.__apply_prop_changes(name, props, changed_props, deleted_props)
+            self.__fill_from_dicts({}, added_edges, graph_dict)
+        self.logger.info("Updated graph from graph_dict: %d individuals added, %d removed and %d changed.",
+                         len(added_nodes) + len(added_edges), len(removed_nodes) + len(removed_edges),
+                         len(changed_individuals))
+        return self.graph
+
+
+    def __diff_prop_dicts(self, current_props: dict, new_props: dict) -> tuple:
+        """Compares the properties dicts of an individual. 'iri' and the inverse properties
+        'isCausing' and 'isAffectedBy' are ignored.
+
+        :param current_props: Properties dict of the individual in the current graph
+        :type current_props: dict
+        :param new_props: Properties dict of the individual in the new graph_dict
+        :type new_props: dict
+        :return: Tuple of a dict of changed properties with their new values and a list of deleted properties
+        :rtype: tuple
+        """
+        ignored_props = ['iri', 'isCausing', 'isAffectedBy']
+        changed_props = {prop: value for prop, value in new_props.items()
+                         if prop not in ignored_props and current_props.get(prop) != value}
+        deleted_props = [prop for prop in current_props
+                         if prop not in ignored_props and prop not in new_props]
+        return changed_props, deleted_props
+
+
+    def __apply_prop_changes(self, individual_name: str, props_dict: dict, changed_props: dict, deleted_props: list) -> None:
+        """Applies changed and deleted properties (and types) to an existing individual.
+
+        :param individual_name: Name of the individual to update
+        :type individual_name: str
+        :param props_dict: The complete properties dict of the individual in the new graph_dict
+        :type props_dict: dict
+        :param changed_props: Changed properties with their new values
+        :type changed_props: dict
+        :param deleted_props: Properties to delete
+        :type deleted_props: list
+        :raises ValueError: If the validation of the changed properties fails or a changed CausalEdge closes a cycle
+        """
+        individual = owlutils.get_entity_by_name(individual_name, self.graph.store, logger=self.logger)
+        if 'type' in changed_props:
+            individual.is_a = [self.graph.get_entity(type_str, suppress_warn=True) for type_str in props_dict['type']]
+        individual_prop_dict = self.__create_individual_kwargs_props({'type': props_dict['type'], **changed_props})
+        for prop in ['hasCause', 'hasEffect']:
+            if prop in changed_props:
+                individual_prop_dict[prop] = owlutils.get_entity_by_name(changed_props[prop], self.graph.store, logger=self.logger)
+        valid = owlutils.validate_property_target_pairs_for_classes(props_dict['type'], individual_prop_dict,
+                                                                    self.graph.store, logger=self.logger,
+                                                                    validate_domain_range=self.validate_domain_range)
+        if valid is False:
+            raise ValueError(f"Individual '{individual_name}' could not be updated with props {individual_prop_dict}. Property validation failed.")
+        # Changed cause, effect or time lag of CausalEdges are checked for cycles like in 'edit.properties'
+        if self.graph.edit.enforce_dag and \
+                self.graph.edit._closes_cycle(individual, {**individual_prop_dict, **{prop: None for prop in deleted_props}}):
+            raise ValueError(f"Individual '{individual_name}' could not be updated with props {individual_prop_dict}. " +
+                             "The changed CausalEdge would close a cycle (enforce_dag=True).")
+        for prop, value in individual_prop_dict.items():
+            setattr(individual, prop, value)
+        # Delete properties that are not part of the graph_dict anymore
+        owlutils.update_properties_of_individual(individual, self.graph.store, {prop: None for prop in deleted_props},
+                                                 logger=self.logger, validate_domain_range=False)
@@ -5,11 +5,15 @@
 """ Contains various helpful methods which are not closely related """
 
 # general imports
+import os
 from pathlib import Path
 from typing import Union, get_origin, get_args
 from functools import wraps
 from inspect import signature, Parameter
 
+# Type checking of 'strict_types' can be switched off via environment variable or 'set_strict_types'
+STRICT_TYPES_ENABLED: bool = os.environ.get("CAUSALGRAPH_STRICT_TYPES", "1").lower() not in ["0", "false", "no", "off"]
+
 
 # Source: https://stackoverflow.com/questions/25389095/python-get-path-of-root-project-structure/45944002
 def get_project_root() -> Path:
@@ -21,6 +25,55 @@ def get_project_root() -> Path:
     return Path(__file__).parent.parent.parent.absolute()
 
 
+def get_user_cache_dir() -> Path:
+    """Returns the per-user cache directory of causalgraph (outside of the installed package),
+    '$XDG_CACHE_HOME/causalgraph', defaults to '~/.cache/causalgraph'
+
+    :return: Path of the cache directory (which does not need to exist yet)
+    :rtype: Path
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home).absolute() / "causalgraph"
+
+
+def set_strict_types(enabled: bool) -> None:
+    """Switches the type checking of all functions decorated with 'strict_types' on or off.
+    The default can be set with the environment variable 'CAUSALGRAPH_STRICT_TYPES' (e.g. '0' to
+    switch it off in production).
+
+    :param enabled: True to enforce the type hints, False to skip the checks
+    :type enabled: bool
+    """
+    global STRICT_TYPES_ENABLED
+    STRICT_TYPES_ENABLED = bool(enabled)
+
+
+def _compile_type_checks(f) -> tuple:
+    """Precomputes the checks of 'strict_types' for all annotated parameters of f.
+
+    :param f: The function to be decorated.
+    :type f: function
+    :return: Tuple of (name, position or None, accepted types, None allowed, type hint) per parameter
+    :rtype: tuple
+    """
+    checks = []
+    for position, (key, param) in enumerate(signature(f).parameters.items()):
+        param_type = param.annotation
+        if param_type == Parameter.empty or param.kind in [Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD]:
+            continue
+        if param.kind not in [Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD]:
+            position = None
+        if get_origin(param_type) is Union:
+            # Allow the specified types in the Union or None
+            checks.append((key, position, get_args(param_type), True, param_type))
+        elif param_type is float:
+            # Integers are accepted if a float parameter is expected
+            checks.append((key, position, (float, int), False, param_type))
+        else:
+            checks.append((key, position, (param_type,), False, param_type))
+    return tuple(checks)
+
+
 def strict_types(f):
     """A function decorator that enforces strict typing for the decorated function's arguments.
     This wrapper verifies the types of the arguments passed to the decorated function against their type hints.
@@ -33,39 +86,32 @@ def strict_types(f):
             # Function implementation
     :note:
         - This wrapper supports type hints including Union[] and float conversions from int.
+        - The checks are precomputed once at decoration time.
+        - The checks can be switched off with 'set_strict_types(False)' or the environment
+          variable 'CAUSALGRAPH_STRICT_TYPES=0'.
 
     :param f: The function to be decorated.
     :type f: function
     :returns: The decorated function with type checking enforced.
     :rtype: function
     """
+    checks = _compile_type_checks(f)
+
     @wraps(f)
     def type_checker(*args, **kwargs):
-
-        hints = signature(f).parameters
-
-        all_args = kwargs.copy()
-        all_args.update(dict(zip(f.__code__.co_varnames, args)))
-
-        for key, arg_value in all_args.items():
-            if key in hints:
-                param_type = hints[key].annotation
-
-                if param_type == Parameter.empty:
+        if STRICT_TYPES_ENABLED:
+            num_args = len(args)
+            for key, position, accepted_types, none_allowed, param_type in checks:
+                if position is not None and position < num_args:
+                    arg_value = args[position]
+                elif key in kwargs:
+                    arg_value = kwargs[key]
+                else:
                     continue
-
-                if get_origin(param_type) is Union:
-                    # Allow the specified types in the Union or None
-                    if arg_value is not None and not isinstance(arg_value, get_args(param_type)):
-                        raise TypeError(f"Type of {key} is {type(arg_value)} but should be {param_type}")
-                elif param_type is float and isinstance(arg_value, int):
-                    # Convert integer to float if a float parameter is expected
-                    arg_value = float(arg_value)
-                elif not isinstance(arg_value, param_type):
+                if arg_value is None and none_allowed:
+                    continue
+                if not isinstance(arg_value, accepted_types):
                     raise TypeError(f"Type of {key} is {type(arg_value)} but should be {param_type}")
-
-                all_args[key] = arg_value
-
         return f(*args, **kwargs)
 
-    return type_checker
\ No newline at end of file
+    return type_checker
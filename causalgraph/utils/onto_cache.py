@@ -0,0 +1,290 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: MIT
+
+""" Contains a local on-disk cache of parsed ontologies (e.g. third party ontologies passed
+    via 'external_ontos'). Each ontology is parsed once per machine into a SQLite store, which
+    is named by the hash of the ontology content and of the known ontologies stubbed in it. Importing
+    it into a graph copies the triples of the cached store with SQL instead of parsing the ontology again.
+"""
+
+# general imports
+import io
+import os
+import json
+import time
+import logging
+import hashlib
+import urllib.request
+import urllib.error
+from logging import Logger
+from pathlib import Path
+from typing import Union
+import owlready2
+# causalgraph imports
+import causalgraph.utils.owlready2_utils as owlutils
+from causalgraph.utils.logging_utils import init_logger
+from causalgraph.utils.misc_utils import get_user_cache_dir
+
+###################################################
+#               GLOBALS                           #
+###################################################
+CACHE_LOGGER = init_logger("onto_cache", console_handler_level=logging.WARNING)
+ONTO_CACHE_DIR: Path = Path.joinpath(get_user_cache_dir(), "onto_cache") # Parsed ontologies and index
+INDEX_FILENAME = "index.json" # Maps sources (paths/URLs) to the content hash and revalidation info
+URL_TIMEOUT_S = 10
+STUB_LAST_UPDATE = -1.0 # Marks ontologies which are only referenced (e.g. imported) but not stored in the cache
+##################################################
+
+
+def _read_index(cache_dir: Path) -> dict:
+    """Reads the index of the cache, returns an empty index if there is none (yet)."""
+    try:
+        with open(cache_dir / INDEX_FILENAME, encoding="utf-8") as index_file:
+            return json.load(index_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_index_entry(cache_dir: Path, source: str, entry: dict) -> None:
+    """Updates the entry of 'source' in the index of the cache (written atomically)."""
+    index = _read_index(cache_dir)
+    index[source] = entry
+    tmp_path = cache_dir / f"{INDEX_FILENAME}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as index_file:
+        json.dump(index, index_file, indent=2)
+    os.replace(tmp_path, cache_dir / INDEX_FILENAME)
+
+
+def _alias_iri(onto_iri: str) -> str:
+    """Returns the iri under which an ontology imported with 'onto_iri' is found in 'store.ontologies'."""
+    return onto_iri if onto_iri.endswith(("#", "/")) else f"{onto_iri}#"
+
+
+def _build_cached_store(content: bytes, onto_iri: str, db_path: Path, known_onto_iris: list[str]) -> None:
+    """Parses the ontology content once into a new SQLite store at 'db_path'. Ontologies in
+    'known_onto_iris' (e.g. the core ontology) are only created as empty stubs, so that imports of
+    them are not fetched. The store is written to a temporary file first and then moved, so concurrent
+    processes never see a partial store."""
+    tmp_path = db_path.with_suffix(f".{os.getpid()}.tmp")
+    cache_store = owlready2.World(filename=str(tmp_path))
+    try:
+        for known_onto_iri in known_onto_iris:
+            stub_onto = cache_store.get_ontology(known_onto_iri)
+            cache_store.graph.execute("UPDATE ontologies SET last_update=? WHERE c=?", (STUB_LAST_UPDATE, stub_onto.graph.c))
+        cache_store.get_ontology(onto_iri).load(fileobj=io.BytesIO(content))
+        cache_store.save()
+    except BaseException:
+        cache_store.close()
+        tmp_path.unlink(missing_ok=True)
+        raise
+    cache_store.close()
+    os.replace(tmp_path, db_path)
+
+
+def _fetch_url(url: str, entry: dict, offline: bool, logger: Logger) -> tuple[bytes, dict]:
+    """Fetches the ontology at 'url' unless the cached version is still valid. Revalidates with
+    the ETag and Last-Modified of the cached version. Returns (None, entry) if the cached version
+    is to be used, else (content, new entry)."""
+    if offline:
+        if entry is None:
+            raise FileNotFoundError(f"Ontology '{url}' is not cached and can't be fetched in offline mode.")
+        return None, entry
+    request = urllib.request.Request(url)
+    if entry is not None and entry.get("etag"):
+        request.add_header("If-None-Match", entry["etag"])
+    if entry is not None and entry.get("last_modified"):
+        request.add_header("If-Modified-Since", entry["last_modified"])
+    try:
+        with urllib.request.urlopen(request, timeout=URL_TIMEOUT_S) as response:
+            content = response.read()
+            return content, {"etag": response.headers.get("ETag"),
+                             "last_modified": response.headers.get("Last-Modified")}
+    except urllib.error.HTTPError as error:
+        if error.code == 304 and entry is not None:
+            return None, entry
+        raise
+    except (urllib.error.URLError, OSError) as error:
+        if entry is None:
+            raise
+        logger.warning(f"Could not revalidate ontology '{url}' ({error}). Using cached version.")
+        return None, entry
+
+
+def get_cached_onto_path(source: Union[str, Path], offline: bool = False, cache_dir: Union[str, Path] = None,
+                         known_onto_iris: list[str] = None, logger: Logger = CACHE_LOGGER) -> tuple[Path, str]:
+    """Returns the cached store of the ontology at 'source' (local path or URL), parses the ontology
+    into the cache first if it is not cached yet or changed. Local files are revalidated by their
+    modification time and size, URLs by ETag / Last-Modified. In offline mode, URLs are not fetched.
+
+    :param source: Local path to file or URL to ontology in web.
+    :type source: Union[str, Path]
+    :param offline: If True, URLs are only loaded from the cache, defaults to False
+    :type offline: bool, optional
+    :param cache_dir: Directory of the cache, defaults to ONTO_CACHE_DIR
+    :type cache_dir: Union[str, Path], optional
+    :param known_onto_iris: Iris of ontologies not to be fetched if imported, defaults to None
+    :type known_onto_iris: list[str], optional
+    :param logger: logger, defaults to CACHE_LOGGER
+    :type logger: Logger, optional
+    :raises FileNotFoundError: Ontology is neither cached nor available (e.g. in offline mode)
+    :raises OwlReadyOntologyParsingError: Ontology could not be parsed
+    :return: (Path of the cached store, iri the ontology is loaded with)
+    :rtype: tuple[Path, str]
+    """
+    cache_dir = Path(cache_dir if cache_dir is not None else ONTO_CACHE_DIR)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    stubbed_onto_iris = sorted(set(known_onto_iris or []))
+    entry = _read_index(cache_dir).get(str(source))
+    # The cached store lacks the stubbed ontologies, it is only valid for the same known ontologies
+    if entry is not None and entry.get("known_onto_iris") != stubbed_onto_iris:
+        entry = None
+    if Path(source).is_file():
+        onto_iri = f"file://{source}"
+        file_stat = Path(source).stat()
+        revalidation = {"mtime": file_stat.st_mtime, "size": file_stat.st_size}
+        if entry is not None and all(entry.get(key) == value for key, value in revalidation.items()) and \
+                (cache_dir / entry["db"]).is_file():
+            return cache_dir / entry["db"], onto_iri
+        content = Path(source).read_bytes()
+    else:
+        onto_iri = str(source)
+        content, revalidation = _fetch_url(onto_iri, entry, offline, logger)
+        if content is None:
+            if not (cache_dir / entry["db"]).is_file():
+                raise FileNotFoundError(f"Cached store of ontology '{source}' is missing.")
+            return cache_dir / entry["db"], onto_iri
+    # Content and stubs hashed: sources with identical content share one parsed store per set of known ontologies
+    db_hash = hashlib.sha256(content)
+    for stubbed_onto_iri in stubbed_onto_iris:
+        db_hash.update(b"\0" + stubbed_onto_iri.encode("utf-8"))
+    db_name = f"{db_hash.hexdigest()}.sqlite3"
+    if not (cache_dir / db_name).is_file():
+        start_time = time.perf_counter()
+        _build_cached_store(content, onto_iri, cache_dir / db_name, stubbed_onto_iris)
+        logger.info("Parsed ontology '%s' into cache in %.3f s.", source, time.perf_counter() - start_time)
+    _write_index_entry(cache_dir, str(source), {"db": db_name, "known_onto_iris": stubbed_onto_iris, **revalidation})
+    return cache_dir / db_name, onto_iri
+
+
+def copy_cached_onto_into_store(cached_onto_path: Union[str, Path], onto_iri: str,
+                                store: owlready2.World) -> owlready2.Ontology:
+    """Copies all ontologies of a cached store into 'store' with SQL. The storids of the cached store
+    are mapped to the ones of 'store' via their iris, blank nodes are shifted behind the blank nodes
+    of 'store'. Returns None if the main ontology already exists in 'store'. The copy is committed on its
+    own, it can therefore not be done while a transaction is open on 'store' (see 'Graph.transaction').
+
+    :param cached_onto_path: Path of the cached store
+    :type cached_onto_path: Union[str, Path]
+    :param onto_iri: Iri (path or URL) the ontology is imported with, kept as alias of the ontology
+    :type onto_iri: str
+    :param store: Store to copy the ontologies into
+    :type store: owlready2.World
+    :raises RuntimeError: A transaction is open on 'store'
+    :return: The main ontology of the cached store
+    :rtype: owlready2.Ontology
+    """
+    # The raw SQL relies on the quadstore layout of owlready2 0.43 (main and cached store):
+    #   ontologies(c, iri, last_update), ontology_alias(iri, alias), resources(storid, iri),
+    #   objs(c, s, p, o), datas(c, s, p, o, d) and store(current_blank).
+    # Negative storids are blank nodes, an integer 'd' > 0 in datas is the storid of the datatype
+    # (else 'd' is a language tag like '@en'). New storids follow MAX(resources.storid), as owlready2
+    # allocates them. Check these tables when upgrading owlready2.
+    if getattr(store, "open_transactions", 0) > 0:
+        raise RuntimeError("Can't copy a cached ontology into a store with an open transaction.")
+    graph = store.graph
+    ontos = []
+    graph.db.commit()
+    graph.execute("ATTACH DATABASE ? AS cached", (f"file:{cached_onto_path}?mode=ro",))
+    try:
+        # Stubs and ontologies already in the store are not copied, the main ontology (the first one
+        # of the cached store, the others were imported by it) needs to be new
+        cached_ontos = graph.execute("""SELECT c, iri, last_update FROM cached.ontologies
+                                        WHERE iri != ? AND last_update != ? ORDER BY c""",
+                                     (owlutils.ANONYMOUS_ONTO_IRI, STUB_LAST_UPDATE)).fetchall()
+        store_onto_iris = {iri for (iri,) in graph.execute("SELECT iri FROM main.ontologies").fetchall()}
+        store_onto_iris.update(store.ontologies)
+        if len(cached_ontos) == 0 or cached_ontos[0][1] in store_onto_iris:
+            graph.db.rollback()
+            return None
+        cached_ontos = [cached_onto for cached_onto in cached_ontos if cached_onto[1] not in store_onto_iris]
+        # Map storids via iris, new iris get storids behind the existing ones
+        next_storid = max(graph.execute("SELECT MAX(storid) FROM main.resources").fetchone()[0] or 0, 300)
+        graph.execute("CREATE TEMP TABLE cached_storids (cached_storid INTEGER PRIMARY KEY, storid INTEGER)")
+        graph.execute("""INSERT INTO cached_storids SELECT cached_resources.storid, resources.storid
+                         FROM cached.resources AS cached_resources JOIN main.resources AS resources
+                         ON resources.iri = cached_resources.iri""")
+        graph.execute("""INSERT INTO cached_storids
+                         SELECT storid, ? + ROW_NUMBER() OVER (ORDER BY storid) FROM cached.resources
+                         WHERE storid NOT IN (SELECT cached_storid FROM cached_storids)""", (next_storid,))
+        graph.execute("""INSERT INTO main.resources SELECT cached_storids.storid, cached_resources.iri
+                         FROM cached.resources AS cached_resources JOIN cached_storids
+                         ON cached_storids.cached_storid = cached_resources.storid
+                         WHERE cached_storids.storid > ?""", (next_storid,))
+        # Blank nodes (negative storids) are shifted behind the blank nodes of the store
+        current_blank = graph.execute("SELECT current_blank FROM main.store").fetchone()[0]
+        cached_blank = graph.execute("SELECT current_blank FROM cached.store").fetchone()[0]
+        graph.execute("UPDATE main.store SET current_blank=?", (current_blank + cached_blank,))
+        map_storid = """CASE WHEN {0} < 0 THEN {0} - {1}
+                        ELSE (SELECT storid FROM cached_storids WHERE cached_storid = {0}) END"""
+        for cached_c, cached_onto_iri, last_update in cached_ontos:
+            onto = store.get_ontology(cached_onto_iri)
+            graph.execute(f"""INSERT OR IGNORE INTO main.objs
+                              SELECT ?, {map_storid.format('s', current_blank)}, {map_storid.format('p', current_blank)},
+                              {map_storid.format('o', current_blank)} FROM cached.objs WHERE c = ?""",
+                          (onto.graph.c, cached_c))
+            graph.execute(f"""INSERT OR IGNORE INTO main.datas
+                              SELECT ?, {map_storid.format('s', current_blank)}, {map_storid.format('p', current_blank)}, o,
+                              CASE WHEN typeof(d) = 'integer' AND d > 0 THEN {map_storid.format('d', current_blank)} ELSE d END
+                              FROM cached.datas WHERE c = ?""", (onto.graph.c, cached_c))
+            graph.execute("UPDATE main.ontologies SET last_update=? WHERE c=?", (last_update, onto.graph.c))
+            ontos.append(onto)
+        graph.execute("DROP TABLE temp.cached_storids")
+        main_onto = ontos[0]
+        alias_iri = _alias_iri(onto_iri)
+        if alias_iri != main_onto.base_iri:
+            graph.execute("INSERT INTO main.ontology_alias VALUES (?,?)", (main_onto.base_iri, alias_iri))
+            store.ontologies[alias_iri] = main_onto
+        graph.db.commit()
+    except BaseException:
+        graph.db.rollback()
+        for onto in ontos:
+            store.ontologies.pop(onto.base_iri, None)
+        raise
+    finally:
+        graph.execute("DETACH DATABASE cached")
+    # The triples are in the quadstore: owlready2 only loads the properties and imports without parsing
+    for onto in ontos:
+        onto.load()
+    return main_onto
+
+
+def import_cached_ontology(source: Union[str, Path], store: owlready2.World, offline: bool = False,
+                           cache_dir: Union[str, Path] = None, logger: Logger = CACHE_LOGGER) -> owlready2.Ontology:
+    """Imports the ontology at 'source' (local path or URL) into 'store' from the local cache.
+    The ontology is parsed (and fetched) only if it is not cached yet or changed.
+    Returns None if the ontology already exists in 'store'.
+
+    :param source: Local path to file or URL to ontology in web.
+    :type source: Union[str, Path]
+    :param store: Store to import the ontology into
+    :type store: owlready2.World
+    :param offline: If True, URLs are only loaded from the cache, defaults to False
+    :type offline: bool, optional
+    :param cache_dir: Directory of the cache, defaults to ONTO_CACHE_DIR
+    :type cache_dir: Union[str, Path], optional
+    :param logger: logger, defaults to CACHE_LOGGER
+    :type logger: Logger, optional
+    :raises FileNotFoundError: Ontology is neither cached nor available (e.g. in offline mode)
+    :raises OwlReadyOntologyParsingError: Ontology could not be parsed
+    :return: The imported ontology
+    :rtype: owlready2.Ontology
+    """
+    # Already imported: don't build another cached store with the ontology itself stubbed
+    onto_iri = f"file://{source}" if Path(source).is_file() else str(source)
+    if _alias_iri(onto_iri) in store.ontologies:
+        return None
+    known_onto_iris = [known_onto_iri for known_onto_iri in store.ontologies if known_onto_iri != owlutils.ANONYMOUS_ONTO_IRI]
+    cached_onto_path, onto_iri = get_cached_onto_path(source, offline=offline, cache_dir=cache_dir,
+                                                      known_onto_iris=known_onto_iris, logger=logger)
+    return copy_cached_onto_into_store(cached_onto_path, onto_iri, store)
@@ -5,15 +5,28 @@
 """ Contains various helpful methods for owlready2"""
 
 # general imports
+import os
 import logging
+import math
 import re
+import sqlite3
+import hashlib
+from pathlib import Path
+from collections import OrderedDict
+from contextlib import contextmanager
 from logging import Logger
-from typing import Union, Any
+from typing import Union, Any, NamedTuple, TYPE_CHECKING
 import owlready2
 from deprecated import deprecated
+# numpy is only imported for the validation of whole arrays
+if TYPE_CHECKING:
+    import numpy as np
 
 # causalgraph imports
 from causalgraph.utils.logging_utils import init_logger
+from causalgraph.utils.misc_utils import get_user_cache_dir
+# the index data structures are re-exported to keep 'owlutils.AdjacencyIndex' etc. working
+from causalgraph.store.index import AdjacencyIndex, ReachabilityIndex, TopologicalOrder, would_create_cycle
 
 ###################################################
 #               GLOBALS                           #                        
@@ -22,7 +35,9 @@ UTILS_LOGGER = init_logger("utils", console_handler_level=logging.WARNING)
 DEFAULT_PROPERTIES = ["comment", "isDefinedBy", "label", "seeAlso", "backwardCompatibleWith",
                      "deprecated", "incompatibleWith", "priorVersion", "versionInfo", 'type']
 # So far did not find a way on how to get the default properties from owlready2 https://owlready2.readthedocs.io/en/latest/annotations.html
-CACHED_IRIS = {} # Cache for iris to speed up repeated access
+MAX_CACHE_SIZE = 1024 # Maximum number of cached iris and entities per store
+ONTO_TEMPLATE_DIR: Path = Path.joinpath(get_user_cache_dir(), "templates") # Pre-built stores of ontologies
+ANONYMOUS_ONTO_IRI = "http://anonymous/" # Ontology owlready2 creates in every store
 ##################################################
 
 
@@ -80,13 +95,15 @@ def create_individual_of_type(class_of_individual: Union[str, owlready2.Thing],
             new_individual = class_def_for_individual(namespace= individuals_store_onto, **kwargs)
         else:
             new_individual = class_def_for_individual(name_for_individual, namespace= individuals_store_onto, **kwargs)
+        add_to_name_index(new_individual, store)
+        update_adjacency_index(new_individual, store)
         # Logging depending on additional properties or not
         if len(kwargs) > 0:
-            logger.info(f"Created {class_of_individual} instance with name {new_individual.name} " +
-                        f"and properties {kwargs}")
+            logger.info("Created %s instance with name %s and properties %s",
+                        class_of_individual, new_individual.name, kwargs)
         else:
-            logger.info(f"Created {class_of_individual} instance with name {new_individual.name}.")
-        store.save()
+            logger.info("Created %s instance with name %s.", class_of_individual, new_individual.name)
+        save_store(store)
         return new_individual
     else:  # If an individual already exists with the same name
         individual = possibly_existing_individual
@@ -101,17 +118,17 @@ def create_individual_of_type(class_of_individual: Union[str, owlready2.Thing],
             # Update individual properties
             success = update_properties_of_individual(individual=individual, store=store, prop_dict=kwargs)
             if success is True:
-                logger.info(f"{class_of_individual} with name '{name_for_individual}' already " +
-                            f"existed. Added / Overwrote properties {kwargs}")
-                store.save()
+                logger.info("%s with name '%s' already existed. Added / Overwrote properties %s",
+                            class_of_individual, name_for_individual, kwargs)
+                save_store(store)
                 return individual
             else:
                 return None
         # If nothing needed to be changed. Return existing individual
         else:
-            logger.info(f"Individual already exists. Returning existing '{class_of_individual}' " +
-                            f"with name '{name_for_individual}'.")
-            store.save()
+            logger.info("Individual already exists. Returning existing '%s' with name '%s'.",
+                        class_of_individual, name_for_individual)
+            save_store(store)
             return individual
 
 
@@ -160,6 +177,7 @@ def update_properties_of_individual(individual: Union[str, owlready2.Thing], sto
             individual_obj.__setattr__(prop, entity_list)
         else: # Update single values
             individual_obj.__setattr__(prop, val)
+    update_adjacency_index(individual_obj, store)
     return True
 
 
@@ -217,7 +235,13 @@ def get_entity_by_name(name_of_entity: str, store: owlready2.World,
     :return: Entity Object (class/property/individual)
     :rtype: owlready2.EntityClass
     """
-    possible_objects = store.search(iri=f"*#{name_of_entity}")
+    # Use the per-store name index if present, fall back to a wildcard IRI search otherwise
+    name_index = getattr(store, "name_index", None)
+    if name_index is None:
+        possible_objects = store.search(iri=f"*#{name_of_entity}")
+    else:
+        possible_objects = [store._get_by_storid(storid) for storid in name_index.get(str(name_of_entity), ())]
+        possible_objects = [obj for obj in possible_objects if obj is not None]
     if len(possible_objects) == 0:
         if not suppress_warn:
             logger.warning(f"""No entity (class/property/individual) found under given name.
@@ -278,19 +302,12 @@ def get_edge_by_cause_and_effect(cause: Union[str, owlready2.Thing], effect: Uni
     # Get Objects for cause and effect
     cause_name, cause_obj = get_name_and_object(entity=cause, store=store)
     effect_name, effect_obj = get_name_and_object(effect, store)
-    # Get Objects for relevant properties
-    causalEdge_type_iri = get_iri_from_cache_by_entity_name("CausalEdge", store, suppress_warn=True)
-    hasCause_iri = get_iri_from_cache_by_entity_name("hasCause", store, suppress_warn=True)
-    hasEffect_iri = get_iri_from_cache_by_entity_name("hasEffect", store, suppress_warn=True)
-    # Use Path expressions to include subtypes
-    causalEdges = store.sparql("""
-        SELECT DISTINCT ?x
-        { ?x a/rdfs:subClassOf* """ + f"<{causalEdge_type_iri}> ;" +
-             f"<{hasCause_iri}> <{cause_obj.iri}> ;" +
-             f"<{hasEffect_iri}> <{effect_obj.iri}> ." +
-        "}")
-    # Unpack from format [[instance1],[instance2]..] to [instance1, instance2..]
-    return [causalEdge[0] for causalEdge in causalEdges]
+    # Get the edges from the adjacency index, only CausalEdges and their subtypes
+    causal_edge_class = get_entity_from_cache_by_name("CausalEdge", store, suppress_warn=True)
+    out_edges = get_adjacency_index(store).out_edges.get(cause_obj.storid, {})
+    causal_edges = [store._get_by_storid(edge) for edge, effect in out_edges.items() if effect == effect_obj.storid]
+    return [causal_edge for causal_edge in causal_edges
+            if any(is_subclass_of(edge_type, causal_edge_class, store, suppress_warn=True) for edge_type in causal_edge.is_a)]
 
 
 def get_subclasses(type: Union[str, owlready2.Thing], store: owlready2.World,
@@ -312,11 +329,15 @@ def get_subclasses(type: Union[str, owlready2.Thing], store: owlready2.World,
     if class_obj is None:
         logger.warning(f"Class '{class_name}' does not exist. Returning 'None' as subclasses.")
         return None
-    else:
-        subclasses_list = list(store.sparql("""
-            SELECT ?x
-            { ?x rdfs:subClassOf* """ + f"<{class_obj.iri}> ." + " }"
-            ))
+    # Use the class closure of the store if present, keeping the SPARQL result format [[class], ..]
+    subclass_storids = get_descendant_storids(class_obj, store)
+    if subclass_storids is not None:
+        subclasses = [store._get_by_storid(storid) for storid in sorted(subclass_storids)]
+        return [[subclass] for subclass in subclasses if subclass is not None]
+    subclasses_list = list(store.sparql("""
+        SELECT ?x
+        { ?x rdfs:subClassOf* """ + f"<{class_obj.iri}> ." + " }"
+        ))
     return subclasses_list
 
 
@@ -450,12 +471,19 @@ def is_subclass_of(potential_subclass: Union[str, owlready2.Thing],  parent_clas
         if suppress_warn is False:
             logger.warning(f"Did not find class '{potential_subclass_name}' or '{parent_class_name}'.")
         return False
-    # Check if potential_subclass is subclass of parent_class
+    # Check if potential_subclass is subclass of parent_class (set lookup if the class closure is present)
+    subclass_storids = get_descendant_storids(parent_class_obj, store)
+    if subclass_storids is not None:
+        if potential_subclass_obj.storid in subclass_storids:
+            return True
+        logger.debug("Did not find class '%s' in subclasses of '%s'.", potential_subclass_name, parent_class_name)
+        return False
     class_names_to_check = [node[0].name for node in get_subclasses(parent_class, store, logger)]
     if potential_subclass_name in class_names_to_check:
         return True
     else:
-        logger.debug(f"Did not find class '{potential_subclass_name}' in subclasses of '{parent_class_name}'(subclasses={class_names_to_check})'.")
+        logger.debug("Did not find class '%s' in subclasses of '%s' (subclasses=%s).",
+                     potential_subclass_name, parent_class_name, class_names_to_check)
         return False
 
 def is_valid_class_type(class_to_check: str, store: owlready2.World, logger: Logger = UTILS_LOGGER) -> bool:
@@ -472,8 +500,7 @@ def is_valid_class_type(class_to_check: str, store: owlready2.World, logger: Log
     :return: if class_name_is_valid
     :rtype: bool
     """
-    class_names = [owlclass.name for owlclass in store.classes()]
-    if class_to_check not in class_names:
+    if class_to_check not in get_class_names(store):
         logger.warning(f"No individual created. Class type unknown: {class_to_check}")
         return False
     return True
@@ -491,8 +518,7 @@ def is_valid_individual_name(individual_name: str, store: owlready2.World, logge
     :return: True if individual_name is valid
     :rtype: bool
     """
-    class_names = [owlclass.name for owlclass in store.classes()]
-    if individual_name in class_names:
+    if individual_name in get_class_names(store):
         logger.warning("No individual created. Prohibited to choose individual name identical to" +
                       f" class name. Choose different name from type '{individual_name}'")
         return False
@@ -503,7 +529,8 @@ def validate_property_target_pairs_for_classes(owl_class: Union[str, owlready2.T
                                             store: owlready2.World, logger: Logger = UTILS_LOGGER,
                                             validate_domain_range: bool = True) -> bool:
 
-    logger.debug(f"Validating property target pairs for class '{owl_class}' of type {type(owl_class)} and properties '{prop_target_pairs}'")
+    logger.debug("Validating property target pairs for class '%s' of type %s and properties '%s'",
+                 owl_class, type(owl_class), prop_target_pairs)
     # 0) Check inputs and extract potentially multiple class definitons. Will return true if any of the classes are valid for the property target pair 
     if type(owl_class) in [list, owlready2.util.CallbackList]:
         classes = [get_name_and_object(cl, store, logger=logger, suppress_warn=False)[1] for cl in owl_class]
@@ -520,21 +547,24 @@ def validate_property_target_pairs_for_classes(owl_class: Union[str, owlready2.T
     for property, target in prop_target_pairs.items():
         # 1) Detect default properties and pass (=are not validated)
         if property in DEFAULT_PROPERTIES:
-            logger.debug(f"Skipping validation for default property: '{property}'")
+            logger.debug("Skipping validation for default property: '%s'", property)
             continue
-        # 2) Try to get property to check if it exists
-        prop_str, prop = get_name_and_object(property, store, logger=logger, suppress_warn=True)
-        if prop is None:
+        # 2) Try to get the compiled validator of the property to check if it exists
+        validator = get_property_validator(classes, property, store, logger=logger)
+        if validator is None:
+            prop_str = getattr(property, "name", property)
             logger.warning(f"Could not validate property target pairs. Property unknown: '{prop_str}'. ")
             return False
+        prop_str = validator.prop.name
         if validate_domain_range is True:
             # 3) Check domain of property
-            domain_valid = _validate_any_class_in_domain_of_prop(classes, prop, store, logger=logger)
-            if domain_valid is False:
+            if validator.domain_valid is False:
+                # Validate again with logging of the reason
+                _validate_any_class_in_domain_of_prop(classes, validator.prop, store, logger=logger)
                 logger.warning(f"Property Target-Pairs invalid. Classes '{classes}' not in domain of Property '{prop_str}'.")
                 return False
             # 4) Check if target is in range of property
-            range_valid = _validate_target_in_range_of_prop(target, property, store, logger=logger)
+            range_valid = _validate_target_with_property_validator(target, validator, store, logger=logger)
             if range_valid is False:
                 logger.warning(f"Property Target-Pairs invalid. Targets '{target}' not in range of Property '{prop_str}'.")
                 return False
@@ -543,19 +573,22 @@ def validate_property_target_pairs_for_classes(owl_class: Union[str, owlready2.T
 
 def _validate_any_class_in_domain_of_prop(classes: list[Union[str, owlready2.Thing]], 
                                           prop: Union[str, owlready2.Thing], 
-                                          store: owlready2.World, logger: Logger = UTILS_LOGGER) -> bool:
+                                          store: owlready2.World, logger: Logger = UTILS_LOGGER,
+                                          suppress_warn: bool = False) -> bool:
 
     # 1) Check if property is a property and if is default property
     if validate_if_entity_is_property(prop, store, logger=logger) is False:
-        logger.warning(f"Could not validate domain of property. Given 'property' is not a property: '{prop}'. ")
+        if not suppress_warn:
+            logger.warning(f"Could not validate domain of property. Given 'property' is not a property: '{prop}'. ")
         return False
     if prop in DEFAULT_PROPERTIES:
-        logger.debug(f"Skipping validation for default property: '{prop}'")
+        logger.debug("Skipping validation for default property: '%s'", prop)
         return True
     # 2) Get property and domain
     prop_str, prop = get_name_and_object(prop, store, logger=logger, suppress_warn=True)
     if prop is None:
-        logger.warning(f"Could not validate property target pairs. Property unknown: '{prop_str}'. ")
+        if not suppress_warn:
+            logger.warning(f"Could not validate property target pairs. Property unknown: '{prop_str}'. ")
         return False
     # 2) Skip validation if no domain is specified
     domain = prop.domain
@@ -572,124 +605,22 @@ def _validate_any_class_in_domain_of_prop(classes: list[Union[str, owlready2.Thi
                     if any(str(domain_class).startswith(prefix) for prefix in prefixes_to_skip):
                         return True
         # Return false if no match was found
-        logger.warning(f"Property '{prop_str}' has domain '{domain}' specified, but none of the classes '{classes}' are in the domain.")
+        if not suppress_warn:
+            logger.warning(f"Property '{prop_str}' has domain '{domain}' specified, but none of the classes '{classes}' are in the domain.")
         return False
 
 def _validate_target_in_range_of_prop(target: Union[str, owlready2.Thing], prop: Union[str, owlready2.Thing],
                                       store: owlready2.World, logger: Logger = UTILS_LOGGER) -> bool:
-    # 0) Get property and check
-    prop_str, prop = get_name_and_object(prop, store, logger=logger, suppress_warn=True)
-    if prop is None:
-        raise ValueError(f"Could not validate property target pairs. Property not found: '{prop_str}'. ")
+    # 0) Get compiled validator of property and check
+    validator = get_property_validator(None, prop, store, logger=logger)
+    if validator is None:
+        raise ValueError(f"Could not validate property target pairs. Property not found: '{getattr(prop, 'name', prop)}'. ")
     # 1) Validate Property (is property and not default property) and 
-    if validate_if_entity_is_property(prop, store, logger=logger) is False:
-        logger.warning(f"Could not validate range of property. Given 'property':'{prop}' is not a property. ")
+    if validator.is_property is False:
+        logger.warning(f"Could not validate range of property. Given 'property':'{validator.prop}' is not a property. ")
         return False
-    if prop in DEFAULT_PROPERTIES:
-        logger.debug(f"Skipping validation of range for default property: '{prop}'")
-        return True
-    # 2) if target is None -> return True (None is valid for all properties and used to "unassign a property"
-    if target is None:
-        logger.debug(f"Skipping validation of range for property '{prop}'. Target is 'None'.")
-        return True
-    # 3) get property type ('DataProperty', 'ObjectProperty') and if functional`(True/False)`
-    prop_type, is_functional = _determine_prop_type_and_if_functional(prop, store, logger=logger)
-    # 4) Validate ObjectProperty -> Target Object should exist and be in Range
-    if prop_type == 'ObjectProperty':
-        if is_functional is True:
-            if type(target) == list:
-                logger.warning(f"Target '{target}' was given in a list, but property '{prop_str}' is functional. Only single target allowed.")
-                return False
-            else:
-                return _validate_targets_in_object_property_range(target, prop, store, logger=logger)
-        elif is_functional is False: # Target should already be a list, as expected from _targets_in_object_property_range
-            if type(target) != list:
-                logger.warning(f"Single Target '{target}' was given, but property '{prop_str}' is not functional and expects a list of targets. Passs as [target].")
-                return False
-            else:
-                return _validate_targets_in_object_property_range(target, prop, store, logger=logger)
-    # 5) Validate DataProperty -> Target should be of correct datatype and satisfy constraints
-    elif prop_type == 'DataProperty':
-        if is_functional is True:
-            if type(target) == list:
-                logger.warning(f"Target '{target}' was given in a list, but property '{prop_str}' is functional. Only single target allowed.")
-                return False
-            else:
-                return _validate_targets_in_data_property_range(target, prop, store, logger=logger)
-        elif is_functional is False: # Target should already be a list, as expected from _targets_in_object_property_range
-            if type(target) != list:
-                logger.warning(f"Single Target '{target}' was given, but property '{prop_str}' is functional and expects a list of targets. Passs as [target].")
-                return False
-            else:
-                return _validate_targets_in_data_property_range(target, prop, store, logger=logger)
-    else:
-        raise RuntimeError(f"Could not validate range of property. Got unexpected result from '_determine_prop_type_and_if_functional': ({prop_type}, {is_functional})") 
-    # 6) Return True if all validations passed
-    return True
-
-def _validate_targets_in_object_property_range(targets: Union[str, owlready2.Thing, list[Union[str, owlready2.Thing]]], prop: Union[str, owlready2.Thing],
-                                                store: owlready2.World, logger: Logger = UTILS_LOGGER) -> bool:
-    # 0) Assert that type of targets is list / otherwise convert to list (allow same handling for functional and non functional properties)
-    if type(targets) != list:
-        targets = [targets]
-    # 1) Get property and check
-    prop_str, prop = get_name_and_object(prop, store, logger=logger, suppress_warn=True)
-    if prop is None:
-        raise ValueError(f"Could not validate range of ObjectProperty. Property unknown: '{prop_str}'. ")
-    # 2) For target in targets check if target exists and type is in range
-    range = prop.range
-    for target in targets:
-        # 2.1) Check if target exists
-        if entity_exists(target, store) is False:
-            logger.warning(f"Target '{target}'  not valid for ObjectProperty '{prop_str}'. Target does not exist.")
-            return False
-        # 2.2) Check if target is in range
-        if range == []:
-            continue
-        elif len(range) > 0:
-            for range_type in range:
-                if is_instance_of_type(target, range_type, store, include_subtypes=True, logger=logger):
-                    continue
-                else:
-                    logger.warning(f"Target '{target}' of type '{type(target)}' not valid for ObjectProperty '{prop_str}'. TargetType is not in range '{range}'.")
-                    return False
-        else:
-            raise RuntimeError(f"Could not validate range of property. Got unexpected result from 'prop.range': {range}. Expected list of length > 0.")
-    # 3) Return True only if all validations passed
-    return True
-    
-def _validate_targets_in_data_property_range(targets: Union[str, owlready2.Thing, list[Union[str, owlready2.Thing]]], prop: Union[str, owlready2.Thing],
-                                             store: owlready2.World, logger: Logger = UTILS_LOGGER) -> bool:
-    # 0) Assert that type of targets is list / otherwise convert to list (allow same handling for functional and non functional properties)
-    if type(targets) != list:
-        targets = [targets]
-    # 1) Get property and check
-    prop_str, prop = get_name_and_object(prop, store, logger=logger, suppress_warn=True)
-    if prop is None:
-        raise ValueError(f"Could not validate range of DataProperty. Property unknown: '{prop_str}'.")
-    # 2) Pass if no range is specified and extract allowed datatypes and constraints if present
-    range = prop.range 
-    if range == []:
-        return True
-    elif len(range) > 0:
-        # Get Types and constraints if present 
-        constraints = [ele for ele in range if type(ele) == owlready2.ConstrainedDatatype]
-        allowed_datatypes = [ele for ele in range if type(ele) != owlready2.ConstrainedDatatype]
-    # 3) Validate that each target is of allowed datatype and satisfies constraints
-    for target in targets:
-        # If no constraints present: Check if datatype correct, if constraints present: Also check if datatype constraints are satisfied
-        if len(constraints) == 0:
-            if type(target) not in allowed_datatypes:
-                logger.warning(f"Target '{target}' of type '{type(target)}' not valid for DataProperty '{prop_str}'. Target is not in allowed datatypes: {allowed_datatypes}.")
-                return False
-        elif len(constraints) >= 1:
-            validation_result = _validate_constraints_for_literal(target, constraints, logger=logger)
-            if validation_result is False:
-                return False
-        else:
-            raise RuntimeError(f"Could not validate DataTypeConstraints. Got unexpected number of Constraints (>1): {constraints}.")
-    # 4) Return True only if all validations passed
-    return True
+    # 2) - 6) Validate target against the precompiled range of the property
+    return _validate_target_with_property_validator(target, validator, store, logger=logger)
 
 def _validate_constraints_for_literal(literal: Any, constraints: Union[list[owlready2.ConstrainedDatatype], owlready2.ConstrainedDatatype],
                                      logger: Logger = UTILS_LOGGER) -> bool:
@@ -727,56 +658,7 @@ def _validate_single_constraint_for_literal(literal: Any, constraint: owlready2.
     :return: True if all constraints are fulfilled, False otherwise
     :rtype: bool
     """
-    validation_bool = True # Set to False if any constraint is violated
-    violations_list = [] # List of violated constraints (new messages are appended)
-    # 1) Check if base data type is fulfilled -> if not fulfilled immediately return False
-    if type(literal) != constraint.base_datatype:
-        violations_list.append(f"Value '{literal}' of type '{type(literal)}' not of correct base datatype, as specified by ConstrainedDatatype '{constraint}'.")
-        validation_bool = False
-    else:
-        # 2) If base data type is correct: Check for all constraints if they are fulfilled
-        if hasattr(constraint, "length"):
-            if len(literal) != constraint.length:
-                violations_list.append(f"Value '{literal}' of type '{type(literal)}' violates 'length' Constraint: '{constraint}'")
-                validation_bool = False 
-        if hasattr(constraint, "min_length"):
-            if len(literal) < constraint.min_length:
-                violations_list.append(f"Value '{literal}' of type '{type(literal)}' violates 'min_length' Constraint: '{constraint}'")
-                validation_bool = False
-        if hasattr(constraint, "max_length"):
-            if len(literal) > constraint.max_length:
-                violations_list.append(f"Value '{literal}' of type '{type(literal)}' violates 'max_length' Constraint: '{constraint}'")
-                validation_bool = False
-        if hasattr(constraint, "pattern"):
-            if re.match(constraint.pattern, literal) is None:
-                violations_list.append(f"Value '{literal}' of type '{type(literal)}' violates 'pattern' Constraint: '{constraint}'")
-                validation_bool = False
-        if hasattr(constraint, "white_space"):
-            raise NotImplementedError(f"Constraint 'white_space' not implemented yet. Constraint: '{constraint}'")
-        if hasattr(constraint, "max_inclusive"):
-            if literal > constraint.max_inclusive:
-                violations_list.append(f"Value '{literal}' of type '{type(literal)}' violates 'max_inclusive' Constraint: '{constraint}'")
-                validation_bool = False
-        if hasattr(constraint, "max_exclusive"):
-            if literal >= constraint.max_exclusive:
-                violations_list.append(f"Value '{literal}' of type '{type(literal)}' violates 'max_exclusive' Constraint: '{constraint}'")
-                validation_bool = False
-        if hasattr(constraint, "min_inclusive"):
-            if literal < constraint.min_inclusive:
-                violations_list.append(f"Value '{literal}' of type '{type(literal)}' violates 'min_inclusive' Constraint: '{constraint}'")
-                validation_bool = False
-        if hasattr(constraint, "min_exclusive"):
-            if literal <= constraint.min_exclusive:
-                violations_list.append(f"Value '{literal}' of type '{type(literal)}' violates 'min_exclusive' Constraint: '{constraint}'")
-                validation_bool = False
-        if hasattr(constraint, "total_digits"):
-            if len(str(literal).replace('.', '')) != constraint.total_digits:
-                violations_list.append(f"Value '{literal}' of type '{type(literal)}' violates 'total_digits' Constraint: '{constraint}'")
-                validation_bool = False
-        if hasattr(constraint, "fraction_digits"):
-            if len(str(literal).split('.')[1]) != constraint.fraction_digits:
-                violations_list.append(f"Value '{literal}' of type '{type(literal)}' violates 'fraction_digits' Constraint: '{constraint}'")
-                validation_bool = False
+    validation_bool, violations_list = get_compiled_constraint(constraint)(literal)
     # Logging
     if validation_bool is False and suppress_warn is False:
         violations = ';'.join(violations_list)
@@ -806,10 +688,10 @@ def validate_if_entity_is_property(entity: Union[str, owlready2.Thing],
     if prop_obj is None:
         logger.warning(f"Could not validate if entity is property. Entity unknown: '{entity}'. ")
         return False
-    if prop_str in [prop.name for prop in store.properties()]:
+    if prop_str in get_property_names(store):
         return True
     else:
-        logger.debug(f"Entity '{prop_str}' is not a property. Is of type '{type(prop_obj)}'.")
+        logger.debug("Entity '%s' is not a property. Is of type '%s'.", prop_str, type(prop_obj))
         return False
 
 def _determine_prop_type_and_if_functional(property: Union[str, owlready2.Thing], store: owlready2.World, logger: Logger = UTILS_LOGGER) -> tuple[str, bool]:
@@ -831,14 +713,14 @@ def _determine_prop_type_and_if_functional(property: Union[str, owlready2.Thing]
     # Only proceed if the property is of type property
     if prop is None:
         if property in DEFAULT_PROPERTIES:
-            logger.debug(f"Can't determine prop type or if functional for default property: '{property}'. Returning (None, None)")
+            logger.debug("Can't determine prop type or if functional for default property: '%s'. Returning (None, None)", property)
             return None, None
         else:
             raise ValueError(f"'{property}' could not be found.")
     # Assert Property Type
-    if prop in list(store.object_properties()):
+    if isinstance(prop, owlready2.ObjectPropertyClass):
         result_type = "ObjectProperty"
-    elif prop in list(store.data_properties()):
+    elif isinstance(prop, owlready2.DataPropertyClass):
         result_type = "DataProperty"
     else:
         raise ValueError(f"'{property}' of type '{type(property)}' is neither an ObjectProperty nor a DataProperty.")
@@ -849,11 +731,697 @@ def _determine_prop_type_and_if_functional(property: Union[str, owlready2.Thing]
         result_functional = False
     return result_type, result_functional
 
-### Functions for faster access to cached iris
+### Functions for compiled property validators
+
+class PropertyValidator(NamedTuple):
+    """Precompiled validation information of a property for a set of classes, see 'get_property_validator'."""
+    prop: owlready2.Thing
+    is_property: bool
+    domain_valid: bool
+    prop_type: str
+    is_functional: bool
+    object_range: list
+    datatypes: tuple
+    constraints: list
+
+
+def get_property_validator(classes: list, property: Union[str, owlready2.Thing], store: owlready2.World,
+                           logger: Logger = UTILS_LOGGER) -> PropertyValidator:
+    """Returns the compiled validator of the property for the given classes. The validator is
+    compiled on first request and cached in 'store.property_validators' keyed by (class set, property),
+    until the schema changes (see 'Graph.import_ontology'). It contains whether any class is in
+    the domain of the property, the property type, the functional flag, the range classes with
+    all their subclasses and the allowed datatypes and constraints. Returns None if the property is unknown.
+
+    :param classes: Class objects the property is applied to, None to compile the range only
+    :type classes: list
+    :param property: Property object or its name
+    :type property: Union[str, owlready2.Thing]
+    :param store: Store containing the property
+    :type store: owlready2.World
+    :param logger: logger, defaults to UTILS_LOGGER
+    :type logger: Logger, optional
+    :return: The compiled validator or None if the property is unknown
+    :rtype: PropertyValidator
+    """
+    property_validators = getattr(store, "property_validators", None)
+    if property_validators is None:
+        property_validators = store.property_validators = {}
+    class_storids = None if classes is None else frozenset(owl_class.storid for owl_class in classes)
+    key = (class_storids, getattr(property, "name", property))
+    validator = property_validators.get(key)
+    if validator is not None:
+        return validator
+    prop_str, prop = get_name_and_object(property, store, logger=logger, suppress_warn=True)
+    if prop is None:
+        return None
+    is_property = validate_if_entity_is_property(prop, store, logger=logger)
+    domain_valid = None
+    if classes is not None:
+        # Compiled without logging, the validators are also compiled if domain and range are not validated
+        domain_valid = _validate_any_class_in_domain_of_prop(classes, prop, store, logger=logger, suppress_warn=True)
+    prop_type, is_functional, object_range, datatypes, constraints = None, None, [], (), []
+    if isinstance(prop, owlready2.ObjectPropertyClass):
+        prop_type = "ObjectProperty"
+        # Range classes with the storids of all their subclasses (None for class constructs)
+        for range_type in prop.range:
+            range_storids = get_descendant_storids(range_type, store) if isinstance(range_type, owlready2.ThingClass) else None
+            object_range.append((range_type, range_storids))
+    elif isinstance(prop, owlready2.DataPropertyClass):
+        prop_type = "DataProperty"
+        constraints = [ele for ele in prop.range if type(ele) == owlready2.ConstrainedDatatype]
+        datatypes = tuple(ele for ele in prop.range if type(ele) != owlready2.ConstrainedDatatype)
+    if prop_type is not None:
+        is_functional = bool(prop.is_functional_for("this argument here does not seem to matter in owlready2"))
+    validator = PropertyValidator(prop, is_property, domain_valid, prop_type, is_functional, object_range, datatypes, constraints)
+    property_validators[key] = validator
+    return validator
+
+
+def _validate_target_with_property_validator(target: Any, validator: PropertyValidator, store: owlready2.World,
+                                             logger: Logger = UTILS_LOGGER) -> bool:
+    """Validates if the target is in the range of the property described by the compiled validator.
+
+    :param target: Target (or list of targets) of the property
+    :type target: Any
+    :param validator: Compiled validator of the property
+    :type validator: PropertyValidator
+    :param store: Store containing the property
+    :type store: owlready2.World
+    :param logger: logger, defaults to UTILS_LOGGER
+    :type logger: Logger, optional
+    :raises ValueError: If the property is neither an ObjectProperty nor a DataProperty
+    :return: True if the target is valid, False otherwise
+    :rtype: bool
+    """
+    prop_str = validator.prop.name
+    if prop_str in DEFAULT_PROPERTIES:
+        logger.debug("Skipping validation of range for default property: '%s'", prop_str)
+        return True
+    # None is valid for all properties and used to "unassign a property"
+    if target is None:
+        logger.debug("Skipping validation of range for property '%s'. Target is 'None'.", prop_str)
+        return True
+    if validator.prop_type is None:
+        raise ValueError(f"'{prop_str}' of type '{type(validator.prop)}' is neither an ObjectProperty nor a DataProperty.")
+    # Functional properties expect a single target, non functional properties a list of targets
+    if validator.is_functional is True and type(target) == list:
+        logger.warning(f"Target '{target}' was given in a list, but property '{prop_str}' is functional. Only single target allowed.")
+        return False
+    if validator.is_functional is False and type(target) != list:
+        logger.warning(f"Single Target '{target}' was given, but property '{prop_str}' is not functional and expects a list of targets. Passs as [target].")
+        return False
+    targets = target if type(target) == list else [target]
+    # ObjectProperty -> Target Objects should exist and be in range
+    if validator.prop_type == 'ObjectProperty':
+        for target in targets:
+            target_obj = get_entity_by_name(getattr(target, "name", target), store, suppress_warn=True)
+            if target_obj is None:
+                logger.warning(f"Target '{target}'  not valid for ObjectProperty '{prop_str}'. Target does not exist.")
+                return False
+            for range_type, range_storids in validator.object_range:
+                if range_storids is None:
+                    in_range = is_instance_of_type(target_obj, range_type, store, include_subtypes=True, logger=logger)
+                else:
+                    in_range = any(getattr(target_class, "storid", None) in range_storids for target_class in target_obj.is_a)
+                if in_range is False:
+                    logger.warning(f"Target '{target}' of type '{type(target)}' not valid for ObjectProperty '{prop_str}'. TargetType is not in range '{validator.prop.range}'.")
+                    return False
+        return True
+    # DataProperty -> Targets should be of correct datatype and satisfy constraints
+    if len(validator.datatypes) == 0 and len(validator.constraints) == 0:
+        return True
+    for target in targets:
+        if len(validator.constraints) == 0:
+            if type(target) not in validator.datatypes:
+                logger.warning(f"Target '{target}' of type '{type(target)}' not valid for DataProperty '{prop_str}'. Target is not in allowed datatypes: {list(validator.datatypes)}.")
+                return False
+        # Fast path with the compiled constraints, validate again with logging of all violations on failure
+        elif not any(get_compiled_constraint(constraint)(target)[0] for constraint in validator.constraints):
+            return _validate_constraints_for_literal(target, validator.constraints, logger=logger)
+    return True
+
+### Functions for compiled datatype constraints
+
+# Facets of a ConstrainedDatatype in the order they are checked, with the literal check for each facet value
+CONSTRAINT_FACET_CHECKS = {
+    "length": lambda value: lambda literal: len(literal) == value,
+    "min_length": lambda value: lambda literal: len(literal) >= value,
+    "max_length": lambda value: lambda literal: len(literal) <= value,
+    "pattern": lambda value: (lambda regex: lambda literal: regex.match(literal) is not None)(re.compile(value)),
+    "white_space": None,
+    "max_inclusive": lambda value: lambda literal: literal <= value,
+    "max_exclusive": lambda value: lambda literal: literal < value,
+    "min_inclusive": lambda value: lambda literal: literal >= value,
+    "min_exclusive": lambda value: lambda literal: literal > value,
+    "total_digits": lambda value: lambda literal: len(str(literal).replace('.', '')) == value,
+    "fraction_digits": lambda value: lambda literal: len(str(literal).split('.')[1]) == value,
+}
+# Facets which can be checked for whole numpy arrays at once
+NUMERIC_FACETS = ["max_inclusive", "max_exclusive", "min_inclusive", "min_exclusive"]
+# numpy dtype kinds matching the python base datatypes
+NUMPY_DTYPE_KINDS = {float: "f", int: "iu"}
+COMPILED_CONSTRAINTS = {} # Cache for compiled ConstrainedDatatypes by id, the compiled constraint keeps the constraint alive
+MAX_COMPILED_CONSTRAINTS = 1024
+
+
+class CompiledConstraint():
+    """ConstrainedDatatype compiled once into a table of facet checks (incl. precompiled regexes).
+    Calling it with a literal returns the same result as '_validate_single_constraint_for_literal'
+    without logging, 'validate_array' validates whole numpy arrays."""
+    def __init__(self, constraint: owlready2.ConstrainedDatatype) -> None:
+        self.constraint = constraint
+        self.base_datatype = constraint.base_datatype
+        self.facet_checks = []
+        for facet, build_check in CONSTRAINT_FACET_CHECKS.items():
+            if hasattr(constraint, facet):
+                if build_check is None:
+                    self.facet_checks.append((facet, None, self.__not_implemented(facet)))
+                    continue
+                facet_value = getattr(constraint, facet)
+                self.facet_checks.append((facet, facet_value, build_check(facet_value)))
+        # Numeric bounds are merged into a single check for the common case of valid literals
+        bounds = {facet: facet_value for facet, facet_value, _ in self.facet_checks if facet in NUMERIC_FACETS}
+        self.checks = [facet_check for facet_check in self.facet_checks if facet_check[0] not in NUMERIC_FACETS]
+        if bounds:
+            self.checks.insert(0, ("bounds", bounds, self.__bounds_check(**bounds)))
+
+    @staticmethod
+    def __bounds_check(min_inclusive=-math.inf, max_inclusive=math.inf, min_exclusive=None, max_exclusive=None):
+        if min_exclusive is None and max_exclusive is None:
+            return lambda literal: min_inclusive <= literal <= max_inclusive
+        min_exclusive = -math.inf if min_exclusive is None else min_exclusive
+        max_exclusive = math.inf if max_exclusive is None else max_exclusive
+        return lambda literal: min_inclusive <= literal <= max_inclusive and min_exclusive < literal < max_exclusive
+
+    def __not_implemented(self, facet: str):
+        def check(literal):
+            raise NotImplementedError(f"Constraint '{facet}' not implemented yet. Constraint: '{self.constraint}'")
+        return check
+
+    def __call__(self, literal: Any) -> tuple[bool, list[str]]:
+        # 1) Check if base data type is fulfilled -> if not fulfilled immediately return False
+        if type(literal) != self.base_datatype:
+            return False, [f"Value '{literal}' of type '{type(literal)}' not of correct base datatype, as specified by ConstrainedDatatype '{self.constraint}'."]
+        # 2) If base data type is correct: Check for all constraints if they are fulfilled
+        for _, _, check in self.checks:
+            if not check(literal):
+                violations_list = [f"Value '{literal}' of type '{type(literal)}' violates '{facet}' Constraint: '{self.constraint}'"
+                                   for facet, _, check in self.facet_checks if not check(literal)]
+                return False, violations_list
+        return True, []
+
+    def validate_array(self, values: 'np.ndarray') -> 'np.ndarray':
+        """Validates all values of a numpy array at once. Numeric facets are checked vectorized,
+        other facets and non numeric arrays element by element.
+
+        :param values: Array of literals
+        :type values: np.ndarray
+        :return: Boolean mask, True for valid values
+        :rtype: np.ndarray
+        """
+        import numpy as np
+        values = np.asarray(values)
+        dtype_kinds = NUMPY_DTYPE_KINDS.get(self.base_datatype)
+        if dtype_kinds is None or values.dtype.kind not in "biuf":
+            return np.fromiter((self(literal)[0] for literal in values.tolist()), dtype=bool, count=values.size).reshape(values.shape)
+        if values.dtype.kind not in dtype_kinds:
+            return np.zeros(values.shape, dtype=bool)
+        valid = np.ones(values.shape, dtype=bool)
+        for facet, facet_value, check in self.facet_checks:
+            if facet in NUMERIC_FACETS:
+                valid &= check(values)
+            else:
+                valid &= np.fromiter((check(literal) for literal in values.tolist()), dtype=bool, count=values.size).reshape(values.shape)
+        return valid
+
+
+def get_compiled_constraint(constraint: owlready2.ConstrainedDatatype) -> CompiledConstraint:
+    """Returns the compiled checks of a ConstrainedDatatype, compiling it on first request.
+
+    :param constraint: The Constraint to compile
+    :type constraint: owlready2.ConstrainedDatatype
+    :return: Compiled Constraint
+    :rtype: CompiledConstraint
+    """
+    compiled_constraint = COMPILED_CONSTRAINTS.get(id(constraint))
+    if compiled_constraint is None:
+        if len(COMPILED_CONSTRAINTS) >= MAX_COMPILED_CONSTRAINTS:
+            COMPILED_CONSTRAINTS.clear()
+        compiled_constraint = COMPILED_CONSTRAINTS[id(constraint)] = CompiledConstraint(constraint)
+    return compiled_constraint
+
+
+def validate_data_property_array(values: 'np.ndarray', prop: Union[str, owlready2.Thing], store: owlready2.World,
+                                 logger: Logger = UTILS_LOGGER) -> 'np.ndarray':
+    """Validates a whole numpy array of targets (e.g. confidences) against the range of a DataProperty at once.
+
+    :param values: Array of targets
+    :type values: np.ndarray
+    :param prop: DataProperty object or its name
+    :type prop: Union[str, owlready2.Thing]
+    :param store: Store containing the property
+    :type store: owlready2.World
+    :param logger: logger, defaults to UTILS_LOGGER
+    :type logger: Logger, optional
+    :raises ValueError: If the property is unknown or not a DataProperty
+    :return: Boolean mask, True for valid targets
+    :rtype: np.ndarray
+    """
+    import numpy as np
+    values = np.asarray(values)
+    validator = get_property_validator(None, prop, store, logger=logger)
+    if validator is None or validator.prop_type != "DataProperty":
+        raise ValueError(f"Could not validate array of targets. '{getattr(prop, 'name', prop)}' is no known DataProperty.")
+    # No range specified -> everything is valid
+    if len(validator.datatypes) == 0 and len(validator.constraints) == 0:
+        return np.ones(values.shape, dtype=bool)
+    # Valid if any constraint is satisfied, only datatypes are checked if there are no constraints
+    if len(validator.constraints) == 0:
+        if values.dtype.kind in "biuf":
+            dtype_valid = any(values.dtype.kind in NUMPY_DTYPE_KINDS.get(datatype, "") for datatype in validator.datatypes)
+            return np.full(values.shape, dtype_valid, dtype=bool)
+        return np.fromiter((type(literal) in validator.datatypes for literal in values.tolist()), dtype=bool,
+                           count=values.size).reshape(values.shape)
+    valid = np.zeros(values.shape, dtype=bool)
+    for constraint in validator.constraints:
+        valid |= get_compiled_constraint(constraint).validate_array(values)
+    if not valid.all():
+        logger.warning(f"{int((~valid).sum())} of {values.size} targets not valid for DataProperty '{validator.prop.name}'.")
+    return valid
+
+### Functions for saving and transactions
+
+def save_store(store: owlready2.World) -> None:
+    """Commits all changes of the store to its backend. The commit is skipped
+    while a transaction is open on the store (see 'Graph.transaction'), the changes
+    are then committed once when the outermost transaction exits.
+
+    :param store: Store to save
+    :type store: owlready2.World
+    """
+    if getattr(store, "open_transactions", 0) > 0:
+        return
+    store.save()
+
+
+@contextmanager
+def transaction(store: owlready2.World, logger: Logger = UTILS_LOGGER):
+    """Context manager to bundle multiple changes of the store into one commit.
+    All calls of 'save_store' within the block are suppressed and the changes are
+    committed once at exit. If an exception is raised within the block, the store is
+    rolled back (see 'rollback_store') and the exception is re-raised.
+    Nested transactions join the outermost transaction.
+
+    :param store: Store to open the transaction on
+    :type store: owlready2.World
+    :param logger: Logger Object, defaults to UTILS_LOGGER
+    :type logger: Logger, optional
+    :return: The store
+    :rtype: owlready2.World
+    """
+    # Commit pending changes first, so that a rollback only discards the changes of the transaction
+    if getattr(store, "open_transactions", 0) == 0:
+        store.save()
+    store.open_transactions = getattr(store, "open_transactions", 0) + 1
+    try:
+        yield store
+    except BaseException:
+        store.open_transactions -= 1
+        if store.open_transactions == 0:
+            rollback_store(store)
+            logger.warning("Transaction failed. Rolled back all changes since the start of the transaction.")
+        raise
+    store.open_transactions -= 1
+    if store.open_transactions == 0:
+        store.save()
+
+
+def rollback_store(store: owlready2.World) -> None:
+    """Discards all uncommitted changes of the store and brings the individuals already
+    loaded as python objects back in sync with the backend (names, types and property values).
+    Individuals created since the last commit are dropped, the per-store caches are rebuilt.
+
+    :param store: Store to roll back
+    :type store: owlready2.World
+    """
+    store.graph.db.rollback()
+    for storid, entity in list(store._entities.items()):
+        if not isinstance(entity, owlready2.Thing):
+            continue
+        types = [store._to_python(type_storid) for type_storid in store._get_obj_triples_sp_o(storid, owlready2.rdf_type)]
+        types = [type_ for type_ in types if type_ is not None and type_ is not owlready2.NamedIndividual]
+        # Individual did not exist before the transaction
+        if len(types) == 0:
+            store._entities.pop(storid, None)
+            continue
+        # Restore name, types and drop property values cached by owlready2
+        iri = store._unabbreviate(storid)
+        if iri != entity.iri and iri.startswith(entity.namespace._base_iri):
+            entity._name = iri[len(entity.namespace._base_iri):]
+        entity.is_a.reinit(types)
+        for attr in list(entity.__dict__):
+            if attr in store._props or attr.startswith("INVERSE_"):
+                del entity.__dict__[attr]
+    init_store_caches(store)
+
+### Functions for the per-store name index
+
+def init_name_index(store: owlready2.World) -> dict:
+    """(Re-)Builds the name index of the store and attaches it as 'store.name_index'.
+    The index maps the name of each entity (= part of its IRI after the last '#') to the
+    storids of all entities with this name. It replaces the wildcard IRI search in
+    'get_entity_by_name' and is kept up to date by the create, rename and destroy paths.
+
+    :param store: Store for which the index is built
+    :type store: owlready2.World
+    :return: The name index {name: [storid, ..]}
+    :rtype: dict
+    """
+    name_index = {}
+    # Same selection as store.search(iri=...): named resources that are subject of an object triple
+    resources = store.graph.execute("""
+        SELECT storid, iri FROM resources
+        WHERE INSTR(iri, '#') > 0 AND storid IN (SELECT s FROM objs)""")
+    for storid, iri in resources:
+        name_index.setdefault(iri.rpartition('#')[2], []).append(storid)
+    store.name_index = name_index
+    return name_index
+
+
+def add_to_name_index(entity: owlready2.Thing, store: owlready2.World) -> None:
+    """Adds an entity to the name index of the store (if the store has one).
+
+    :param entity: Entity to add
+    :type entity: owlready2.Thing
+    :param store: Store containing the entity
+    :type store: owlready2.World
+    """
+    name_index = getattr(store, "name_index", None)
+    if name_index is None or '#' not in entity.iri:
+        return
+    storids = name_index.setdefault(entity.iri.rpartition('#')[2], [])
+    if entity.storid not in storids:
+        storids.append(entity.storid)
+
+
+def remove_from_name_index(entity: owlready2.Thing, store: owlready2.World, name: str = None) -> None:
+    """Removes an entity from the name index of the store (if the store has one).
+
+    :param entity: Entity to remove
+    :type entity: owlready2.Thing
+    :param store: Store containing the entity
+    :type store: owlready2.World
+    :param name: Name under which the entity is indexed, defaults to the current name of the entity
+    :type name: str, optional
+    """
+    if name is None:
+        name = entity.iri.rpartition('#')[2]
+    # Cached iris and entities of the name are outdated as well
+    for cache_name in ["iri_cache", "entity_cache"]:
+        getattr(store, cache_name, {}).pop(name, None)
+    name_index = getattr(store, "name_index", None)
+    if name_index is None:
+        return
+    storids = name_index.get(name, [])
+    if entity.storid in storids:
+        storids.remove(entity.storid)
+        if len(storids) == 0:
+            name_index.pop(name)
+
+### Functions for the per-store adjacency index of CausalEdges
+
+def init_adjacency_index(store: owlready2.World) -> AdjacencyIndex:
+    """(Re-)Builds the adjacency index of the store from all edges with 'hasCause' and/or 'hasEffect'
+    and attaches it as 'store.adjacency_index'. It is kept up to date by the create, update and
+    destroy paths and replaces SPARQL queries for the neighbors of a node (see 'Query').
+
+    :param store: Store for which the index is built
+    :type store: owlready2.World
+    :return: The adjacency index
+    :rtype: AdjacencyIndex
+    """
+    has_cause = get_entity_by_name("hasCause", store, suppress_warn=True)
+    has_effect = get_entity_by_name("hasEffect", store, suppress_warn=True)
+    if has_cause is None or has_effect is None:
+        adjacency_index = AdjacencyIndex(None, None)
+    else:
+        adjacency_index = AdjacencyIndex(has_cause.storid, has_effect.storid)
+        edges = store.graph.execute("""
+            SELECT causes.s, causes.o, effects.o FROM objs causes
+            LEFT JOIN objs effects ON effects.s = causes.s AND effects.p = ?
+            WHERE causes.p = ?
+            UNION ALL
+            SELECT effects.s, NULL, effects.o FROM objs effects
+            WHERE effects.p = ? AND NOT EXISTS (SELECT 1 FROM objs causes WHERE causes.s = effects.s AND causes.p = ?)""",
+            (has_effect.storid, has_cause.storid, has_effect.storid, has_cause.storid))
+        for edge, cause, effect in edges:
+            if cause is not None and effect is not None:
+                adjacency_index.add_edge(edge, cause, effect)
+            else:
+                adjacency_index.add_dangling_edge(edge, cause if cause is not None else effect)
+    store.adjacency_index = adjacency_index
+    return adjacency_index
+
+
+def get_adjacency_index(store: owlready2.World) -> AdjacencyIndex:
+    """Returns the adjacency index of the store, builds it if not present.
+
+    :param store: Store containing the CausalEdges
+    :type store: owlready2.World
+    :return: The adjacency index
+    :rtype: AdjacencyIndex
+    """
+    adjacency_index = getattr(store, "adjacency_index", None)
+    if adjacency_index is None:
+        adjacency_index = init_adjacency_index(store)
+    return adjacency_index
+
+
+def update_adjacency_index(individual: owlready2.Thing, store: owlready2.World) -> None:
+    """Updates the adjacency index of the store (if the store has one) after the individual was
+    created or its properties changed. The individual is (re-)indexed as edge if it has a
+    'hasCause' and a 'hasEffect', as dangling edge if it has only one of them, otherwise it is dropped.
+
+    :param individual: Created or updated individual
+    :type individual: owlready2.Thing
+    :param store: Store containing the individual
+    :type store: owlready2.World
+    """
+    adjacency_index = getattr(store, "adjacency_index", None)
+    if adjacency_index is None or adjacency_index.has_cause_storid is None:
+        return
+    ends = {}
+    for prop, target in store.graph.execute("SELECT p, o FROM objs WHERE s = ? AND p IN (?, ?)",
+                                            (individual.storid, adjacency_index.has_cause_storid,
+                                             adjacency_index.has_effect_storid)):
+        ends[prop] = target
+    if len(ends) == 2:
+        adjacency_index.add_edge(individual.storid, ends[adjacency_index.has_cause_storid],
+                                 ends[adjacency_index.has_effect_storid])
+    elif len(ends) == 1:
+        adjacency_index.add_dangling_edge(individual.storid, next(iter(ends.values())))
+    else:
+        adjacency_index.remove_edge(individual.storid)
+
+
+def remove_from_adjacency_index(entity: owlready2.Thing, store: owlready2.World) -> None:
+    """Removes an entity which is about to be destroyed from the adjacency index of the store (if the
+    store has one): as edge and as node, since destroying a node also removes its edges' 'hasCause'/'hasEffect'.
+
+    :param entity: Entity to remove
+    :type entity: owlready2.Thing
+    :param store: Store containing the entity
+    :type store: owlready2.World
+    """
+    adjacency_index = getattr(store, "adjacency_index", None)
+    if adjacency_index is None:
+        return
+    adjacency_index.remove_edge(entity.storid)
+    adjacency_index.remove_node(entity.storid)
+
+
+### Functions for the per-store schema name sets
+
+def init_schema_names(store: owlready2.World) -> None:
+    """(Re-)Builds the sets of class names and property names of the store and attaches them
+    as 'store.class_names' and 'store.property_names'.
+
+    :param store: Store for which the name sets are built
+    :type store: owlready2.World
+    """
+    def _names_of_type(type_storids: tuple) -> frozenset:
+        # Read from the quadstore instead of loading all classes and properties as python objects
+        rows = store.graph.execute(f"""SELECT iri FROM resources WHERE storid IN (SELECT s FROM objs
+                                       WHERE p = ? AND s > 0 AND o IN ({",".join("?" * len(type_storids))}))""",
+                                   (owlready2.rdf_type, *type_storids))
+        return frozenset(iri[max(iri.rfind('#'), iri.rfind('/')) + 1:] for (iri,) in rows)
+    store.class_names = _names_of_type((owlready2.owl_class,))
+    store.property_names = _names_of_type((owlready2.owl_object_property, owlready2.owl_data_property,
+                                           owlready2.owl_annotation_property))
+
+
+def get_class_names(store: owlready2.World) -> frozenset:
+    """Returns the names of all classes in the store. The set is built once and kept
+    until the schema changes (see 'init_store_caches').
+
+    :param store: Store containing the classes
+    :type store: owlready2.World
+    :return: Names of all classes in the store
+    :rtype: frozenset
+    """
+    if getattr(store, "class_names", None) is None:
+        init_schema_names(store)
+    return store.class_names
+
+
+def get_property_names(store: owlready2.World) -> frozenset:
+    """Returns the names of all properties in the store. The set is built once and kept
+    until the schema changes (see 'init_store_caches').
+
+    :param store: Store containing the properties
+    :type store: owlready2.World
+    :return: Names of all properties in the store
+    :rtype: frozenset
+    """
+    if getattr(store, "property_names", None) is None:
+        init_schema_names(store)
+    return store.property_names
+
+### Functions for the per-store class closure
+
+def init_class_closure(store: owlready2.World) -> dict:
+    """(Re-)Builds the class closure of the store and attaches it as 'store.class_closure'.
+    The direct rdfs:subClassOf relations are read once from the quadstore, the transitive
+    descendants and ancestors of each class are materialized on first request and kept
+    until the schema changes (see 'Graph.import_ontology').
+
+    :param store: Store for which the closure is built
+    :type store: owlready2.World
+    :return: The class closure {'children': .., 'parents': .., 'descendants': .., 'ancestors': ..}
+    :rtype: dict
+    """
+    children = {}
+    parents = {}
+    subclass_relations = store.graph.execute("SELECT s, o FROM objs WHERE p = ?", (owlready2.rdfs_subclassof,))
+    for subclass, parent in subclass_relations:
+        children.setdefault(parent, set()).add(subclass)
+        parents.setdefault(subclass, set()).add(parent)
+    class_closure = {'children': children, 'parents': parents, 'descendants': {}, 'ancestors': {}}
+    store.class_closure = class_closure
+    return class_closure
+
+
+def _transitive_closure(storid: int, relations: dict, materialized: dict) -> frozenset:
+    """Returns all storids reachable from 'storid' via 'relations' (including 'storid' itself)
+    and stores the result in 'materialized'."""
+    closure = materialized.get(storid)
+    if closure is None:
+        reached = {storid}
+        to_visit = [storid]
+        while to_visit:
+            for related in relations.get(to_visit.pop(), ()):
+                if related not in reached:
+                    reached.add(related)
+                    to_visit.append(related)
+        closure = frozenset(reached)
+        materialized[storid] = closure
+    return closure
+
+
+def get_descendant_storids(owl_class: owlready2.EntityClass, store: owlready2.World) -> frozenset:
+    """Returns the storids of the class and all its (transitive) subclasses from the class closure.
+    Returns None if the store has no class closure.
+
+    :param owl_class: Class object
+    :type owl_class: owlready2.EntityClass
+    :param store: Store containing the class
+    :type store: owlready2.World
+    :return: Storids of the class and all its subclasses
+    :rtype: frozenset
+    """
+    class_closure = getattr(store, "class_closure", None)
+    if class_closure is None:
+        return None
+    return _transitive_closure(owl_class.storid, class_closure['children'], class_closure['descendants'])
+
+
+def get_ancestor_storids(owl_class: owlready2.EntityClass, store: owlready2.World) -> frozenset:
+    """Returns the storids of the class and all its (transitive) superclasses from the class closure.
+    Returns None if the store has no class closure.
+
+    :param owl_class: Class object
+    :type owl_class: owlready2.EntityClass
+    :param store: Store containing the class
+    :type store: owlready2.World
+    :return: Storids of the class and all its superclasses
+    :rtype: frozenset
+    """
+    class_closure = getattr(store, "class_closure", None)
+    if class_closure is None:
+        return None
+    return _transitive_closure(owl_class.storid, class_closure['parents'], class_closure['ancestors'])
+
+
+def get_instance_storids(owl_class: owlready2.EntityClass, store: owlready2.World) -> list:
+    """Returns the storids of all individuals of the class and its subclasses, without
+    loading the individuals themselves.
+
+    :param owl_class: Class object
+    :type owl_class: owlready2.EntityClass
+    :param store: Store containing the individuals
+    :type store: owlready2.World
+    :return: Storids of all individuals of the class and its subclasses
+    :rtype: list
+    """
+    class_storids = get_descendant_storids(owl_class, store)
+    if class_storids is None:
+        instances = store.sparql("SELECT ?x { ?x a [rdfs:subClassOf* " + f"<{owl_class.iri}>]" + " .}")
+        return list(dict.fromkeys(instance[0].storid for instance in instances))
+    class_storids_str = ",".join(str(storid) for storid in class_storids)
+    rows = store.graph.execute(f"SELECT DISTINCT s FROM objs WHERE p = ? AND o IN ({class_storids_str})",
+                               (owlready2.rdf_type,))
+    return [row[0] for row in rows]
+
+
+def init_store_caches(store: owlready2.World) -> None:
+    """(Re-)Builds all per-store indices and caches. Needs to be called whenever the
+    schema of the store changes, i.e. after importing an ontology.
+
+    :param store: Store for which the caches are built
+    :type store: owlready2.World
+    """
+    init_name_index(store)
+    init_class_closure(store)
+    init_schema_names(store)
+    store.property_validators = {}
+    store.iri_cache = OrderedDict()
+    store.entity_cache = OrderedDict()
+    init_adjacency_index(store)
+
+### Functions for faster access to cached iris and entities
+
+def _get_store_cache(store: owlready2.World, cache_name: str) -> OrderedDict:
+    """Returns the bounded cache 'cache_name' of the store, creates it if not present."""
+    cache = getattr(store, cache_name, None)
+    if cache is None:
+        cache = OrderedDict()
+        setattr(store, cache_name, cache)
+    return cache
+
+
+def _add_to_store_cache(cache: OrderedDict, key: str, value: Any) -> None:
+    """Adds the value to the bounded cache, dropping the least recently used entry if full."""
+    cache[key] = value
+    if len(cache) > MAX_CACHE_SIZE:
+        cache.popitem(last=False)
+
 
 def get_iri_from_cache_by_entity_name(name: str, store: owlready2.World,
                                        logger: Logger = UTILS_LOGGER, suppress_warn=False) -> str:
-    """Gets the iri of the entity with the given name from the cached iris.
+    """Gets the iri of the entity with the given name from the cached iris of the store.
+    The cache is bounded to MAX_CACHE_SIZE entries and reset whenever the schema of the store
+    changes (see 'init_store_caches').
 
     :param name: Name of the entity to get the iri from 
     :type name: str
@@ -866,17 +1434,144 @@ def get_iri_from_cache_by_entity_name(name: str, store: owlready2.World,
     :return: Iri of the entity with the given name
     :rtype: str
     """
-    global CACHED_IRIS
-    # 1) First try to get iri directly from CACHED_IRIS
+    iri_cache = _get_store_cache(store, "iri_cache")
+    # 1) First try to get iri directly from the cache of the store
+    iri = iri_cache.get(name)
+    if iri is not None:
+        iri_cache.move_to_end(name)
+        return iri
+    # 2) If not cached -> get entity by_name and add to cached iris (if not None)
+    entity = get_entity_by_name(name, store, logger=logger, suppress_warn=suppress_warn)
+    if entity is None:
+        return None
+    _add_to_store_cache(iri_cache, name, entity.iri)
+    return entity.iri
+
+
+def get_entity_from_cache_by_name(name: str, store: owlready2.World,
+                                  logger: Logger = UTILS_LOGGER, suppress_warn=False) -> owlready2.EntityClass:
+    """Gets the class or property with the given name (e.g. 'CausalNode', 'CausalEdge', 'hasCause',
+    'hasEffect') from the cached entities of the store. Individuals are not cached, they are
+    returned via 'get_entity_by_name'. The cache is bounded to MAX_CACHE_SIZE entries and reset
+    whenever the schema of the store changes (see 'init_store_caches').
+
+    :param name: Name of the class or property
+    :type name: str
+    :param store: Store in which to check for entity's existence
+    :type store: owlready2.World
+    :param logger: logger, defaults to UTILS_LOGGER
+    :type logger: Logger, optional
+    :param suppress_warn: Switch to suppress logging of warnings, defaults to False
+    :type suppress_warn: bool, optional
+    :return: The class or property object
+    :rtype: owlready2.EntityClass
+    """
+    entity_cache = _get_store_cache(store, "entity_cache")
+    entity = entity_cache.get(name)
+    if entity is not None:
+        entity_cache.move_to_end(name)
+        return entity
+    entity = get_entity_by_name(name, store, logger=logger, suppress_warn=suppress_warn)
+    if isinstance(entity, (owlready2.ThingClass, owlready2.PropertyClass)):
+        _add_to_store_cache(entity_cache, name, entity)
+    return entity
+
+### Functions for pre-built ontology templates
+
+def get_onto_version_info(onto_path: Union[str, Path]) -> str:
+    """Reads the owl:versionInfo annotation of an ontology file (OWL/XML or RDF/XML) without
+    parsing the ontology. Returns None if the ontology has no version info.
+
+    :param onto_path: Path to the ontology file
+    :type onto_path: Union[str, Path]
+    :return: Version info of the ontology
+    :rtype: str
+    """
+    onto_text = Path(onto_path).read_text(encoding="utf-8")
+    version_match = re.search(r'abbreviatedIRI="owl:versionInfo"/>\s*<Literal[^>]*>([^<]*)</Literal>', onto_text) or \
+                    re.search(r'<owl:versionInfo[^>]*>([^<]*)</owl:versionInfo>', onto_text)
+    if version_match is None:
+        return None
+    return version_match.group(1).strip()
+
+
+def get_onto_template_path(onto_path: Union[str, Path], template_dir: Union[str, Path] = None) -> Path:
+    """Returns the path of the pre-built template of an ontology. The template is keyed by the
+    owl:versionInfo and a hash of the ontology file, so that changed ontologies get a new template.
+
+    :param onto_path: Path to the ontology file
+    :type onto_path: Union[str, Path]
+    :param template_dir: Directory of the templates, defaults to ONTO_TEMPLATE_DIR
+    :type template_dir: Union[str, Path], optional
+    :return: Path of the template (which does not need to exist yet)
+    :rtype: Path
+    """
+    if template_dir is None:
+        template_dir = ONTO_TEMPLATE_DIR
+    version_info = get_onto_version_info(onto_path) or "unversioned"
+    version_info = re.sub(r'[^\w.-]', '_', version_info)
+    onto_hash = hashlib.sha256(Path(onto_path).read_bytes()).hexdigest()[:12]
+    return Path(template_dir) / f"{Path(onto_path).stem}_{version_info}_{onto_hash}.sqlite3"
+
+
+def build_onto_template(onto_path: Union[str, Path], template_path: Union[str, Path]) -> Path:
+    """Parses the ontology once into a new SQLite store at 'template_path'. The store is written
+    to a temporary file first and then moved, so concurrent processes never see a partial template.
+
+    :param onto_path: Path to the ontology file
+    :type onto_path: Union[str, Path]
+    :param template_path: Path of the template to be built
+    :type template_path: Union[str, Path]
+    :return: Path of the template
+    :rtype: Path
+    """
+    template_path = Path(template_path)
+    template_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = template_path.with_suffix(f".{os.getpid()}.tmp")
+    template_store = owlready2.World(filename=str(tmp_path))
     try:
-        iri = CACHED_IRIS[name]
-    # 2) If key error -> get entity by_name and add to cached entities (if not None)
-    except KeyError:
-        entity = get_entity_by_name(name, store, logger=logger, suppress_warn=suppress_warn)
-        if entity is None:
-            return None
-        else:
-            iri = entity.iri    
-            CACHED_IRIS[name] = iri
-    # 3) Return iri
-    return iri
+        template_store.get_ontology(f"file://{Path(onto_path).absolute()}").load()
+        template_store.save()
+    finally:
+        template_store.close()
+    os.replace(tmp_path, template_path)
+    return template_path
+
+
+def load_onto_template(onto_path: Union[str, Path], store: owlready2.World,
+                       logger: Logger = UTILS_LOGGER) -> owlready2.Ontology:
+    """Loads the ontology into an empty store by copying its pre-built template with the SQLite
+    backup API instead of parsing the ontology file. The template is built on first use.
+    Returns None if the store is not empty, the ontology is then to be imported regularly.
+
+    :param onto_path: Path to the ontology file
+    :type onto_path: Union[str, Path]
+    :param store: Empty store (in memory or new SQLite file) to load the template into
+    :type store: owlready2.World
+    :param logger: logger, defaults to UTILS_LOGGER
+    :type logger: Logger, optional
+    :return: The loaded ontology
+    :rtype: owlready2.Ontology
+    """
+    if list(store.ontologies) != [ANONYMOUS_ONTO_IRI]:
+        return None
+    template_path = get_onto_template_path(onto_path)
+    if not template_path.is_file():
+        build_onto_template(onto_path, template_path)
+        logger.info("Built ontology template '%s' from '%s'.", template_path, onto_path)
+    store.graph.db.commit()
+    template_db = sqlite3.connect(f"file:{template_path}?mode=ro", uri=True)
+    try:
+        template_db.backup(store.graph.db)
+    finally:
+        template_db.close()
+    # Sync the in-python state of the quadstore with the copied database, as 'World.set_backend' does
+    store.graph.prop_fts = {storid for (storid,) in store.graph.execute("SELECT storid FROM prop_fts")}
+    store.graph.current_changes = store.graph.db.total_changes
+    for onto_iri in store.graph.ontologies_iris():
+        store.get_ontology(onto_iri)
+    onto = next(onto for onto_iri, onto in store.ontologies.items() if onto_iri != ANONYMOUS_ONTO_IRI)
+    init_store_caches(store)
+    logger.info("Loaded Ontology '%s' from template '%s'.", onto.base_iri, template_path)
+    return onto
+
@@ -0,0 +1,25 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: MIT
+
+"""Shared fixtures of the tests
+"""
+
+# general imports
+import pytest
+# causalgraph imports
+import causalgraph.utils.onto_cache as onto_cache
+import causalgraph.utils.owlready2_utils as owlutils
+
+
+########################################
+###         Fixtures                 ###
+########################################
+@pytest.fixture(name="user_cache_dir", scope="session", autouse=True)
+def fixture_user_cache_dir(tmp_path_factory):
+    """Ontology templates and the ontology cache of the tests are written to a temporary directory"""
+    cache_dir = tmp_path_factory.mktemp("causalgraph_cache")
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(owlutils, "ONTO_TEMPLATE_DIR", cache_dir / "templates")
+        monkeypatch.setattr(onto_cache, "ONTO_CACHE_DIR", cache_dir / "onto_cache")
+        yield cache_dir
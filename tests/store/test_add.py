@@ -7,6 +7,7 @@
 
 # general imports
 import os
+import logging
 from pathlib import Path
 import pytest
 import owlready2
@@ -424,3 +425,144 @@ def test_prohibited_creation_of_edge_between_creator_and_causal_node(pizza_graph
     potential_edge = pizza_graph.add.causal_edge(creator_node, causal_node)
     # Should result in none
     assert potential_edge is None
+
+
+### Tests for graph.add.causal_edges
+def test_add_causal_edges_in_bulk(graph: Graph):
+    """Test that multiple edges incl. confidence, timelag and properties are created at once"""
+    graph.add.causal_node("bulk_cause")
+    rows = [("bulk_cause", "bulk_effect"),
+            ("bulk_effect", "bulk_other", 0.5, 2.0, {"comment": ["bulk comment"]})]
+    result = graph.add.causal_edges(rows, force_create=True)
+    assert result.num_created == 2 and result.failures == {}
+    assert result.created[0].hasCause == get_entity_by_name("bulk_cause", graph.store)
+    assert result.created[1].hasConfidence == 0.5
+    assert result.created[1].hasTimeLag == 2.0
+    assert result.created[1].comment == ["bulk comment"]
+    assert count_instances_of_type("CausalNode", graph.store) == 3
+
+
+def test_add_causal_edges_reports_failed_rows(graph: Graph):
+    """Test that invalid rows are reported per row while valid rows are still created"""
+    graph.add.causal_node("node_a")
+    graph.add.causal_node("node_b")
+    creator = graph.add.individual_of_type("Creator", "bulk_creator")
+    rows = [("node_a", "node_b"),
+            ("node_a", "does_not_exist"),
+            ("node_a", "node_b", 3.0),
+            ("node_a", "node_b", None, -1.0),
+            ("node_a", "node_b", None, None, {"quatsch": 1}),
+            (creator, "node_b"),
+            ("only_one_element",)]
+    result = graph.add.causal_edges(rows)
+    assert result.num_created == 1
+    assert result.created[0] is not None
+    assert sorted(result.failures) == [1, 2, 3, 4, 5, 6]
+    assert count_instances_of_type("CausalEdge", graph.store) == 1
+
+
+def test_add_causal_edges_validates_rows_before_changing_the_store(graph: Graph):
+    """Test that rows with invalid values are reported and do not change the store"""
+    graph.add.causal_node("node_a")
+    event = graph.add.individual_of_type("Event", "event")
+    rows = [("node_a", "node_a", "high"),
+            (["node_a"], "node_a"),
+            ("node_a", "node_a", None, None, {"hasCause": "node_a"}),
+            (event, "node_a", None, None, {"quatsch": 1}),
+            ("node_a", "new_node", None, None, {"quatsch": 1}),
+            ("node_a", "node_a")]
+    result = graph.add.causal_edges(rows, force_create=True)
+    assert sorted(result.failures) == [0, 1, 2, 3, 4]
+    assert result.created[5].hasCause.name == "node_a"
+    assert [node_type.name for node_type in event.is_a] == ["Event"]
+    assert get_entity_by_name("new_node", graph.store, suppress_warn=True) is None
+    assert count_instances_of_type("CausalEdge", graph.store) == 1
+
+
+### Tests for graph.add.causal_nodes
+def test_add_causal_nodes_in_bulk(graph: Graph):
+    """Test that multiple nodes with and without properties are created at once"""
+    creator = graph.add.individual_of_type("Creator", "bulk_creator")
+    result = graph.add.causal_nodes(["bulk_node_1", ("bulk_node_2", {"hasCreator": [creator], "comment": ["bulk"]})])
+    assert result.num_created == 2 and result.failures == {}
+    assert [node.name for node in result.created] == ["bulk_node_1", "bulk_node_2"]
+    assert result.created[1].hasCreator == [creator]
+    assert count_instances_of_type("CausalNode", graph.store) == 2
+
+
+def test_add_causal_nodes_reports_failed_nodes(graph: Graph):
+    """Test that invalid names and properties are reported per node, existing CausalNodes are returned"""
+    existing_node = graph.add.causal_node("existing_node")
+    graph.add.individual_of_type("Creator", "existing_creator")
+    nodes = ["existing_node", "CausalNode", "existing_creator", ("new_node", {"quatsch": 1}), 42, "new_node"]
+    result = graph.add.causal_nodes(nodes)
+    assert result.created[0] is existing_node
+    assert sorted(result.failures) == [1, 2, 3, 4]
+    assert result.created[5].name == "new_node"
+    assert count_instances_of_type("CausalNode", graph.store) == 2
+
+
+def test_add_causal_nodes_returns_existing_nodes_of_causal_node_subclasses(graph: Graph):
+    """Test that existing nodes typed with a subclass of CausalNode are returned and updated"""
+    machine_event = graph.add.individual_of_type("Machine_Event", "machine_event")
+    result = graph.add.causal_nodes(["machine_event", ("machine_event", {"comment": ["updated"]})])
+    assert result.failures == {}
+    assert result.created == [machine_event, machine_event]
+    assert machine_event.comment == ["updated"]
+    assert [node_type.name for node_type in machine_event.is_a] == ["Machine_Event"]
+
+
+def test_add_logs_are_formatted_lazily(graph: Graph, caplog):
+    """Test that info logs are only rendered if the level is enabled"""
+    for node_name in ["lazy_cause", "lazy_effect", "lazy_effect_2"]:
+        graph.add.causal_node(node_name)
+    with caplog.at_level(logging.WARNING, logger=graph.logger.name):
+        graph.add.causal_edge("lazy_cause", "lazy_effect")
+    assert "Created CausalEdge" not in caplog.text
+    with caplog.at_level(logging.INFO, logger=graph.logger.name):
+        graph.add.causal_edge("lazy_cause", "lazy_effect_2")
+    assert "Created CausalEdge between cause 'lazy_cause' and effect 'lazy_effect_2'" in caplog.text
+
+
+def test_enforce_dag_rejects_cycles():
+    """Test that Graph(enforce_dag=True) rejects CausalEdges closing a cycle, also in bulk"""
+    graph = Graph(sql_db_filename=None, enforce_dag=True)
+    graph.add.causal_nodes(["A", "B", "C"])
+    assert graph.add.causal_edge("A", "B") is not None
+    assert graph.add.causal_edge("B", "C") is not None
+    assert graph.add.causal_edge("C", "A") is None
+    assert graph.add.causal_edge("B", "B") is None
+    assert graph.add.causal_edge("A", "C") is not None
+    result = graph.add.causal_edges([("C", "B"), ("D", "A"), ("A", "D")], force_create=True)
+    assert result.num_created == 1 and sorted(result.failures) == [0, 2]
+    assert graph.query.is_reachable("C", "A") is False
+    # Without enforce_dag cycles are allowed
+    cyclic_graph = Graph(sql_db_filename=None)
+    cyclic_graph.add.causal_nodes(["A", "B"])
+    cyclic_graph.add.causal_edge("A", "B")
+    assert cyclic_graph.add.causal_edge("B", "A") is not None
+
+
+def test_enforce_dag_exempts_time_lagged_edges():
+    """Test that CausalEdges with hasTimeLag > 0 can close cycles if they are exempt"""
+    graph = Graph(sql_db_filename=None, enforce_dag=True, exempt_time_lagged_edges=True)
+    graph.add.causal_nodes(["A", "B"])
+    graph.add.causal_edge("A", "B")
+    assert graph.add.causal_edge("B", "A", time_lag_s=0.0) is None
+    assert graph.add.causal_edge("B", "A", time_lag_s=5.0) is not None
+    assert graph.add.causal_edge("B", "A", hasTimeLag=2.0) is not None
+    not_exempt_graph = Graph(sql_db_filename=None, enforce_dag=True)
+    not_exempt_graph.add.causal_nodes(["A", "B"])
+    not_exempt_graph.add.causal_edge("A", "B")
+    assert not_exempt_graph.add.causal_edge("B", "A", time_lag_s=5.0) is None
+
+
+def test_enforce_dag_rejected_edge_does_not_force_create_nodes():
+    """Test that a CausalEdge rejected by enforce_dag leaves no force created CausalNode behind"""
+    graph = Graph(sql_db_filename=None, enforce_dag=True)
+    num_nodes = count_instances_of_type("CausalNode", graph.store)
+    assert graph.add.causal_edge("Z_new", "Z_new", force_create=True) is None
+    assert get_entity_by_name("Z_new", graph.store, suppress_warn=True) is None
+    assert count_instances_of_type("CausalNode", graph.store) == num_nodes
+    assert graph.add.causal_edge("Z_new", "Y_new", force_create=True) is not None
+    assert count_instances_of_type("CausalNode", graph.store) == num_nodes + 2
@@ -422,3 +422,33 @@ def test_description_change_description(graph: Graph):
     node_3 = get_entity_by_name('Node 3', graph.store)
     assert succ is True
     assert node_3.comment[0] == 'New description!'
+
+
+def test_enforce_dag_on_edited_edges():
+    """Test that changing cause, effect or time lag of a CausalEdge can't close a cycle with enforce_dag=True"""
+    graph = Graph(sql_db_filename=None, enforce_dag=True, exempt_time_lagged_edges=True)
+    graph.add.causal_nodes(["A", "B", "C"])
+    graph.add.causal_edge("A", "B", "edge_AB")
+    graph.add.causal_edge("B", "C", "edge_BC")
+    graph.add.causal_edge("C", "A", "edge_CA", time_lag_s=5.0)
+    assert graph.edit.property("edge_CA", "hasTimeLag", 0.0) is False
+    assert graph.edit.property("edge_BC", "hasEffect", graph.get_entity("A")) is False
+    # Moving the edge itself does not count as cycle
+    assert graph.edit.property("edge_AB", "hasEffect", graph.get_entity("C")) is True
+    assert graph.edit.property("edge_BC", "hasCause", graph.get_entity("A")) is True
+    assert [node.name for node in graph.query.children("A")] == ["C"]
+
+
+def test_enforce_dag_rechecks_edges_with_changed_time_lag():
+    """Test that exempt time-lagged CausalEdges are checked again when their hasTimeLag is changed or deleted"""
+    graph = Graph(sql_db_filename=None, enforce_dag=True, exempt_time_lagged_edges=True)
+    graph.add.causal_nodes(["A", "B", "C"])
+    graph.add.causal_edge("A", "B", "edge_AB")
+    graph.add.causal_edge("B", "A", "edge_BA", time_lag_s=5.0)
+    graph.add.causal_edge("B", "C", "edge_BC", time_lag_s=5.0)
+    assert graph.edit.delete_property("edge_BA", "hasTimeLag") is False
+    assert graph.get_entity("edge_BA").hasTimeLag == 5.0
+    # Without time lag the edge is part of the order again and prevents cycles
+    assert graph.edit.delete_property("edge_BC", "hasTimeLag") is True
+    assert graph.add.causal_edge("C", "A") is None
+    assert graph.add.causal_edge("C", "A", time_lag_s=1.0) is not None
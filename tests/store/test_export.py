@@ -13,11 +13,13 @@ import numpy as np
 from dowhy import CausalModel
 import pandas as pd
 from deepdiff import DeepDiff
+from networkx import MultiDiGraph
 
 # causalgraph imports
 from causalgraph import Graph
 import causalgraph.utils.owlready2_utils as owl2utils
 from causalgraph.utils.owlready2_utils import is_subclass_of
+from causalgraph.store.export import SparseTigraMatrix
 
 
 ########################################
@@ -94,6 +96,16 @@ def test__export_cg_third_party_to_nx(test_graph_third: Graph):
     nx_simple_dict = test_graph_third.map.graph_dict_from_nx(G_nx)
     assert graph_simple_dict == nx_simple_dict
 
+def test_export_unknown_individual_type_to_nx(monkeypatch):
+    """Testing that exporting to NetworkX fails for individuals that are neither CausalNodes nor CausalEdges"""
+    graph = Graph(sql_db_filename=None)
+    graph.add.causal_edge("A", "B", force_create=True)
+    records = list(graph.map.iter_individuals())
+    assert isinstance(graph.export.nx(), MultiDiGraph)
+    unknown_record = ("creator_1", {"type": ["Creator"], "iri": "cg_store.creator_1"})
+    monkeypatch.setattr(graph.map, "iter_individuals", lambda: iter(records + [unknown_record]))
+    assert graph.export.nx() is False
+
 def test_export_cg_simple_to_tigra(test_graph_simple: Graph):
     """Testing exporting simple props cg graph to Tigramite"""
     node_names, edge_names, link_matrix, q_matrix, timestep_len_s = test_graph_simple.export.tigra()
@@ -168,3 +180,42 @@ def test_export_cg_gml_input_working_dowhy(test_graph_simple: Graph, tmpdir: str
     msg = "Model to find the causal effect of treatment ['thorns_on_road'] on outcome ['bumpy_feeling']"
     print(model.summary())
     assert model.summary() == msg
+
+def test_export_cg_to_sparse_tigra(test_graph_simple: Graph):
+    """Testing the sparse COO format of the Tigramite export"""
+    node_names, edge_names, link_matrix, q_matrix, timestep_len_s = test_graph_simple.export.tigra()
+    sparse_tigra = test_graph_simple.export.tigra(sparse=True)
+    assert sparse_tigra[0] == node_names
+    assert sparse_tigra[1] == edge_names
+    assert isinstance(sparse_tigra[2], SparseTigraMatrix)
+    assert np.array_equal(sparse_tigra[2].todense(), link_matrix)
+    assert np.array_equal(sparse_tigra[3].todense(), q_matrix)
+    # The graph_dict is the same for the dense and the sparse format
+    graph_dict_dense = test_graph_simple.map.graph_dict_from_tigra(node_names, edge_names, link_matrix, q_matrix, timestep_len_s)
+    graph_dict_sparse = test_graph_simple.map.graph_dict_from_tigra(*sparse_tigra)
+    assert graph_dict_dense == graph_dict_sparse
+
+def test_export_nodes_only_to_sparse_tigra():
+    """Testing the sparse Tigramite export of a graph without edges"""
+    graph = Graph(sql_db_filename=None)
+    graph.add.causal_node("node_1")
+    graph.add.causal_node("node_2")
+    node_names, edge_names, link_matrix, q_matrix, _ = graph.export.tigra(sparse=True)
+    assert node_names == ["node_1", "node_2"]
+    assert edge_names == []
+    assert link_matrix.shape == (2, 2, 5)
+    assert not link_matrix.todense().any()
+    assert q_matrix.todense().all()
+
+def test_export_multi_typed_node_to_tigra():
+    """Testing that nodes with multiple CausalNode types are exported to Tigramite once"""
+    graph = Graph(sql_db_filename=None)
+    node_a = graph.add.causal_node("a")
+    graph.add.causal_node("b")
+    graph.add.causal_edge("a", "b", "edge_ab")
+    node_a.is_a.append(owl2utils.get_entity_by_name("Machine_Event", graph.store))
+    for sparse in [False, True]:
+        node_names, edge_names, link_matrix, _, _ = graph.export.tigra(sparse=sparse)
+        assert node_names == ["a", "b"]
+        assert edge_names == {"edge_ab": {"hasCause": "a", "hasEffect": "b"}}
+        assert link_matrix.shape == (2, 2, 1)
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: MIT
+
+"""Testing causalgraph/store/query.py
+"""
+
+# general imports
+import pytest
+# causalgraph imports
+from causalgraph import Graph
+import causalgraph.utils.owlready2_utils as owlutils
+
+
+########################################
+###         Fixtures                 ###
+########################################
+@pytest.fixture(name="graph")
+def fixture_graph() -> Graph:
+    graph = Graph(sql_db_filename=None)
+    graph.add.causal_nodes(["A", "B", "C", "D"])
+    graph.add.causal_edge("A", "B", "edge_AB")
+    graph.add.causal_edge("A", "C", "edge_AC")
+    graph.add.causal_edge("B", "C", "edge_BC")
+    graph.add.causal_edges([("C", "D"), ("C", "D")])
+    yield graph
+    graph.store.close()
+
+
+def adjacency_as_names(graph: Graph) -> dict:
+    """Returns the (cause, effect) names of all edges in the adjacency index of the graph"""
+    adjacency_index = owlutils.get_adjacency_index(graph.store)
+    to_name = lambda storid: graph.store._get_by_storid(storid).name
+    return {to_name(edge): (to_name(cause), to_name(effect)) for edge, (cause, effect) in adjacency_index.edge_ends.items()}
+
+
+########################################
+###              Tests               ###
+########################################
+def test_neighbors_of_nodes(graph: Graph):
+    """Test parents, children, in_edges and out_edges"""
+    names = lambda entities: [entity.name for entity in entities]
+    assert names(graph.query.children("A")) == ["B", "C"]
+    assert names(graph.query.parents("C")) == ["A", "B"]
+    assert names(graph.query.out_edges("A")) == ["edge_AB", "edge_AC"]
+    assert names(graph.query.in_edges(graph.get_entity("B"))) == ["edge_AB"]
+    # Double edges are returned twice as edges, but their nodes only once
+    assert len(graph.query.out_edges("C")) == 2
+    assert names(graph.query.children("C")) == ["D"]
+    assert graph.query.parents("A") == [] and graph.query.children("D") == []
+    assert graph.query.parents("not_existing") is None
+
+
+def test_adjacency_index_kept_up_to_date(graph: Graph):
+    """Test that Add, Edit and Remove keep the adjacency index in sync with a rebuilt index"""
+    graph.edit.properties("edge_BC", {"hasEffect": graph.get_entity("D")})
+    assert [node.name for node in graph.query.children("B")] == ["D"]
+    graph.edit.rename_individual("B", "B_renamed")
+    assert [node.name for node in graph.query.parents("D")] == ["C", "B_renamed"]
+    graph.remove.causal_edge("edge_AB")
+    graph.remove.causal_node("C")
+    assert [node.name for node in graph.query.children("A")] == []
+    indexed = adjacency_as_names(graph)
+    owlutils.init_adjacency_index(graph.store)
+    assert indexed == adjacency_as_names(graph) == {"edge_BC": ("B_renamed", "D")}
+    assert owlutils.get_edge_by_cause_and_effect("B_renamed", "D", graph.store) == [graph.get_entity("edge_BC")]
+
+
+def test_adjacency_index_rolled_back_with_transaction(graph: Graph):
+    """Test that edges created in a failed transaction are removed from the adjacency index"""
+    with pytest.raises(RuntimeError):
+        with graph.transaction():
+            graph.add.causal_edge("D", "A", "edge_DA")
+            assert [node.name for node in graph.query.children("D")] == ["A"]
+            raise RuntimeError("abort")
+    assert graph.query.children("D") == []
+    assert graph.query.parents("A") == []
+
+
+def test_ancestors_descendants_and_reachability(graph: Graph):
+    """Test ancestors, descendants and is_reachable, also with cycles"""
+    names = lambda entities: sorted(entity.name for entity in entities)
+    assert names(graph.query.ancestors("D")) == ["A", "B", "C"]
+    assert names(graph.query.descendants("A")) == ["B", "C", "D"]
+    assert graph.query.ancestors("A") == [] and graph.query.descendants("D") == []
+    assert graph.query.is_reachable("A", "D") is True
+    assert graph.query.is_reachable("D", "A") is False
+    assert graph.query.is_reachable("A", "A") is True
+    assert graph.query.is_reachable("A", "not_existing") is None
+    # Closing a cycle D -> B makes B, C and D reach each other, the node itself is not returned
+    graph.add.causal_edge("D", "B", "edge_DB")
+    assert names(graph.query.descendants("C")) == ["B", "D"]
+    assert names(graph.query.ancestors("B")) == ["A", "C", "D"]
+    assert graph.query.is_reachable("D", "C") is True
+
+
+def test_reachability_index_kept_up_to_date(graph: Graph):
+    """Test that the reachability index is updated incrementally and equals a rebuilt index"""
+    graph.query.descendants("A")
+    reachability = owlutils.get_adjacency_index(graph.store).reachability
+    graph.add.causal_edge("D", "A", "edge_DA")
+    graph.remove.causal_edge("edge_BC")
+    graph.remove.causal_edge("edge_AC")
+    assert owlutils.get_adjacency_index(graph.store).reachability is reachability
+    assert graph.query.is_reachable("B", "D") is False
+    assert graph.query.is_reachable("C", "B") is True
+    rebuilt = owlutils.ReachabilityIndex(owlutils.get_adjacency_index(graph.store))
+    for node in ["A", "B", "C", "D"]:
+        storid = graph.get_entity(node).storid
+        assert set(reachability.nodes_of(reachability.descendants.get(storid, 0))) == \
+               set(rebuilt.nodes_of(rebuilt.descendants.get(storid, 0)))
+        assert set(reachability.nodes_of(reachability.ancestors.get(storid, 0))) == \
+               set(rebuilt.nodes_of(rebuilt.ancestors.get(storid, 0)))
+
+
+def test_paths_with_limits():
+    """Test the enumeration of paths between two nodes with max_len, max_total_lag_s and min_confidence"""
+    graph = Graph(sql_db_filename=None)
+    graph.add.causal_nodes(["alarm", "X", "Y", "root"])
+    graph.add.causal_edge("root", "X", "edge_rX", confidence=0.9, time_lag_s=10.0)
+    graph.add.causal_edge("X", "alarm", "edge_Xa", confidence=0.9, time_lag_s=10.0)
+    graph.add.causal_edge("root", "Y", "edge_rY", confidence=0.5, time_lag_s=1.0)
+    graph.add.causal_edge("Y", "alarm", "edge_Ya", confidence=0.5)
+    graph.add.causal_edge("X", "Y", "edge_XY")
+    graph.add.causal_edge("Y", "root", "edge_Yr")
+    paths = lambda **limits: sorted([edge.name for edge in path] for path in graph.query.paths("root", "alarm", **limits))
+    assert paths() == [["edge_rX", "edge_XY", "edge_Ya"], ["edge_rX", "edge_Xa"], ["edge_rY", "edge_Ya"]]
+    assert paths(max_len=2) == [["edge_rX", "edge_Xa"], ["edge_rY", "edge_Ya"]]
+    assert paths(max_total_lag_s=15.0) == [["edge_rX", "edge_XY", "edge_Ya"], ["edge_rY", "edge_Ya"]]
+    assert paths(min_confidence=0.3) == [["edge_rX", "edge_XY", "edge_Ya"], ["edge_rX", "edge_Xa"]]
+    assert paths(max_len=2, max_total_lag_s=15.0, min_confidence=0.3) == []
+    assert list(graph.query.paths("alarm", "root")) == []
+    assert graph.query.paths("root", "not_existing") is None
+    graph.store.close()
+
+
+def test_paths_are_enumerated_lazily(graph: Graph):
+    """Test that paths are yielded one by one"""
+    paths = graph.query.paths("A", "D")
+    first_path = next(paths)
+    assert first_path[0].name in ["edge_AB", "edge_AC"] and len(first_path) >= 2
+    assert len(list(paths)) == 3
+
+
+def test_paths_bounded_by_max_len_without_reachability_index(graph: Graph, monkeypatch):
+    """Test that bounded searches do not build the reachability index and missing properties use their defaults"""
+    paths = lambda **limits: sorted([edge.name for edge in path] for path in graph.query.paths("A", "C", **limits))
+    assert paths(max_len=1) == [["edge_AC"]]
+    assert owlutils.get_adjacency_index(graph.store).reachability is None
+    get_entity_from_cache_by_name = owlutils.get_entity_from_cache_by_name
+    monkeypatch.setattr(owlutils, "get_entity_from_cache_by_name", lambda name, *args, **kwargs:
+                        None if name in ["hasTimeLag", "hasConfidence"] else get_entity_from_cache_by_name(name, *args, **kwargs))
+    assert paths(max_len=2, max_total_lag_s=0.0, min_confidence=1.0) == [["edge_AB", "edge_BC"], ["edge_AC"]]
+    assert paths() == [["edge_AB", "edge_BC"], ["edge_AC"]]
+    assert owlutils.get_adjacency_index(graph.store).reachability is not None
@@ -13,6 +13,7 @@ from pathlib import Path
 from causalgraph import Graph
 from causalgraph.utils.owlready2_utils import get_entity_by_name
 from causalgraph.utils.owlready2_utils import count_instances_of_type
+from causalgraph.utils.owlready2_utils import get_adjacency_index, init_adjacency_index
 
 
 ########################################
@@ -428,4 +429,22 @@ def test_remove_entity_causal_node_detection(graph: Graph):
     assert deletion_success == True, "Fault_State instance was not removed"
     assert nodes_after_removal == nodes_before_edge - 1, f"Remove entity did not remove CausalNode and Edge. Individuals after removal: {list(graph.store.individuals())}"
 
-    
\ No newline at end of file
+    
+def test_remove_causal_node_with_half_connected_edges(graph: Graph):
+    """Test that edges with only hasCause or only hasEffect set are removed with their node"""
+    node = graph.add.causal_node("node")
+    other_node = graph.add.causal_node("other_node")
+    only_cause = graph.add.causal_edge(node, other_node, "edge_only_cause")
+    only_effect = graph.add.causal_edge(other_node, node, "edge_only_effect")
+    graph.edit.properties(only_cause, {"hasEffect": None})
+    graph.edit.properties(only_effect, {"hasCause": None})
+    assert graph.query.out_edges(node) == [] and graph.query.in_edges(node) == []
+    # Index of the half connected edges equals a rebuilt index
+    adjacency_index = get_adjacency_index(graph.store)
+    dangling_edges = dict(adjacency_index.dangling_edges)
+    assert dangling_edges == init_adjacency_index(graph.store).dangling_edges == {node.storid: {only_cause.storid: None,
+                                                                                               only_effect.storid: None}}
+    assert graph.remove.causal_node(node) is True
+    assert get_entity_by_name("edge_only_cause", graph.store, suppress_warn=True) is None
+    assert get_entity_by_name("edge_only_effect", graph.store, suppress_warn=True) is None
+    assert get_adjacency_index(graph.store).dangling_edges == {}
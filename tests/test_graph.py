@@ -7,11 +7,14 @@
 
 # general imports
 import os
+import sys
+import subprocess
 from pathlib import Path
 import pytest
 # causalgraph imports
 from causalgraph import Graph
 from causalgraph.utils import owlready2_utils as owl2utils
+from causalgraph.utils import onto_cache
 from deepdiff import DeepDiff
 import numpy as np
 
@@ -229,4 +232,86 @@ def test_init_graph_from_graph_format():
         external_graph=[1,2,3]
     )
     tigra_graph_dict = G_nx.map.all_individuals_to_dict()
-    assert tigra_graph_dict == {}
\ No newline at end of file
+    assert tigra_graph_dict == {}
+
+### Tests for transactions
+def test_transaction_commits_once(sql_test_db):
+    """Test that changes within a transaction are committed at exit and persisted"""
+    graph = Graph(sql_db_filename=sql_test_db)
+    with graph.transaction():
+        graph.add.causal_edge("cause", "effect", "edge", force_create=True)
+        assert graph.store.graph.db.in_transaction
+    assert not graph.store.graph.db.in_transaction
+    graph.store.close()
+    reloaded_graph = Graph(sql_db_filename=sql_test_db)
+    assert set(reloaded_graph.map.all_individuals_to_dict()) == {"cause", "effect", "edge"}
+
+
+def test_transaction_rolls_back_on_exception(test_graph_simple: Graph):
+    """Test that all changes within a failed transaction are discarded"""
+    graph_dict_before = test_graph_simple.map.all_individuals_to_dict()
+    with pytest.raises(RuntimeError):
+        with test_graph_simple.batch():
+            test_graph_simple.add.causal_edge("node_1", "new_node", "new_edge", force_create=True)
+            test_graph_simple.edit.rename_individual("node_2", "renamed_node")
+            test_graph_simple.remove.causal_edge("edge_3_c")
+            raise RuntimeError("Abort transaction")
+    assert test_graph_simple.get_entity("new_node", suppress_warn=True) is None
+    assert test_graph_simple.get_entity("node_2").name == "node_2"
+    diff = DeepDiff(graph_dict_before, test_graph_simple.map.all_individuals_to_dict(), ignore_order=True)
+    assert diff == {}
+
+
+def test_graph_from_onto_template_matches_parsed_graph(tmpdir, monkeypatch):
+    """Test that graphs initialized from the ontology template equal graphs from the parsed ontology"""
+    monkeypatch.setattr(owl2utils, "ONTO_TEMPLATE_DIR", Path(tmpdir) / "templates")
+    template_path = owl2utils.get_onto_template_path(Graph().core_onto_path)
+    assert template_path.parent == Path(tmpdir) / "templates" and template_path.is_file()
+    assert "_0.16_" in template_path.name
+    template_graph = Graph()
+    # Without template the core ontology is parsed, not copied from the ontology cache
+    monkeypatch.setattr(onto_cache, "import_cached_ontology", None)
+    parsed_graph = Graph(use_onto_template=False)
+    assert template_graph.classes_onto.base_iri == parsed_graph.classes_onto.base_iri
+    assert owl2utils.get_class_names(template_graph.store) == owl2utils.get_class_names(parsed_graph.store)
+    for graph in [template_graph, parsed_graph]:
+        graph.add.causal_node("node_a")
+        graph.add.causal_node("node_b")
+        graph.add.causal_edge("node_a", "node_b", name_for_edge="edge_ab", confidence=0.5, time_lag_s=1.0)
+    assert template_graph.map.all_individuals_to_dict() == parsed_graph.map.all_individuals_to_dict()
+
+
+def test_graph_in_file_from_onto_template_reloads(sql_test_db, tmpdir, monkeypatch):
+    """Test that a new sqlite graph initialized from the template is persisted and can be reopened"""
+    monkeypatch.setattr(owl2utils, "ONTO_TEMPLATE_DIR", Path(tmpdir) / "templates")
+    graph = Graph(sql_db_filename=sql_test_db)
+    graph.add.causal_node("node_a")
+    graph.add.causal_node("node_b")
+    graph.add.causal_edge("node_a", "node_b", name_for_edge="edge_ab")
+    graph.store.close()
+    reloaded_graph = Graph(sql_db_filename=sql_test_db)
+    assert reloaded_graph.map.all_individuals_to_dict()["edge_ab"]["hasCause"] == "node_a"
+    reloaded_graph.add.causal_node("node_c")
+    assert owl2utils.get_entity_by_name("node_c", reloaded_graph.store) is not None
+
+
+def test_import_graph_without_heavy_dependencies():
+    """Test via 'python -X importtime' that importing causalgraph.graph does not import plotting/numeric packages"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import causalgraph.graph"],
+                            cwd=Path(__file__).absolute().parent.parent, capture_output=True, text=True, check=True)
+    imported_modules = {line.split("|")[-1].strip() for line in result.stderr.splitlines() if line.startswith("import time:")}
+    assert "causalgraph.graph" in imported_modules
+    for module in ["matplotlib", "matplotlib.pyplot", "networkx", "numpy", "causalgraph.utils.draw",
+                   "causalgraph.store.export", "causalgraph.store.load"]:
+        assert module not in imported_modules
+
+
+def test_draw_export_load_created_on_first_use(test_graph_simple: Graph):
+    """Test that the lazily created draw/export/load functionalities are created once and bound to the graph"""
+    assert test_graph_simple._export is None
+    export = test_graph_simple.export
+    assert test_graph_simple.export is export
+    assert export.graph is test_graph_simple
+    assert test_graph_simple.load.graph is test_graph_simple
+    assert test_graph_simple.draw.graph is test_graph_simple
+    assert len(export.nx().nodes) > 0
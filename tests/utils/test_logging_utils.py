@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: MIT
+
+"""Testing causalgraph/utils/logging_utils.py
+"""
+
+# general imports
+import os
+import json
+import logging
+import pytest
+# causalgraph imports
+from causalgraph.utils.logging_utils import init_logger, stop_queue_listener, DeferredFormatQueueHandler
+from causalgraph.utils.logging_utils import DuplicateLogFilter
+
+
+########################################
+###         Fixtures                 ###
+########################################
+@pytest.fixture(name="log_file_dir")
+def fixture_log_file_dir(tmpdir) -> str:
+    os.makedirs(os.path.join(tmpdir, 'data', 'logs'))
+    yield str(tmpdir)
+
+
+########################################
+###              Tests               ###
+########################################
+def test_queue_handler_writes_ecs_json(log_file_dir: str):
+    """Test that records passed via the queue are written as ecs json incl. exception info"""
+    logger = init_logger("test_queue_logger", console_handler_level=logging.ERROR, file_handler=True,
+                         file_handler_level=logging.ERROR, log_file_dir=log_file_dir, queue_handler=True)
+    assert any(isinstance(handler, DeferredFormatQueueHandler) for handler in logger.handlers)
+    logger.error("Node %s unknown", "node_a")
+    try:
+        raise ValueError("broken")
+    except ValueError:
+        logger.exception("Failed")
+    stop_queue_listener(logger)
+    with open(os.path.join(log_file_dir, 'data', 'logs', 'test_queue_logger.json')) as log_file:
+        records = [json.loads(line) for line in log_file]
+    assert [record["message"] for record in records] == ["Node node_a unknown", "Failed"]
+    assert records[1]["error"]["type"] == "ValueError"
+
+
+def test_file_handler_rotates_by_size(log_file_dir: str):
+    """Test that the logfile is rotated once max_bytes is reached"""
+    logger = init_logger("test_rotating_logger", console_handler_level=logging.ERROR, file_handler=True,
+                         file_handler_level=logging.ERROR, elastic_style_json=False,
+                         log_file_dir=log_file_dir, max_bytes=200, backup_count=2)
+    for i in range(20):
+        logger.error("Message number %d", i)
+    log_files = os.listdir(os.path.join(log_file_dir, 'data', 'logs'))
+    assert sorted(log_files) == ["test_rotating_logger.log", "test_rotating_logger.log.1",
+                                 "test_rotating_logger.log.2"]
+
+
+def test_duplicate_log_filter_summarizes_repeats(caplog, monkeypatch):
+    """Test that repeated messages are suppressed and summarized once per interval"""
+    logger = init_logger("test_dedup_logger", dedup_interval_s=10.0)
+    dedup_filter = next(x for x in logger.filters if isinstance(x, DuplicateLogFilter))
+    now = [100.0]
+    monkeypatch.setattr("causalgraph.utils.logging_utils.time.monotonic", lambda: now[0])
+    with caplog.at_level(logging.WARNING, logger="test_dedup_logger"):
+        for _ in range(1000):
+            logger.warning("Property %s unknown", "hasX")
+        logger.warning("Property %s unknown", "hasY")
+        assert caplog.messages == ["Property hasX unknown", "Property hasY unknown"]
+        now[0] = 111.0
+        logger.warning("Property %s unknown", "hasX")
+        assert caplog.messages[-1] == "Property hasX unknown [suppressed 999 repeats in the last 11 s]"
+        logger.warning("Property %s unknown", "hasX")
+        dedup_filter.flush(logger)
+        assert caplog.messages[-1] == "Property hasX unknown [suppressed 1 repeats in the last 0 s]"
+        assert len(caplog.messages) == 4
+
+
+def test_duplicate_log_filter_is_bounded():
+    """Test that only the most recently seen messages are tracked"""
+    dedup_filter = DuplicateLogFilter(max_messages=2)
+    for name in ["a", "b", "c"]:
+        dedup_filter.filter(logging.makeLogRecord({"msg": name, "levelno": logging.WARNING}))
+    assert [key[1] for key in dedup_filter.seen_messages] == ["b", "c"]
@@ -7,6 +7,7 @@
 
 # general imports
 from pathlib import Path
+import numpy as np
 import pytest
 # causalgraph imports
 from causalgraph import Graph
@@ -163,3 +164,115 @@ def test_fill_empty_graph_from_dict(empty_graph: Graph, test_graph_simple: Graph
     print(list(empty_graph.store.individuals()))
     graph_dict_empty_graph_filled = empty_graph.map.all_individuals_to_dict()
     assert graph_dict_prefilled_graph == graph_dict_empty_graph_filled
+
+def test_fill_empty_graph_from_dict_trusted(empty_graph: Graph, test_graph_simple: Graph):
+    graph_dict_prefilled_graph = test_graph_simple.map.all_individuals_to_dict()
+    empty_graph = empty_graph.map.fill_empty_graph_from_dict(graph_dict_prefilled_graph, trusted=True)
+    graph_dict_empty_graph_filled = empty_graph.map.all_individuals_to_dict()
+    assert graph_dict_prefilled_graph == graph_dict_empty_graph_filled
+    # Created individuals are found via the name index
+    assert owl2utils.get_entity_by_name("edge_2_c", empty_graph.store).hasCause.name == "node_2"
+
+def test_fill_empty_graph_from_dict_trusted_third_party(test_graph_third: Graph, testdata_dir: str):
+    graph_dict_prefilled_graph = test_graph_third.map.all_individuals_to_dict()
+    external_ontos = [f"{testdata_dir}/faults.owl", f"{testdata_dir}/error-db.owl", f"{testdata_dir}/pizza.owl"]
+    new_graph = Graph(sql_db_filename=None, external_ontos=external_ontos)
+    new_graph = new_graph.map.fill_empty_graph_from_dict(graph_dict_prefilled_graph, trusted=True)
+    assert graph_dict_prefilled_graph == new_graph.map.all_individuals_to_dict()
+
+def test_fill_empty_graph_from_dict_rolls_back(empty_graph: Graph):
+    graph_dict = {
+        "node_1":{"type":['CausalNode'],"iri":"cg_store#node_1"},
+        "edge_1":{"type":['CausalEdge'],"iri":"cg_store#edge_1","hasCause":"node_1","hasEffect":"missing_node"}
+    }
+    with pytest.raises(RuntimeError):
+        empty_graph.map.fill_empty_graph_from_dict(graph_dict)
+    assert owl2utils.get_all_causalnodes(empty_graph.store) == []
+    assert owl2utils.get_entity_by_name("node_1", empty_graph.store, suppress_warn=True) is None
+
+def test_update_graph_from_dict(test_graph_simple: Graph):
+    graph_dict = test_graph_simple.map.all_individuals_to_dict()
+    # Remove node_1 (and with it edge_1), change edge_2_c, remove comment of node_2 and add node_4 with edge_4
+    graph_dict.pop("node_1")
+    graph_dict.pop("edge_1")
+    graph_dict["edge_2_c"]["hasConfidence"] = 0.3
+    graph_dict["edge_2_c"]["comment"] = ["changed comment"]
+    graph_dict["node_2"].pop("comment")
+    graph_dict["node_4"] = {"type": ['CausalNode'], "hasCreator": ["new_creator"]}
+    graph_dict["edge_4"] = {"type": ['CausalEdge'], "hasCause": "node_3_c", "hasEffect": "node_4", "hasTimeLag": 1.0}
+    updated_graph = test_graph_simple.map.update_graph_from_dict(graph_dict)
+    graph_dict_updated = updated_graph.map.all_individuals_to_dict()
+    assert set(graph_dict_updated) == set(graph_dict)
+    assert graph_dict_updated["edge_2_c"]["hasConfidence"] == 0.3
+    assert graph_dict_updated["edge_2_c"]["comment"] == ["changed comment"]
+    assert "comment" not in graph_dict_updated["node_2"]
+    assert graph_dict_updated["node_2"]["isCausing"] == ["edge_2_c", "edge_3_c"]
+    assert graph_dict_updated["node_4"]["hasCreator"] == ["new_creator"]
+    assert graph_dict_updated["node_4"]["isAffectedBy"] == ["edge_4"]
+    # Applying the same graph_dict again changes nothing
+    updated_graph.map.update_graph_from_dict(graph_dict_updated)
+    assert updated_graph.map.all_individuals_to_dict() == graph_dict_updated
+
+def test_update_graph_from_dict_rewires_edge(test_graph_simple: Graph):
+    graph_dict = test_graph_simple.map.all_individuals_to_dict()
+    graph_dict["edge_1"]["hasEffect"] = "node_3_c"
+    graph_dict["edge_1"]["type"] = ['CausalEdge']
+    test_graph_simple.map.update_graph_from_dict(graph_dict)
+    edge_1 = owl2utils.get_entity_by_name("edge_1", test_graph_simple.store)
+    assert edge_1.hasEffect.name == "node_3_c"
+    node_3_c = owl2utils.get_entity_by_name("node_3_c", test_graph_simple.store)
+    assert sorted(edge.name for edge in node_3_c.isAffectedBy) == ["edge_1", "edge_2_c", "edge_3_c"]
+
+def test_update_graph_from_dict_enforces_dag():
+    graph = Graph(sql_db_filename=None, enforce_dag=True)
+    graph.add.causal_nodes(["node_a", "node_b", "node_c"])
+    graph.add.causal_edge("node_a", "node_b", "edge_ab")
+    graph.add.causal_edge("node_b", "node_c", "edge_bc")
+    graph.add.causal_edge("node_a", "node_c", "edge_ac")
+    graph_dict_before = graph.map.all_individuals_to_dict()
+    graph_dict = graph.map.all_individuals_to_dict()
+    graph_dict["edge_ac"]["hasCause"], graph_dict["edge_ac"]["hasEffect"] = "node_c", "node_a"
+    with pytest.raises(ValueError):
+        graph.map.update_graph_from_dict(graph_dict)
+    assert graph.map.all_individuals_to_dict() == graph_dict_before
+    assert graph.query.is_reachable("node_c", "node_a") is False
+
+def test_generate_props_dict_from_tigra_double_edges(empty_graph: Graph):
+    node_names = ["a", "b"]
+    edge_names = {"e_1": {"hasCause": "a", "hasEffect": "b"},
+                  "e_2": {"hasCause": "a", "hasEffect": "b"},
+                  "e_3": {"hasCause": "b", "hasEffect": "a"}}
+    link_matrix = np.zeros((2, 2, 3))
+    link_matrix[0, 1, 0] = link_matrix[0, 1, 2] = link_matrix[1, 0, 1] = 1
+    q_matrix = np.ones((2, 2, 3))
+    q_matrix[0, 1, 2] = 0.5
+    graph_dict = empty_graph.map.graph_dict_from_tigra(node_names, edge_names, link_matrix, q_matrix, 2)
+    assert graph_dict["e_1"] == {"hasCause": "a", "hasConfidence": 1.0, "hasEffect": "b", "type": ['CausalEdge']}
+    assert graph_dict["e_2"] == {"hasCause": "a", "hasConfidence": 0.5, "hasEffect": "b", "hasTimeLag": 4.0, "type": ['CausalEdge']}
+    assert graph_dict["e_3"]["hasTimeLag"] == 2.0
+    assert graph_dict["a"]["isCausing"] == ["e_1", "e_2"]
+    # The passed edge_names are not modified
+    assert len(edge_names) == 3
+
+def test_generate_props_dict_from_tigra_missing_edge_name(empty_graph: Graph):
+    link_matrix = np.zeros((2, 2, 1))
+    link_matrix[0, 1, 0] = 1
+    edge_names = {"e_1": {"hasCause": "b", "hasEffect": "a"}}
+    assert empty_graph.map.graph_dict_from_tigra(["a", "b"], edge_names, link_matrix, np.ones((2, 2, 1)), 1) is False
+
+def test_iter_individuals(test_graph_third: Graph):
+    graph_dict = test_graph_third.map.all_individuals_to_dict()
+    assert dict(test_graph_third.map.iter_individuals()) == graph_dict
+    # Only CausalEdges with the requested properties
+    edge_records = dict(test_graph_third.map.iter_individuals(kinds="CausalEdge", props=["hasCause", "hasTimeLag"]))
+    assert edge_records == {"Error_Edge": {"hasCause": "9801"},
+                            "Mushroom_Edge": {"hasCause": "Mushroom_1", "hasTimeLag": 2.2},
+                            "Mushroom_2_9801_Edge": {"hasCause": "9801", "hasTimeLag": 2}}
+    node_records = dict(test_graph_third.map.iter_individuals(kinds=["CausalNode"], props=["type", "isCausing"]))
+    assert node_records["9801"] == {"type": ["Error"], "isCausing": ["Error_Edge", "Mushroom_2_9801_Edge"]}
+    assert node_records["5800"] == {"type": ["Error"]}
+
+def test_iter_individuals_in_batches(test_graph_simple: Graph):
+    batches = list(test_graph_simple.map.iter_individuals(props=["type"], batch_size=4))
+    assert [len(batch) for batch in batches] == [4, 2]
+    assert [name for name, _ in batches[0]] == ["node_1", "node_2", "node_3_c", "edge_1"]
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: MIT
+
+"""Testing causalgraph/utils/misc_utils.py
+"""
+
+# general imports
+import pytest
+from typing import Union
+# causalgraph imports
+import causalgraph.utils.misc_utils as misc_utils
+from causalgraph.utils.misc_utils import strict_types
+
+
+########################################
+###         Fixtures                 ###
+########################################
+@strict_types
+def typed_function(name: str, target: Union[str, int] = None, weight: float = 1.0, *, flag: bool = False) -> bool:
+    return True
+
+
+########################################
+###              Tests               ###
+########################################
+def test_strict_types_accepts_valid_arguments():
+    """Test that valid positional and keyword arguments pass, incl. None for Union and int for float"""
+    assert typed_function("a") is True
+    assert typed_function("a", None, 2) is True
+    assert typed_function(name="a", target=3, weight=0.5, flag=True) is True
+
+
+def test_strict_types_rejects_invalid_arguments():
+    """Test that invalid positional, keyword and keyword-only arguments raise a TypeError"""
+    with pytest.raises(TypeError):
+        typed_function(1)
+    with pytest.raises(TypeError):
+        typed_function("a", target=1.5)
+    with pytest.raises(TypeError):
+        typed_function("a", flag="yes")
+
+
+def test_strict_types_can_be_switched_off(monkeypatch):
+    """Test that the type checks are skipped if strict types are disabled"""
+    monkeypatch.setattr(misc_utils, "STRICT_TYPES_ENABLED", True)
+    misc_utils.set_strict_types(False)
+    assert typed_function(1, flag="yes") is True
+    misc_utils.set_strict_types(True)
+    with pytest.raises(TypeError):
+        typed_function(1)
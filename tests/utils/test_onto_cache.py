@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: MIT
+
+"""Testing causalgraph/utils/onto_cache.py
+"""
+
+# general imports
+import io
+import os
+import shutil
+import sqlite3
+import urllib.error
+from pathlib import Path
+import pytest
+# causalgraph imports
+from causalgraph import Graph
+import causalgraph.utils.onto_cache as onto_cache
+import causalgraph.utils.owlready2_utils as owlutils
+
+
+########################################
+###         Fixtures                 ###
+########################################
+@pytest.fixture(name="testdata_dir")
+def fixture_testdata_dir() -> Path:
+    return Path(__file__).absolute().parent.parent / 'testdata'
+
+
+@pytest.fixture(name="cache_dir")
+def fixture_cache_dir(tmpdir, monkeypatch) -> Path:
+    cache_dir = Path(tmpdir) / "onto_cache"
+    monkeypatch.setattr(onto_cache, "ONTO_CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+class FakeResponse(io.BytesIO):
+    """Response of urlopen with headers for revalidation"""
+    headers = {"ETag": '"v1"', "Last-Modified": None}
+
+
+def get_triples(graph: Graph) -> tuple[list, list]:
+    """Returns all triples of the graph with storids resolved to iris (blank nodes as 'BLANK')"""
+    iris = dict(graph.store.graph.execute("SELECT storid, iri FROM resources").fetchall())
+    to_iri = lambda storid: iris.get(storid, "BLANK" if type(storid) is int and storid < 0 else storid)
+    objs = sorted((to_iri(s), to_iri(p), to_iri(o)) for s, p, o in graph.store.graph.execute("SELECT s,p,o FROM objs"))
+    datas = sorted((to_iri(s), to_iri(p), str(o), str(to_iri(d)))
+                   for s, p, o, d in graph.store.graph.execute("SELECT s,p,o,d FROM datas"))
+    return objs, datas
+
+
+########################################
+###              Tests               ###
+########################################
+def test_cached_import_equals_parsed_import(cache_dir: Path, testdata_dir: Path, monkeypatch):
+    """Test that an ontology copied from the cache results in the same triples as parsing it"""
+    pizza_path = str(testdata_dir / 'pizza.owl')
+    parsed_graph = Graph(use_onto_cache=False)
+    parsed_graph.import_ontology(pizza_path)
+    cached_graph = Graph()
+    cached_graph.import_ontology(pizza_path)
+    assert len(list(cache_dir.glob("*.sqlite3"))) == 1
+    # Second import is copied from the cache without parsing
+    monkeypatch.setattr(onto_cache, "_build_cached_store", None)
+    copied_graph = Graph()
+    pizza_onto = copied_graph.import_ontology(pizza_path)
+    assert pizza_onto.base_iri == parsed_graph.store.get_ontology(f"file://{pizza_path}").base_iri
+    assert get_triples(copied_graph) == get_triples(parsed_graph)
+    assert owlutils.is_subclass_of("Margherita", "Pizza", copied_graph.store) is True
+    copied_graph.add.individual_of_type("Margherita", "my_pizza")
+    assert owlutils.is_instance_of_type("my_pizza", "Margherita", copied_graph.store) is True
+    # Importing it again is loaded directly as before (ontology already exists)
+    assert copied_graph.import_ontology(pizza_path) is not None
+
+
+def test_cache_revalidates_local_files(cache_dir: Path, testdata_dir: Path, tmpdir):
+    """Test that changed local files are parsed again and imports of known ontologies are not fetched"""
+    faults_path = Path(tmpdir) / 'faults.owl'
+    shutil.copy(testdata_dir / 'faults.owl', faults_path)
+    graph = Graph(external_ontos=[str(faults_path)])
+    assert owlutils.get_entity_by_name("Fault_State", graph.store, suppress_warn=True) is not None
+    first_db = onto_cache._read_index(cache_dir)[str(faults_path)]["db"]
+    faults_path.write_text(faults_path.read_text().replace("</Ontology>", "<!-- changed --></Ontology>"))
+    os.utime(faults_path, (1, 1))
+    graph = Graph(external_ontos=[str(faults_path)])
+    assert owlutils.get_entity_by_name("Fault_State", graph.store, suppress_warn=True) is not None
+    assert onto_cache._read_index(cache_dir)[str(faults_path)]["db"] != first_db
+
+
+def test_cache_keyed_by_known_ontologies(cache_dir: Path, testdata_dir: Path, monkeypatch):
+    """Test that ontologies are cached per set of known (stubbed) ontologies"""
+    pizza_path = str(testdata_dir / 'pizza.owl')
+    known_a, known_b = ["http://example.org/a#"], ["http://example.org/b#", "http://example.org/a#"]
+    db_a, _ = onto_cache.get_cached_onto_path(pizza_path, known_onto_iris=known_a)
+    db_b, _ = onto_cache.get_cached_onto_path(pizza_path, known_onto_iris=known_b)
+    assert db_a != db_b
+    assert onto_cache._read_index(cache_dir)[pizza_path]["known_onto_iris"] == sorted(known_b)
+    for db_path, known_onto_iris in [(db_a, known_a), (db_b, known_b)]:
+        with sqlite3.connect(db_path) as db:
+            stubs = db.execute("SELECT iri FROM ontologies WHERE last_update = ?", (onto_cache.STUB_LAST_UPDATE,))
+            assert sorted(iri for (iri,) in stubs) == sorted(known_onto_iris)
+    # Both stores stay cached, switching back does not parse the ontology again
+    monkeypatch.setattr(onto_cache, "_build_cached_store", None)
+    assert onto_cache.get_cached_onto_path(pizza_path, known_onto_iris=known_a)[0] == db_a
+    assert onto_cache.get_cached_onto_path(pizza_path, known_onto_iris=list(reversed(known_b)))[0] == db_b
+
+
+def test_cache_of_urls_with_offline_mode(cache_dir: Path, testdata_dir: Path, monkeypatch):
+    """Test that URLs are revalidated by ETag and only loaded from the cache in offline mode"""
+    url = "https://example.org/ontologies/pizza.owl"
+    pizza_content = (testdata_dir / 'pizza.owl').read_bytes()
+    requests = []
+    def fake_urlopen(request, timeout=None):
+        requests.append(request)
+        if request.get_header("If-none-match") == '"v1"':
+            raise urllib.error.HTTPError(url, 304, "Not Modified", {}, None)
+        return FakeResponse(pizza_content)
+    monkeypatch.setattr(onto_cache.urllib.request, "urlopen", fake_urlopen)
+    assert Graph(offline=True).import_ontology(url) is None
+    assert requests == []
+    assert Graph().import_ontology(url) is not None
+    assert Graph().import_ontology(url) is not None
+    assert [request.get_header("If-none-match") for request in requests] == [None, '"v1"']
+    offline_graph = Graph(offline=True)
+    assert offline_graph.import_ontology(url) is not None
+    assert len(requests) == 2
+    assert owlutils.is_subclass_of("Margherita", "Pizza", offline_graph.store) is True
+
+
+def test_cache_not_used_within_transaction(cache_dir: Path, testdata_dir: Path, monkeypatch):
+    """Test that imports within a transaction are parsed, so that the pending changes are not committed"""
+    pizza_path = str(testdata_dir / 'pizza.owl')
+    Graph().import_ontology(pizza_path)
+    graph = Graph()
+    with pytest.raises(RuntimeError):
+        with graph.transaction():
+            graph.add.causal_node("pending_node")
+            with pytest.raises(RuntimeError):
+                onto_cache.import_cached_ontology(pizza_path, graph.store)
+            assert graph.import_ontology(pizza_path) is not None
+            raise RuntimeError("abort")
+    assert graph.get_entity("pending_node", suppress_warn=True) is None
@@ -6,7 +6,9 @@
 """
 
 # general imports
+import logging
 import pytest
+import numpy as np
 import owlready2
 import os
 from pathlib import Path
@@ -395,3 +397,144 @@ def test_get_subclasses_none_return_for_non_existing_class(G: Graph):
     # Should return None if invalid class name is called
     return_for_incorrect_class_name = owlutils.get_subclasses("does_not_exist", G.store)
     assert return_for_incorrect_class_name is None
+
+
+def test_name_index_matches_iri_search(G: Graph):
+    """Test that lookups via the name index return the same entities as the wildcard IRI search"""
+    G.add.causal_edge("index_cause", "index_effect", "index_edge", force_create=True)
+    for name in ["CausalNode", "hasCause", "index_cause", "index_edge", "does_not_exist"]:
+        expected = G.store.search(iri=f"*#{name}")
+        expected = expected[0] if len(expected) == 1 else None
+        assert owlutils.get_entity_by_name(name, G.store, suppress_warn=True) is expected
+
+
+def test_name_index_kept_current_on_rename_and_delete(G: Graph):
+    """Test that renaming and deleting individuals updates the name index"""
+    node = G.add.causal_node("old_name")
+    assert node.storid in G.store.name_index["old_name"]
+    G.edit.rename_individual("old_name", "new_name")
+    assert "old_name" not in G.store.name_index
+    assert owlutils.get_entity_by_name("new_name", G.store) is node
+    G.remove.causal_node("new_name")
+    assert "new_name" not in G.store.name_index
+    assert owlutils.get_entity_by_name("new_name", G.store, suppress_warn=True) is None
+
+
+def test_name_index_rebuilt_from_existing_db(sql_test_db_path: str):
+    """Test that the name index of a graph reopened from an existing db contains the stored individuals"""
+    G_one = Graph(sql_db_filename=sql_test_db_path)
+    G_one.add.causal_node("persisted_node")
+    G_one.store.close()
+    G_two = Graph(sql_db_filename=sql_test_db_path)
+    assert owlutils.get_entity_by_name("persisted_node", G_two.store).name == "persisted_node"
+
+
+def test_class_closure_matches_sparql(G: Graph):
+    """Test that the subclasses from the class closure equal the ones of the rdfs:subClassOf* query"""
+    for class_name in ["CausalNode", "CausalEdge", "Creator"]:
+        class_obj = owlutils.get_entity_by_name(class_name, G.store)
+        sparql_subclasses = G.store.sparql("SELECT ?x { ?x rdfs:subClassOf* " + f"<{class_obj.iri}> . }}")
+        assert {row[0] for row in sparql_subclasses} == {row[0] for row in owlutils.get_subclasses(class_obj, G.store)}
+    assert owlutils.is_subclass_of("Event", "CausalNode", G.store) is True
+    assert owlutils.is_subclass_of("CausalNode", "Event", G.store) is False
+
+
+def test_class_closure_invalidated_by_import_ontology(G: Graph):
+    """Test that classes of an imported ontology are part of the class closure"""
+    assert owlutils.get_entity_by_name("Pizza", G.store, suppress_warn=True) is None
+    G.import_ontology(str(Path(__file__).absolute().parent.parent / 'testdata' / 'pizza.owl'))
+    pizza_class = owlutils.get_entity_by_name("Pizza", G.store)
+    assert {row[0] for row in owlutils.get_subclasses(pizza_class, G.store)} == set(pizza_class.descendants())
+    assert owlutils.is_subclass_of("Margherita", "Pizza", G.store) is True
+
+def test_property_validator_cache(validation_G: Graph):
+    """Test that compiled property validators are cached per (class set, property) and reset on import_ontology"""
+    G = validation_G
+    test_node = G.add.causal_node("test_node")
+    edge_classes = [owlutils.get_entity_by_name("CausalEdge", G.store)]
+    validator = owlutils.get_property_validator(edge_classes, "hasCause", G.store)
+    assert validator.domain_valid is True
+    assert (validator.prop_type, validator.is_functional) == ("ObjectProperty", True)
+    assert owlutils.get_property_validator(edge_classes, "hasCause", G.store) is validator
+    assert owlutils.get_property_validator(test_node.is_a, "hasCause", G.store).domain_valid is False
+    assert owlutils.get_property_validator(edge_classes, "thisDoesNotExist", G.store) is None
+    # Validation results with the compiled validators
+    assert owlutils.validate_property_target_pairs_for_classes(edge_classes, {"hasCause": "test_node", "hasConfidence": 0.5}, G.store) is True
+    assert owlutils.validate_property_target_pairs_for_classes(edge_classes, {"hasConfidence": 1.5}, G.store) is False
+    assert owlutils.validate_property_target_pairs_for_classes(test_node.is_a, {"hasCause": "test_node"}, G.store) is False
+    # Importing an ontology resets the compiled validators
+    G.import_ontology(str(Path(__file__).absolute().parent.parent / 'testdata' / 'pizza.owl'))
+    assert owlutils.get_property_validator(edge_classes, "hasCause", G.store) is not validator
+
+def test_property_validator_logs_domain_only_if_validated(validation_G: Graph, caplog):
+    """Test that compiling a validator does not log domain warnings if domain and range are not validated"""
+    G = validation_G
+    test_node = G.add.causal_node("test_node")
+    with caplog.at_level(logging.WARNING):
+        assert owlutils.validate_property_target_pairs_for_classes(test_node.is_a, {"hasCause": "test_node"}, G.store,
+                                                                   validate_domain_range=False) is True
+        assert "domain" not in caplog.text
+        assert owlutils.validate_property_target_pairs_for_classes(test_node.is_a, {"hasCause": "test_node"}, G.store) is False
+        assert "none of the classes" in caplog.text
+
+def test_compiled_constraint():
+    """Test that ConstrainedDatatypes are compiled once and validate like the facet checks"""
+    constraint = owlready2.ConstrainedDatatype(str, pattern=r"^[a-z]+$", max_length=4)
+    compiled_constraint = owlutils.get_compiled_constraint(constraint)
+    assert owlutils.get_compiled_constraint(constraint) is compiled_constraint
+    assert compiled_constraint("abc") == (True, [])
+    valid, violations = compiled_constraint("abcde1")
+    assert valid is False and len(violations) == 2
+    assert compiled_constraint(5)[0] is False
+    # Arrays of numeric targets are validated at once
+    constraint = owlready2.ConstrainedDatatype(float, min_inclusive=0, max_exclusive=1)
+    mask = owlutils.get_compiled_constraint(constraint).validate_array(np.array([0.0, 0.5, 1.0, -0.1]))
+    assert mask.tolist() == [True, True, False, False]
+    assert not owlutils.get_compiled_constraint(constraint).validate_array(np.array([0, 1])).any()
+
+def test_validate_data_property_array(validation_G: Graph):
+    """Test validating whole arrays of targets of a DataProperty"""
+    G = validation_G
+    confidences = np.array([0.0, 0.3, 1.0, 1.2, -0.5])
+    mask = owlutils.validate_data_property_array(confidences, "hasConfidence", G.store)
+    assert mask.tolist() == [owlutils._validate_target_in_range_of_prop(float(value), "hasConfidence", G.store) for value in confidences]
+    assert owlutils.validate_data_property_array(np.array(["a", "b"]), "StringRangeNonFunctionalDataProperty", G.store).all()
+    with pytest.raises(ValueError):
+        owlutils.validate_data_property_array(confidences, "hasCause", G.store)
+
+def test_iri_cache_per_store(G: Graph):
+    """Test that cached iris and entities are kept per store and reset on import_ontology"""
+    other_G = Graph(sql_db_filename=None)
+    other_G.add.causal_node("only_in_other_graph")
+    assert owlutils.get_iri_from_cache_by_entity_name("only_in_other_graph", other_G.store) is not None
+    assert owlutils.get_iri_from_cache_by_entity_name("only_in_other_graph", G.store, suppress_warn=True) is None
+    # Core entities are cached per store
+    causal_node_class = owlutils.get_entity_from_cache_by_name("CausalNode", G.store)
+    assert causal_node_class is owlutils.get_entity_by_name("CausalNode", G.store)
+    assert "CausalNode" in G.store.entity_cache
+    assert owlutils.get_entity_from_cache_by_name("CausalNode", other_G.store) is not causal_node_class
+    G.import_ontology(str(Path(__file__).absolute().parent.parent / 'testdata' / 'pizza.owl'))
+    assert len(G.store.entity_cache) == 0 and len(G.store.iri_cache) == 0
+
+def test_iri_cache_is_bounded_and_invalidated(G: Graph, monkeypatch):
+    """Test that the iri cache drops least recently used entries and names of removed individuals"""
+    monkeypatch.setattr(owlutils, "MAX_CACHE_SIZE", 2)
+    for name in ["node_a", "node_b", "node_c"]:
+        G.add.causal_node(name)
+        owlutils.get_iri_from_cache_by_entity_name(name, G.store)
+    assert list(G.store.iri_cache) == ["node_b", "node_c"]
+    G.remove.causal_node("node_c")
+    assert "node_c" not in G.store.iri_cache
+    assert owlutils.get_iri_from_cache_by_entity_name("node_c", G.store, suppress_warn=True) is None
+
+def test_schema_names_cached_and_rebuilt_by_import_ontology(G: Graph):
+    """Test that class and property names are kept on the store and rebuilt on import_ontology"""
+    assert owlutils.get_class_names(G.store) == {owl_class.name for owl_class in G.store.classes()}
+    assert owlutils.get_property_names(G.store) == {prop.name for prop in G.store.properties()}
+    assert owlutils.get_class_names(G.store) is G.store.class_names
+    assert owlutils.is_valid_class_type("Pizza", G.store) is False
+    G.import_ontology(str(Path(__file__).absolute().parent.parent / 'testdata' / 'pizza.owl'))
+    assert owlutils.is_valid_class_type("Pizza", G.store) is True
+    assert owlutils.is_valid_individual_name("Pizza", G.store) is False
+    assert owlutils.validate_if_entity_is_property("hasTopping", G.store) is True
+    assert G.add.causal_node("Margherita") is None